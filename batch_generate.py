@@ -0,0 +1,250 @@
+"""
+Generate many plugins from one manifest, loading the template only once.
+
+Running ``cookiecutter`` once per plugin re-reads ``cookiecutter.json`` and the
+user config, writes a replay file and compiles every template file again. This
+script reads the template once per process and shares compiled templates
+between plugins, so each additional plugin only costs its own rendering.
+
+The manifest is a YAML or JSON file with a list of plugin contexts and
+optional defaults shared by all of them:
+
+    defaults:
+      author_name: Jane Doe
+      github_username: my-portal
+    plugins:
+      - plugin_name: Sample Map
+        register_to_models__sample: "yes"
+      - plugin_name: Dataset Export
+        plugin_category: ACTIONS
+
+Usage:
+    python batch_generate.py manifest.yaml [--output-dir DIR] [--workers N] [--overwrite]
+"""
+
+import argparse
+import copy
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import cookiecutter.generate
+import yaml
+from cookiecutter.config import get_user_config
+from cookiecutter.generate import apply_overwrites_to_context, generate_context, generate_files
+from cookiecutter.prompt import prompt_for_config
+from cookiecutter.utils import create_env_with_context
+from jinja2 import BytecodeCache
+
+TEMPLATE_DIR = Path(__file__).parent.resolve()
+
+
+class MemoryBytecodeCache(BytecodeCache):
+    """Keep compiled templates in memory for the lifetime of the process."""
+
+    def __init__(self):
+        self.buckets = {}
+
+    def load_bytecode(self, bucket):
+        if bucket.key in self.buckets:
+            bucket.bytecode_from_string(self.buckets[bucket.key])
+
+    def dump_bytecode(self, bucket):
+        self.buckets[bucket.key] = bucket.bytecode_to_string()
+
+
+# Bytecode cache for the environments created by the current thread, if any
+_active = threading.local()
+_patch_lock = threading.Lock()
+_patch_users = 0
+
+
+def _create_env_with_context(context):
+    """Create the environment of generate_files(), using the cache activated by the current thread."""
+    env = create_env_with_context(context)
+    bytecode_cache = getattr(_active, "bytecode_cache", None)
+    if bytecode_cache is not None:
+        env.bytecode_cache = bytecode_cache
+    return env
+
+
+@contextmanager
+def shared_compiled_templates(bytecode_cache):
+    """
+    Make the cookiecutter Jinja environments created inside the block use ``bytecode_cache``.
+
+    Cookiecutter builds a new environment for each project inside
+    generate_files() and offers no way to pass one in, which would compile
+    every template file again. While the block runs, generate_files() creates
+    its environment through _create_env_with_context(), and the original
+    function is put back when the last block exits. The cache only applies to
+    the thread running the block: environments created elsewhere in the
+    process are untouched. Jinja compares the source checksum before reusing
+    compiled code, so edited templates are always recompiled.
+    """
+    global _patch_users
+    with _patch_lock:
+        if not _patch_users:
+            cookiecutter.generate.create_env_with_context = _create_env_with_context
+        _patch_users += 1
+    previous = getattr(_active, "bytecode_cache", None)
+    _active.bytecode_cache = bytecode_cache
+    try:
+        yield bytecode_cache
+    finally:
+        _active.bytecode_cache = previous
+        with _patch_lock:
+            _patch_users -= 1
+            if not _patch_users:
+                cookiecutter.generate.create_env_with_context = create_env_with_context
+
+
+class TemplateRenderer:
+    """Render projects from a template whose context is loaded only once."""
+
+    def __init__(self, template_dir=TEMPLATE_DIR):
+        self.template_dir = Path(template_dir).resolve()
+        config = get_user_config()
+        self.context = generate_context(
+            context_file=str(self.template_dir / "cookiecutter.json"),
+            default_context=config["default_context"],
+        )
+        self.bytecode_cache = MemoryBytecodeCache()
+
+    def check_options(self, extra_context):
+        """Raise ValueError if ``extra_context`` sets options the template does not have."""
+        unknown = sorted(set(extra_context) - set(self.context["cookiecutter"]))
+        if unknown:
+            raise ValueError(
+                f"Unknown option(s) {', '.join(unknown)}; valid options are listed in "
+                f"{self.template_dir / 'cookiecutter.json'}"
+            )
+
+    def build_context(self, extra_context, output_dir="."):
+        """Return the full rendering context for ``extra_context``, as cookiecutter builds it."""
+        context = copy.deepcopy(self.context)
+        apply_overwrites_to_context(context["cookiecutter"], extra_context)
+        context["_cookiecutter"] = {k: v for k, v in context["cookiecutter"].items() if not k.startswith("_")}
+        context["cookiecutter"].update(prompt_for_config(context, no_input=True))
+        context["cookiecutter"].update(
+            {
+                "_template": str(self.template_dir),
+                "_output_dir": str(Path(output_dir).resolve()),
+                "_repo_dir": str(self.template_dir),
+                "_checkout": None,
+            }
+        )
+        return context
+
+    def render(self, extra_context, output_dir=".", overwrite=False):
+        """
+        Generate one project from ``extra_context`` and return its path.
+
+        Unlike cookiecutter, which ignores options it does not know, unknown
+        options are rejected so that a misspelt manifest entry is not lost.
+        """
+        self.check_options(extra_context)
+        context = self.build_context(extra_context, output_dir)
+        with shared_compiled_templates(self.bytecode_cache):
+            result = generate_files(
+                repo_dir=str(self.template_dir),
+                context=context,
+                output_dir=str(output_dir),
+                overwrite_if_exists=overwrite,
+            )
+        return Path(result)
+
+
+def load_manifest(path):
+    """Return the list of plugin contexts in the manifest at ``path``, with defaults applied."""
+    path = Path(path)
+    text = path.read_text()
+    manifest = (json.loads(text) if path.suffix == ".json" else yaml.safe_load(text)) or {}
+    if isinstance(manifest, list):
+        manifest = {"plugins": manifest}
+
+    defaults = manifest.get("defaults", {})
+    plugins = manifest.get("plugins")
+    if not plugins:
+        raise ValueError(f"{path} does not list any plugins")
+    return [{**defaults, **plugin} for plugin in plugins]
+
+
+@dataclass
+class Result:
+    """Outcome of generating one plugin."""
+
+    name: str
+    path: Path | None = None
+    error: str = ""
+    seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return not self.error
+
+
+_renderer = None
+
+
+def init_worker(template_dir):
+    """Load the template once in a worker process."""
+    global _renderer
+    _renderer = TemplateRenderer(template_dir)
+
+
+def generate(extra_context, output_dir, overwrite):
+    """Generate one plugin with the renderer of the current process."""
+    name = extra_context.get("plugin_name", "?")
+    start = time.perf_counter()
+    try:
+        path = _renderer.render(extra_context, output_dir, overwrite)
+    except Exception as e:
+        return Result(name, error=f"{type(e).__name__}: {e}", seconds=time.perf_counter() - start)
+    return Result(name, path=path, seconds=time.perf_counter() - start)
+
+
+def generate_all(contexts, output_dir=".", workers=1, overwrite=False, template_dir=TEMPLATE_DIR):
+    """Generate every plugin in ``contexts`` and return their results in order."""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if workers <= 1:
+        init_worker(template_dir)
+        return [generate(context, output_dir, overwrite) for context in contexts]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(template_dir,)) as executor:
+        n = len(contexts)
+        return list(executor.map(generate, contexts, [output_dir] * n, [overwrite] * n))
+
+
+def format_summary(results):
+    """Return a per-plugin summary table."""
+    width = max(len(result.name) for result in results)
+    lines = []
+    for result in results:
+        outcome = str(result.path) if result.ok else f"FAILED {result.error}"
+        lines.append(f"{'ok' if result.ok else '!!'}  {result.name:<{width}}  {result.seconds:6.2f}s  {outcome}")
+    failed = sum(not result.ok for result in results)
+    lines.append(f"{len(results) - failed}/{len(results)} plugins generated")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("manifest", help="YAML or JSON manifest of plugin contexts")
+    parser.add_argument("--output-dir", default=".", help="directory the plugins are generated in")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--overwrite", action="store_true", help="overwrite plugins that already exist")
+    args = parser.parse_args(argv)
+
+    results = generate_all(load_manifest(args.manifest), args.output_dir, args.workers, args.overwrite)
+    print(format_summary(results))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Content hashes and git revision of the template and of generated plugins.
+
+Shared by post_gen_project.py, which records them in the manifest of every
+generated plugin, by update_plugins.py, which compares them to find what
+changed, and by the tests. Cookiecutter only runs the hooks named after a
+generation step, so this module is never run as a hook itself.
+"""
+
+import hashlib
+import subprocess
+from pathlib import Path
+
+
+def sha256(data):
+    """Return the hex SHA-256 digest of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def template_revision(template_dir):
+    """
+    Return the git commit ``template_dir`` is checked out at, or None.
+
+    None is also returned when git is not installed, and when ``template_dir``
+    is not the top of its own checkout, since the HEAD of an enclosing
+    repository says nothing about the template.
+    """
+    template_dir = Path(template_dir).resolve()
+
+    def git(*args):
+        command = ["git", "-C", str(template_dir), *args]
+        return subprocess.run(command, capture_output=True, text=True, check=True).stdout.strip()
+
+    try:
+        if Path(git("rev-parse", "--show-toplevel")).resolve() != template_dir:
+            return None
+        return git("rev-parse", "HEAD") or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def project_template_name(template_dir):
+    """Return the name of the directory holding the project template."""
+    return next(path.name for path in Path(template_dir).iterdir() if path.is_dir() and "cookiecutter" in path.name)
+
+
+def template_sources(template_dir):
+    """Return the template files and directories whose contents change what a generated plugin looks like."""
+    template_dir = Path(template_dir)
+    return [template_dir / "cookiecutter.json", template_dir / "hooks", template_dir / project_template_name(template_dir)]
+
+
+def hash_files(root, paths):
+    """Return ``{path relative to root: sha256}`` for every file under ``paths``, skipping ``__pycache__``."""
+    root = Path(root)
+    hashes = {}
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file in files:
+            if file.is_file() and "__pycache__" not in file.parts:
+                hashes[file.relative_to(root).as_posix()] = sha256(file.read_bytes())
+    return hashes
+
+
+def template_hashes(template_dir):
+    """Return ``{path: sha256}`` for the template sources, relative to ``template_dir``."""
+    return hash_files(template_dir, template_sources(template_dir))
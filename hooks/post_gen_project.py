@@ -1,13 +1,211 @@
-"""Post-generation hook to clean up conditional files."""
+"""Post-generation hook: prune, format and record the generated plugin."""
 
+import importlib.util
+import json
 import os
 import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from jinja2 import Environment
+
+PACKAGE_DIR = Path("{{ cookiecutter.plugin_slug }}")
+
+# Files that only belong to a plugin when the matching option is enabled
+CONDITIONAL_FILES = {
+    "use_render_cache": [
+        PACKAGE_DIR / "cache.py",
+        Path("tests") / "test_cache.py",
+    ],
+    "use_deferred_content": [
+        PACKAGE_DIR / "templates" / "{{ cookiecutter.plugin_slug }}" / "{{ cookiecutter.plugin_slug }}_content.html",
+    ],
+    "use_streaming_export": [
+        PACKAGE_DIR / "exports.py",
+        Path("tests") / "test_exports.py",
+    ],
+    "use_background_tasks": [
+        PACKAGE_DIR / "tasks.py",
+        Path("tests") / "test_tasks.py",
+    ],
+    "use_conditional_get": [
+        Path("tests") / "test_conditional.py",
+    ],
+    "use_summary_store": [
+        PACKAGE_DIR / "models.py",
+        PACKAGE_DIR / "summaries.py",
+        PACKAGE_DIR / "migrations",
+        PACKAGE_DIR / "management" / "commands" / "rebuild_{{ cookiecutter.plugin_slug }}_summaries.py",
+        Path("tests") / "test_summaries.py",
+    ],
+    "use_child_listing": [
+        PACKAGE_DIR / "templates" / "{{ cookiecutter.plugin_slug }}" / "{{ cookiecutter.plugin_slug }}_children.html",
+    ],
+    "use_json_api": [
+        PACKAGE_DIR / "api.py",
+        Path("tests") / "test_api.py",
+    ],
+    "use_static_bundle": [
+        PACKAGE_DIR / "assets.py",
+        PACKAGE_DIR / "static",
+        PACKAGE_DIR / "templatetags",
+        Path("tests") / "test_assets.py",
+    ],
+    "use_waffle": [
+        PACKAGE_DIR / "flags.py",
+        Path("tests") / "test_flags.py",
+    ],
+    "keyset_pagination": [
+        PACKAGE_DIR / "pagination.py",
+        Path("tests") / "test_pagination.py",
+    ],
+}
+
+OPTIONS = {
+    "use_render_cache": "{{ cookiecutter.use_render_cache }}",
+    "use_deferred_content": "{{ cookiecutter.use_deferred_content }}",
+    # Streaming exports are only generated for ACTIONS plugins
+    "use_streaming_export": "{{ 'yes' if cookiecutter.use_streaming_export == 'yes' and cookiecutter.plugin_category == 'ACTIONS' else 'no' }}",
+    "use_background_tasks": "{{ cookiecutter.use_background_tasks }}",
+    "use_conditional_get": "{{ cookiecutter.use_conditional_get }}",
+    # The summary store counts the samples and measurements of Projects and Datasets
+    "use_summary_store": "{{ 'yes' if cookiecutter.use_summary_store == 'yes' and 'yes' in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset) else 'no' }}",
+    # Measurements have no child objects to list
+    "use_child_listing": "{{ 'yes' if cookiecutter.use_child_listing == 'yes' and 'yes' in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) else 'no' }}",
+    "use_json_api": "{{ 'yes' if cookiecutter.use_json_api == 'yes' and 'yes' in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) else 'no' }}",
+    "use_static_bundle": "{{ cookiecutter.use_static_bundle }}",
+    "use_waffle": "{{ cookiecutter.use_waffle }}",
+    # Shared by the child listing and the JSON API
+    "keyset_pagination": "{{ 'yes' if 'yes' in (cookiecutter.use_child_listing, cookiecutter.use_json_api) and 'yes' in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) else 'no' }}",
+}
+
+RUN_RUFF = "{{ cookiecutter.use_ruff_format }}" == "yes"
+
+# Directories formatted and linted independently of each other
+FORMAT_TARGETS = [PACKAGE_DIR, Path("tests")]
+
+# Records what the plugin was generated from, for update_plugins.py
+MANIFEST = Path(".template-manifest.json")
+REPO_DIR = Path(r"{{ cookiecutter._repo_dir }}")
+CONTEXT = json.loads(r"""{{ cookiecutter | jsonify }}""")
+
+
+def remove_path(path):
+    """Remove a generated file or directory if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        os.remove(path)
+
+
+def prune():
+    """Remove the files that the selected options do not need."""
+    removed = 0
+    for option, paths in CONDITIONAL_FILES.items():
+        if OPTIONS[option] != "yes":
+            for path in paths:
+                if path.exists():
+                    remove_path(path)
+                    removed += 1
+    return f"removed {removed} unused files"
+
+
+def find_ruff():
+    """Return the command that runs ruff, or None if it is not installed."""
+    if shutil.which("ruff"):
+        return ["ruff"]
+    if importlib.util.find_spec("ruff"):
+        return [sys.executable, "-m", "ruff"]
+    return None
+
+
+def format_target(ruff, target):
+    """Format and lint-fix ``target``, returning the lint problems that remain."""
+    subprocess.run([*ruff, "format", "--quiet", "--no-cache", str(target)], capture_output=True, check=False)
+    result = subprocess.run(
+        [*ruff, "check", "--fix", "--exit-zero", "--quiet", "--no-cache", str(target)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip()
+
+
+def format_code():
+    """Run ruff format and ruff check --fix on the package and the tests in parallel."""
+    if not RUN_RUFF:
+        return "skipped (use_ruff_format is off)"
+    ruff = find_ruff()
+    if ruff is None:
+        return "skipped (ruff is not installed)"
+
+    with ThreadPoolExecutor(max_workers=len(FORMAT_TARGETS)) as executor:
+        reports = [report for report in executor.map(lambda target: format_target(ruff, target), FORMAT_TARGETS) if report]
+    if reports:
+        return "formatted; remaining lint problems:\n" + "\n".join(reports)
+    return f"formatted and linted {len(FORMAT_TARGETS)} directories"
+
+
+def load_manifest_helpers():
+    """Import hooks/manifest.py from the template, which cookiecutter does not put on sys.path."""
+    spec = importlib.util.spec_from_file_location("template_manifest", REPO_DIR / "hooks" / "manifest.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def rendered_files(project_template):
+    """
+    Return the generated files the project template rendered and pruning kept.
+
+    The project directory may hold other files, such as .git or .venv when
+    regenerating with --overwrite-if-exists, which are not the template's to
+    record.
+    """
+    env = Environment()
+    paths = set()
+    for infile in project_template.rglob("*"):
+        if infile.is_file() and "__pycache__" not in infile.parts:
+            path = Path(env.from_string(infile.relative_to(project_template).as_posix()).render(cookiecutter=CONTEXT))
+            if path.is_file():
+                paths.add(path)
+    return sorted(paths)
+
+
+def write_manifest():
+    """Record the template revision, context and file hashes the plugin was generated from."""
+    helpers = load_manifest_helpers()
+    project_template = REPO_DIR / helpers.project_template_name(REPO_DIR)
+    manifest = {
+        "revision": helpers.template_revision(REPO_DIR),
+        "context": {key: value for key, value in CONTEXT.items() if not key.startswith("_")},
+        "templates": helpers.template_hashes(REPO_DIR),
+        "files": helpers.hash_files(Path("."), rendered_files(project_template)),
+    }
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return f"recorded {len(manifest['files'])} files at revision {(manifest['revision'] or 'unknown')[:12]}"
+
+
+STAGES = [
+    ("prune", prune),
+    ("format", format_code),
+    ("manifest", write_manifest),
+]
+
 
 def main():
-    """Clean up files based on cookiecutter configuration."""
-    print("Post-generation cleanup complete!")
+    """Run every post-generation stage and report how long each one took."""
+    started = time.perf_counter()
+    print("Post-generation pipeline:")
+    for name, stage in STAGES:
+        start = time.perf_counter()
+        summary = stage()
+        print(f"  {name:<8} {time.perf_counter() - start:6.2f}s  {summary}")
+
+    print(f"Post-generation complete in {time.perf_counter() - started:.2f}s")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+"""Pre-generation hook to validate the cookiecutter context."""
+
+import sys
+
+REGISTERED_MODELS = {
+    "Project": "{{ cookiecutter.register_to_models__project }}",
+    "Dataset": "{{ cookiecutter.register_to_models__dataset }}",
+    "Sample": "{{ cookiecutter.register_to_models__sample }}",
+    "Measurement": "{{ cookiecutter.register_to_models__measurement }}",
+}
+
+
+def main():
+    """Abort generation if the context cannot produce a working plugin."""
+    if "yes" not in REGISTERED_MODELS.values():
+        print("ERROR: The plugin must be registered to at least one model (Project, Dataset, Sample or Measurement).")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Profile how long each template file takes to render.
+
+Generates one plugin ``--repeat`` times and times every file cookiecutter
+renders. The first run includes compiling each template; later runs reuse the
+compiled templates (see batch_generate.py), so the difference between the cold
+and the warm time is the compile cost. For every file the report also lists
+the size of its output and the number of conditional branches in its source,
+which is usually what makes a template slow to compile.
+
+Usage:
+    python profile_template.py [key=value ...] [--repeat N] [--sort KEY] [--json PATH]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import cookiecutter.generate
+from binaryornot.check import is_binary
+from jinja2 import nodes
+
+from batch_generate import TEMPLATE_DIR, TemplateRenderer
+
+SORT_KEYS = {
+    "cold": lambda profile: profile.cold_ms,
+    "warm": lambda profile: profile.warm_ms,
+    "size": lambda profile: profile.output_bytes,
+    "branches": lambda profile: profile.branches,
+}
+
+
+def count_branches(env, source):
+    """Return the number of ``if``/``elif``/``else`` branches and inline conditionals in ``source``."""
+    tree = env.parse(source)
+    # ``elif`` blocks are nested If nodes, so each If is one branch plus its ``else``
+    statements = sum(1 + bool(node.else_) for node in tree.find_all(nodes.If))
+    expressions = sum(1 + (node.expr2 is not None) for node in tree.find_all(nodes.CondExpr))
+    return statements + expressions
+
+
+@dataclass
+class FileProfile:
+    """Render timings and shape of one template file."""
+
+    path: str
+    branches: int
+    output_bytes: int = 0
+    timings: list[float] = field(default_factory=list)
+
+    @property
+    def cold_ms(self):
+        return self.timings[0] * 1000
+
+    @property
+    def warm_ms(self):
+        return min(self.timings[1:] or self.timings) * 1000
+
+    def as_dict(self):
+        return {
+            "path": self.path,
+            "cold_ms": round(self.cold_ms, 3),
+            "warm_ms": round(self.warm_ms, 3),
+            "output_bytes": self.output_bytes,
+            "branches": self.branches,
+        }
+
+
+class RenderProfiler:
+    """Collect a FileProfile for every file cookiecutter renders while instrumented."""
+
+    def __init__(self):
+        self.files = {}
+        self.runs = []
+
+    def record(self, project_dir, infile, context, env, seconds):
+        profile = self.files.get(infile)
+        if profile is None:
+            # generate_file() runs from inside the template directory
+            branches = 0 if is_binary(infile) else count_branches(env, Path(infile).read_text())
+            profile = self.files[infile] = FileProfile(infile, branches)
+        profile.timings.append(seconds)
+        outfile = Path(project_dir) / env.from_string(infile).render(**context)
+        if outfile.is_file():
+            profile.output_bytes = outfile.stat().st_size
+
+    @contextmanager
+    def instrument(self):
+        """Time every call to cookiecutter's ``generate_file()`` within the block."""
+        original = cookiecutter.generate.generate_file
+
+        def generate_file(project_dir, infile, context, env, *args, **kwargs):
+            start = time.perf_counter()
+            result = original(project_dir, infile, context, env, *args, **kwargs)
+            self.record(project_dir, infile, context, env, time.perf_counter() - start)
+            return result
+
+        cookiecutter.generate.generate_file = generate_file
+        try:
+            yield self
+        finally:
+            cookiecutter.generate.generate_file = original
+
+    def sorted(self, key="cold"):
+        """Return the file profiles, most expensive first."""
+        return sorted(self.files.values(), key=SORT_KEYS[key], reverse=True)
+
+
+def profile_template(extra_context=None, repeat=3, template_dir=TEMPLATE_DIR):
+    """Generate a plugin ``repeat`` times and return the RenderProfiler."""
+    renderer = TemplateRenderer(template_dir)
+    profiler = RenderProfiler()
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix="profile-") as output_dir, profiler.instrument():
+            start = time.perf_counter()
+            renderer.render(extra_context or {}, output_dir)
+            profiler.runs.append(time.perf_counter() - start)
+    return profiler
+
+
+def format_report(profiler, key="cold"):
+    """Return a table of the file profiles sorted by ``key``."""
+    profiles = profiler.sorted(key)
+    width = max(len(profile.path) for profile in profiles)
+    lines = [f"{'template file':<{width}}  {'cold ms':>8}  {'warm ms':>8}  {'bytes':>7}  {'branches':>8}"]
+    for profile in profiles:
+        lines.append(
+            f"{profile.path:<{width}}  {profile.cold_ms:8.2f}  {profile.warm_ms:8.2f}"
+            f"  {profile.output_bytes:7}  {profile.branches:8}"
+        )
+    runs = ", ".join(f"{seconds:.2f}s" for seconds in profiler.runs)
+    lines.append(f"{len(profiles)} files rendered; generation took {runs} (including hooks)")
+    return "\n".join(lines)
+
+
+def to_json(profiler, extra_context=None, key="cold"):
+    """Return the profile as a JSON-serialisable dict."""
+    return {
+        "context": extra_context or {},
+        "runs_seconds": [round(seconds, 4) for seconds in profiler.runs],
+        "sorted_by": key,
+        "files": [profile.as_dict() for profile in profiler.sorted(key)],
+    }
+
+
+def parse_context(pairs):
+    """Return ``{key: value}`` for a list of ``key=value`` arguments."""
+    context = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"expected key=value, got {pair!r}")
+        context[key] = value
+    return context
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("context", nargs="*", help="cookiecutter variables as key=value")
+    parser.add_argument("--repeat", type=int, default=3, help="number of times the plugin is generated")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="cold", help="column the report is sorted by")
+    parser.add_argument("--json", type=Path, help="also write the profile to this JSON file")
+    args = parser.parse_args(argv)
+
+    extra_context = parse_context(args.context)
+    profiler = profile_template(extra_context, repeat=max(args.repeat, 1))
+    print(format_report(profiler, args.sort))
+    if args.json:
+        args.json.write_text(json.dumps(to_json(profiler, extra_context, args.sort), indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,27 @@
 """Pytest configuration and fixtures for cookiecutter template tests."""
 
+import json
 import shutil
+import stat
 from pathlib import Path
 
 import pytest
 from cookiecutter.main import cookiecutter
 
+from file_index import FileIndex
+from hooks.manifest import sha256, template_hashes
+from option_matrix import MODES
+
+
+def pytest_addoption(parser):
+    """Add --option-matrix, which selects how many option combinations are rendered."""
+    parser.addoption(
+        "--option-matrix",
+        choices=MODES,
+        default="pairwise",
+        help="option combinations to render in test_option_matrix.py (default: pairwise)",
+    )
+
 
 @pytest.fixture
 def default_context():
@@ -27,6 +43,17 @@ def default_context():
         "register_to_models__measurement": "no",
         "plugin_category": "EXPLORE",
         "icon_name": "puzzle-piece",
+        "use_render_cache": "no",
+        "use_deferred_content": "no",
+        "use_streaming_export": "no",
+        "use_background_tasks": "no",
+        "use_conditional_get": "no",
+        "use_summary_store": "no",
+        "use_child_listing": "no",
+        "use_json_api": "no",
+        "use_static_bundle": "no",
+        "use_waffle": "no",
+        "use_ruff_format": "no",
     }
 
 
@@ -50,6 +77,17 @@ def minimal_context():
         "register_to_models__measurement": "no",
         "plugin_category": "ACTIONS",
         "icon_name": "cog",
+        "use_render_cache": "no",
+        "use_deferred_content": "no",
+        "use_streaming_export": "no",
+        "use_background_tasks": "no",
+        "use_conditional_get": "no",
+        "use_summary_store": "no",
+        "use_child_listing": "no",
+        "use_json_api": "no",
+        "use_static_bundle": "no",
+        "use_waffle": "no",
+        "use_ruff_format": "no",
     }
 
 
@@ -73,73 +111,125 @@ def full_features_context():
         "register_to_models__measurement": "yes",
         "plugin_category": "MANAGEMENT",
         "icon_name": "shield",
+        "use_render_cache": "yes",
+        "use_deferred_content": "yes",
+        "use_streaming_export": "yes",
+        "use_background_tasks": "yes",
+        "use_conditional_get": "yes",
+        "use_summary_store": "yes",
+        "use_child_listing": "yes",
+        "use_json_api": "yes",
+        "use_static_bundle": "yes",
+        "use_waffle": "yes",
+        "use_ruff_format": "no",
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template_dir():
     """Return the path to the cookiecutter template directory."""
     return Path(__file__).parent.parent.resolve()
 
 
+def hash_template(template_dir):
+    """Return a hash of the paths and contents of every template source file."""
+    return sha256(json.dumps(template_hashes(template_dir), sort_keys=True).encode())
+
+
+class ProjectCache:
+    """
+    Generate each distinct project once per test session.
+
+    Projects are keyed by a hash of the context and of the template sources, so
+    a cached tree always matches the template it was rendered from. Cached
+    projects are shared between tests and their files are made read-only; use
+    ``copy()`` for a private, writable copy.
+    """
+
+    def __init__(self, template_dir, cache_dir):
+        self.template_dir = template_dir
+        self.cache_dir = cache_dir
+        self.template_hash = hash_template(template_dir)
+        self.projects = {}
+
+    def key(self, context):
+        """Return the cache key for ``context``."""
+        payload = json.dumps(context, sort_keys=True) + self.template_hash
+        return sha256(payload.encode())[:16]
+
+    def get(self, context):
+        """Return the shared, read-only project generated from ``context``."""
+        key = self.key(context)
+        if key not in self.projects:
+            output_dir = self.cache_dir / key
+            output_dir.mkdir()
+            result = cookiecutter(
+                str(self.template_dir),
+                no_input=True,
+                extra_context=context,
+                output_dir=str(output_dir),
+            )
+            project_dir = Path(result)
+            for file in project_dir.rglob("*"):
+                if file.is_file():
+                    file.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            self.projects[key] = project_dir
+        return self.projects[key]
+
+    def copy(self, context, destination):
+        """Return a writable copy of the project generated from ``context``."""
+        project_dir = self.get(context)
+        target = destination / project_dir.name
+        # copyfile does not copy permissions, so the copy is writable
+        shutil.copytree(project_dir, target, copy_function=shutil.copyfile)
+        return target
+
+
+@pytest.fixture(scope="session")
+def project_cache(tmp_path_factory, template_dir):
+    """Provide the session-wide cache of generated projects."""
+    return ProjectCache(template_dir, tmp_path_factory.mktemp("generated"))
+
+
+@pytest.fixture(scope="session")
+def file_index():
+    """Provide the session-wide index of generated files (see file_index.py)."""
+    return FileIndex()
+
+
 @pytest.fixture
-def generated_project(tmp_path, template_dir, default_context):
-    """Generate a project using the cookiecutter template and return its path."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-
-    result = cookiecutter(
-        str(template_dir),
-        no_input=True,
-        extra_context=default_context,
-        output_dir=str(output_dir),
-    )
+def generated_project(project_cache, default_context):
+    """Return the path of a (read-only) project generated from the default context."""
+    return project_cache.get(default_context)
 
-    project_dir = Path(result)
-    yield project_dir
 
-    # Cleanup
-    if project_dir.exists():
-        shutil.rmtree(project_dir)
+@pytest.fixture
+def minimal_project(project_cache, minimal_context):
+    """Return the path of a (read-only) minimal project."""
+    return project_cache.get(minimal_context)
 
 
 @pytest.fixture
-def minimal_project(tmp_path, template_dir, minimal_context):
-    """Generate a minimal project and return its path."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-
-    result = cookiecutter(
-        str(template_dir),
-        no_input=True,
-        extra_context=minimal_context,
-        output_dir=str(output_dir),
-    )
+def full_features_project(project_cache, full_features_context):
+    """Return the path of a (read-only) project with all features."""
+    return project_cache.get(full_features_context)
 
-    project_dir = Path(result)
-    yield project_dir
 
-    # Cleanup
-    if project_dir.exists():
-        shutil.rmtree(project_dir)
+@pytest.fixture
+def make_project(project_cache, default_context):
+    """Return a function that generates a project from the default context plus overrides."""
+
+    def make(**overrides):
+        return project_cache.get({**default_context, **overrides})
+
+    return make
 
 
 @pytest.fixture
-def full_features_project(tmp_path, template_dir, full_features_context):
-    """Generate a project with all features and return its path."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-
-    result = cookiecutter(
-        str(template_dir),
-        no_input=True,
-        extra_context=full_features_context,
-        output_dir=str(output_dir),
-    )
+def writable_project(tmp_path, project_cache, default_context):
+    """Return a function that makes a private, writable copy of a generated project."""
 
-    project_dir = Path(result)
-    yield project_dir
+    def make(**overrides):
+        return project_cache.copy({**default_context, **overrides}, tmp_path)
 
-    # Cleanup
-    if project_dir.exists():
-        shutil.rmtree(project_dir)
+    return make
@@ -0,0 +1,156 @@
+"""
+Session-wide index of generated files, read and parsed once.
+
+Projects from the session cache are read-only (see conftest.py), so a file's
+text and syntax tree cannot change during a test run. ``FileIndex`` reads each
+file once, parses each Python module once and exposes the structure the tests
+check: classes with their bases, decorators, methods and attributes, imports,
+module-level assignments and Jinja syntax left over after rendering.
+
+Do not index files of a ``writable_project`` that the test goes on to modify.
+"""
+
+import ast
+import re
+from functools import cached_property
+from pathlib import Path
+
+# Cookiecutter variables and Jinja-only syntax that Django templates do not support
+JINJA_LEFTOVER = re.compile(r"cookiecutter\.|\{%-|-%\}|\{%-?\s*(?:end)?raw\s*-?%\}")
+
+
+def qualified_imports(nodes):
+    """Return ``{local name: qualified name}`` for the import statements in ``nodes``."""
+    imports = {}
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports[alias.asname or alias.name.partition(".")[0]] = alias.name
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            separator = "." if node.module else ""
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"{module}{separator}{alias.name}"
+    return imports
+
+
+class ClassInfo:
+    """Structure of one class definition."""
+
+    def __init__(self, node):
+        self.node = node
+        self.name = node.name
+
+    @cached_property
+    def bases(self):
+        return [ast.unparse(base) for base in self.node.bases]
+
+    @cached_property
+    def decorators(self):
+        return [ast.unparse(decorator) for decorator in self.node.decorator_list]
+
+    @cached_property
+    def methods(self):
+        return {
+            node.name: node
+            for node in self.node.body
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+        }
+
+    @cached_property
+    def attributes(self):
+        """Return ``{name: value node}`` for the class-level assignments."""
+        attributes = {}
+        for node in self.node.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                attributes[node.targets[0].id] = node.value
+            elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+                attributes[node.target.id] = node.value
+        return attributes
+
+    def literal(self, name):
+        """Return the literal value of the class attribute ``name``."""
+        return ast.literal_eval(self.attributes[name])
+
+    def decorator_calls(self, name):
+        """Return the decorator calls whose callable is spelled ``name``."""
+        return [
+            decorator
+            for decorator in self.node.decorator_list
+            if isinstance(decorator, ast.Call) and ast.unparse(decorator.func) == name
+        ]
+
+    def method_source(self, name):
+        """Return the source of method ``name``."""
+        return ast.unparse(self.methods[name])
+
+
+class ModuleIndex:
+    """Structure of one parsed Python module."""
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        self.tree = ast.parse(source, filename=str(path))
+
+    @cached_property
+    def classes(self):
+        """Return every class in the module by name, including nested ones."""
+        return {node.name: ClassInfo(node) for node in ast.walk(self.tree) if isinstance(node, ast.ClassDef)}
+
+    @cached_property
+    def functions(self):
+        """Return the names of every function and method defined in the module."""
+        return {
+            node.name for node in ast.walk(self.tree) if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+        }
+
+    @cached_property
+    def imports(self):
+        """Return the module-level imports as ``{local name: qualified name}``."""
+        return qualified_imports(self.tree.body)
+
+    @cached_property
+    def local_imports(self):
+        """Return the imports made inside functions, e.g. to defer loading a module."""
+        functions = [node for node in ast.walk(self.tree) if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)]
+        return qualified_imports(child for function in functions for child in ast.walk(function))
+
+    @cached_property
+    def assignments(self):
+        """Return ``{name: value node}`` for the module-level assignments."""
+        return ClassInfo(ast.ClassDef(name="<module>", body=self.tree.body, bases=[], decorator_list=[])).attributes
+
+    def literal(self, name):
+        """Return the literal value of the module-level assignment ``name``."""
+        return ast.literal_eval(self.assignments[name])
+
+
+class FileIndex:
+    """Read and parse each generated file at most once per session."""
+
+    def __init__(self):
+        self.texts = {}
+        self.modules = {}
+
+    def text(self, path):
+        """Return the contents of ``path``."""
+        path = Path(path).resolve()
+        if path not in self.texts:
+            self.texts[path] = path.read_text()
+        return self.texts[path]
+
+    def module(self, path):
+        """Return the ModuleIndex of the Python file at ``path``; raises SyntaxError if invalid."""
+        path = Path(path).resolve()
+        if path not in self.modules:
+            self.modules[path] = ModuleIndex(path, self.text(path))
+        return self.modules[path]
+
+    def jinja_leftovers(self, path):
+        """Return ``(line number, line)`` for every line of ``path`` with unrendered Jinja."""
+        return [
+            (number, line.strip())
+            for number, line in enumerate(self.text(path).splitlines(), start=1)
+            if JINJA_LEFTOVER.search(line)
+        ]
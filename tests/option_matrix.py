@@ -0,0 +1,252 @@
+"""
+Render and validate combinations of the template's choice variables.
+
+The matrix is built from the list-valued variables in ``cookiecutter.json``.
+Every ``use_*`` toggle doubles the number of combinations, so by default the
+matrix is a pairwise covering array: every value of every variable is rendered
+together with every value of every other variable at least once, in a few
+dozen contexts. Most template bugs involve one or two options, so this is
+cheap enough to run on every commit.
+
+Two slower matrices are available:
+
+- ``--toggles`` renders every combination of the ``use_*`` feature toggles and
+  every combination of the other choices, cycling the shorter list.
+- ``--exhaustive`` renders the full product of every choice.
+
+Every combination is rendered in a process pool, with the template loaded once
+per worker. Each output is checked by
+compiling every generated ``.py`` file and validating the ``@plugins.register``
+argument list in ``plugins.py``.
+
+Usage:
+    python -m tests.option_matrix [--toggles | --exhaustive] [--workers N]
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import logging
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from batch_generate import TemplateRenderer
+from cookiecutter.exceptions import FailedHookException
+
+TEMPLATE_DIR = Path(__file__).parent.parent.resolve()
+
+MODES = ("pairwise", "toggles", "exhaustive")
+
+MODEL_OPTIONS = {
+    "register_to_models__project": "Project",
+    "register_to_models__dataset": "Dataset",
+    "register_to_models__sample": "Sample",
+    "register_to_models__measurement": "Measurement",
+}
+
+
+def load_choices(template_dir=TEMPLATE_DIR):
+    """Return ``{variable: choices}`` for every choice variable in cookiecutter.json."""
+    context = json.loads((template_dir / "cookiecutter.json").read_text())
+    return {
+        name: value for name, value in context.items() if isinstance(value, list) and not name.startswith("_")
+    }
+
+
+def product(choices):
+    """Return a list of contexts covering every combination of ``choices``."""
+    names = list(choices)
+    return [dict(zip(names, values, strict=True)) for values in itertools.product(*choices.values())]
+
+
+def covering_array(choices, strength=2, feasible=lambda context: True):
+    """
+    Return contexts covering every combination of values of any ``strength`` variables.
+
+    Each context is built greedily: it starts from the first combination that
+    is not covered yet, then gives every other variable the value that covers
+    the most remaining combinations (the first such value on ties, so the
+    result is deterministic). ``feasible`` is called with partial contexts and
+    returns False for those that cannot be completed into a valid one; such
+    values are never chosen.
+    """
+    names = list(choices)
+    order = {name: index for index, name in enumerate(names)}
+
+    def combination(items):
+        return tuple(sorted(items, key=lambda item: order[item[0]]))
+
+    uncovered = {
+        combination(zip(subset, values, strict=True))
+        for subset in itertools.combinations(names, strength)
+        for values in itertools.product(*(choices[name] for name in subset))
+        if feasible(dict(zip(subset, values, strict=True)))
+    }
+    contexts = []
+    while uncovered:
+        context = dict(min(uncovered))
+        for name in names:
+            if name in context:
+                continue
+            partners = list(itertools.combinations(context.items(), strength - 1))
+            values = [value for value in choices[name] if feasible({**context, name: value})]
+            gains = [sum(combination((*partner, (name, value))) in uncovered for partner in partners) for value in values]
+            context[name] = values[gains.index(max(gains))]
+        context = {name: context[name] for name in names}
+        uncovered -= {combination(items) for items in itertools.combinations(context.items(), strength)}
+        contexts.append(context)
+    return contexts
+
+
+def build_matrix(mode="pairwise", template_dir=TEMPLATE_DIR):
+    """Return the list of contexts to render in ``mode``, one of MODES."""
+    choices = load_choices(template_dir)
+    if mode == "pairwise":
+        contexts = covering_array(choices, feasible=has_models)
+        # Plugins without models are rejected, so they are checked once on their own
+        return [*contexts, {**contexts[0], **dict.fromkeys(MODEL_OPTIONS, "no")}]
+    if mode == "exhaustive":
+        return product(choices)
+    if mode != "toggles":
+        raise ValueError(f"Unknown matrix mode {mode!r}, expected one of: {', '.join(MODES)}.")
+
+    toggles = {name: values for name, values in choices.items() if name.startswith("use_")}
+    base = product({name: values for name, values in choices.items() if name not in toggles})
+    toggle_contexts = product(toggles) or [{}]
+    # Cycle the shorter list, so both are covered in full
+    size = max(len(base), len(toggle_contexts))
+    return [{**base[i % len(base)], **toggle_contexts[i % len(toggle_contexts)]} for i in range(size)]
+
+
+def has_models(context):
+    """Return True unless ``context`` leaves every model option unset or "no"."""
+    return any(context.get(option, "yes") == "yes" for option in MODEL_OPTIONS)
+
+
+def registered_models(context):
+    """Return the model class names ``context`` registers the plugin to, in order."""
+    return [model for option, model in MODEL_OPTIONS.items() if context.get(option) == "yes"]
+
+
+def check_register_call(source, expected_models):
+    """Return a list of problems with the ``@plugins.register(...)`` decorator in ``source``."""
+    tree = ast.parse(source)
+    imported = {alias.asname or alias.name for node in ast.walk(tree) if isinstance(node, ast.ImportFrom) for alias in node.names}
+    calls = [
+        decorator
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ClassDef)
+        for decorator in node.decorator_list
+        if isinstance(decorator, ast.Call) and ast.unparse(decorator.func) == "plugins.register"
+    ]
+    if len(calls) != 1:
+        return [f"expected one @plugins.register decorator, found {len(calls)}"]
+
+    call = calls[0]
+    problems = []
+    if call.keywords:
+        problems.append("@plugins.register takes no keyword arguments")
+    names = [arg.id if isinstance(arg, ast.Name) else ast.unparse(arg) for arg in call.args]
+    if names != expected_models:
+        problems.append(f"@plugins.register({', '.join(names)}) should be @plugins.register({', '.join(expected_models)})")
+    for name in names:
+        if name not in imported:
+            problems.append(f"{name} is registered but never imported")
+    return problems
+
+
+def validate_project(project_dir, context):
+    """Return a list of problems found in a generated project."""
+    problems = []
+    compiled = set()
+    for path in sorted(project_dir.rglob("*.py")):
+        relative = path.relative_to(project_dir)
+        source = path.read_text()
+        if "cookiecutter." in source:
+            problems.append(f"{relative}: unrendered template variable")
+        try:
+            compile(source, str(relative), "exec")
+        except SyntaxError as e:
+            problems.append(f"{relative}:{e.lineno}: {e.msg}")
+        else:
+            compiled.add(path)
+
+    plugins_file = next(project_dir.glob("*/plugins.py"), None)
+    if plugins_file is None:
+        problems.append("plugins.py was not generated")
+    elif plugins_file in compiled:
+        for problem in check_register_call(plugins_file.read_text(), registered_models(context)):
+            problems.append(f"plugins.py: {problem}")
+    return problems
+
+
+def render_and_validate(context):
+    """Render ``context`` into a temporary directory and return ``(context, problems)``."""
+    output_dir = Path(tempfile.mkdtemp(prefix="matrix-"))
+    try:
+        try:
+            project_dir = _renderer.render(context, output_dir)
+        except FailedHookException as e:
+            if not registered_models(context):
+                # Rejecting a plugin without models is the expected outcome
+                return context, []
+            return context, [f"generation failed: {e}"]
+
+        if not registered_models(context):
+            return context, ["generation should fail when no model is registered"]
+        return context, validate_project(project_dir, context)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+_renderer = None
+
+
+def init_worker():
+    """Load the template once per worker process (see batch_generate.py)."""
+    global _renderer
+    _renderer = TemplateRenderer(TEMPLATE_DIR)
+    # Rejected contexts are expected; failures are reported by run_matrix()
+    logging.getLogger("cookiecutter").setLevel(logging.CRITICAL)
+
+
+def run_matrix(contexts, workers=None):
+    """Render and validate ``contexts`` in a process pool, returning the failing ones."""
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        results = executor.map(render_and_validate, contexts, chunksize=4)
+        return [(context, problems) for context, problems in results if problems]
+
+
+def format_failure(context, problems):
+    """Return a readable report for one failing context."""
+    options = ", ".join(f"{name}={value}" for name, value in context.items())
+    return "\n".join([options, *(f"  - {problem}" for problem in problems)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--toggles", dest="mode", action="store_const", const="toggles", help="render every combination of the use_* toggles"
+    )
+    mode.add_argument(
+        "--exhaustive", dest="mode", action="store_const", const="exhaustive", help="render the full product of every choice"
+    )
+    parser.set_defaults(mode="pairwise")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    contexts = build_matrix(args.mode)
+    failures = run_matrix(contexts, workers=args.workers)
+    for context, problems in failures:
+        print(format_failure(context, problems), end="\n\n")
+    print(f"{len(contexts) - len(failures)}/{len(contexts)} combinations passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Test batch generation of plugins from a manifest."""
+
+import json
+import threading
+
+import cookiecutter.generate
+import cookiecutter.utils
+import pytest
+
+import batch_generate
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """Write a YAML manifest with shared defaults and three plugins."""
+    path = tmp_path / "manifest.yaml"
+    path.write_text(
+        "defaults:\n"
+        "  author_name: Batch Author\n"
+        "  github_username: batch\n"
+        "plugins:\n"
+        "  - plugin_name: Sample Map\n"
+        "  - plugin_name: Dataset Export\n"
+        "    plugin_category: ACTIONS\n"
+        "  - plugin_name: Project Audit\n"
+        "    plugin_category: MANAGEMENT\n"
+        "    use_render_cache: 'yes'\n"
+    )
+    return path
+
+
+class TestManifest:
+    """Test loading manifests."""
+
+    def test_yaml_manifest_applies_defaults(self, manifest):
+        """Test that defaults are merged into every plugin context."""
+        contexts = batch_generate.load_manifest(manifest)
+        
+        assert [context["plugin_name"] for context in contexts] == ["Sample Map", "Dataset Export", "Project Audit"]
+        assert all(context["author_name"] == "Batch Author" for context in contexts)
+        assert contexts[1]["plugin_category"] == "ACTIONS"
+
+    def test_json_list_manifest(self, tmp_path):
+        """Test that a JSON manifest may be a plain list of contexts."""
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps([{"plugin_name": "One"}, {"plugin_name": "Two"}]))
+        
+        assert batch_generate.load_manifest(path) == [{"plugin_name": "One"}, {"plugin_name": "Two"}]
+
+    def test_empty_manifest_is_rejected(self, tmp_path):
+        """Test that a manifest without plugins raises an error."""
+        path = tmp_path / "manifest.yaml"
+        path.write_text("defaults:\n  author_name: Nobody\n")
+        
+        with pytest.raises(ValueError):
+            batch_generate.load_manifest(path)
+
+    def test_blank_yaml_manifest_is_rejected(self, tmp_path):
+        """Test that an empty YAML file is reported as listing no plugins."""
+        path = tmp_path / "manifest.yaml"
+        path.write_text("")
+        
+        with pytest.raises(ValueError, match="does not list any plugins"):
+            batch_generate.load_manifest(path)
+
+
+class TestBatchGeneration:
+    """Test generating several plugins in one process."""
+
+    def test_generates_every_plugin(self, manifest, tmp_path):
+        """Test that every plugin in the manifest is generated."""
+        results = batch_generate.generate_all(batch_generate.load_manifest(manifest), tmp_path / "out")
+        
+        assert all(result.ok for result in results)
+        assert [result.path.name for result in results] == ["sample_map", "dataset_export", "project_audit"]
+        assert (tmp_path / "out" / "project_audit" / "project_audit" / "cache.py").exists()
+        assert not (tmp_path / "out" / "sample_map" / "sample_map" / "cache.py").exists()
+
+    def test_output_matches_cookiecutter(self, tmp_path, project_cache, default_context):
+        """Test that batch output is identical to a regular cookiecutter run."""
+        [result] = batch_generate.generate_all([default_context], tmp_path)
+        expected = project_cache.get(default_context)
+        
+        generated = sorted(p.relative_to(result.path) for p in result.path.rglob("*") if p.is_file())
+        assert generated == sorted(p.relative_to(expected) for p in expected.rglob("*") if p.is_file())
+        for path in generated:
+            assert (result.path / path).read_bytes() == (expected / path).read_bytes(), path
+
+    def test_template_context_loaded_once(self, manifest, tmp_path, monkeypatch):
+        """Test that cookiecutter.json is read once however many plugins are generated."""
+        calls = []
+        generate_context = batch_generate.generate_context
+
+        def counting_generate_context(**kwargs):
+            calls.append(kwargs)
+            return generate_context(**kwargs)
+
+        monkeypatch.setattr(batch_generate, "generate_context", counting_generate_context)
+        batch_generate.generate_all(batch_generate.load_manifest(manifest), tmp_path)
+        
+        assert len(calls) == 1
+
+    def test_failure_is_reported_per_plugin(self, tmp_path):
+        """Test that one invalid context does not stop the others."""
+        contexts = [{"plugin_name": "Good One"}, {"plugin_name": "Bad One", "plugin_category": "UNKNOWN"}]
+        results = batch_generate.generate_all(contexts, tmp_path)
+        
+        assert results[0].ok
+        assert not results[1].ok
+        assert "UNKNOWN" in results[1].error
+
+    def test_unknown_option_is_reported(self, tmp_path):
+        """Test that a misspelt option fails its plugin instead of being ignored."""
+        contexts = [{"plugin_name": "Typo", "use_render_cahce": "yes"}]
+        [result] = batch_generate.generate_all(contexts, tmp_path)
+        
+        assert not result.ok
+        assert "Unknown option(s) use_render_cahce" in result.error
+        assert not (tmp_path / "typo").exists()
+
+    def test_compiled_templates_shared_between_plugins(self, manifest, tmp_path):
+        """Test that later plugins reuse the templates compiled for the first one."""
+        renderer = batch_generate.TemplateRenderer()
+        renderer.render({"plugin_name": "First"}, tmp_path)
+        compiled = dict(renderer.bytecode_cache.buckets)
+        renderer.render({"plugin_name": "Second"}, tmp_path)
+        
+        assert compiled
+        assert renderer.bytecode_cache.buckets == compiled
+
+    def test_cache_scoped_to_rendering_thread(self, tmp_path):
+        """Test that environments created outside render(), or in other threads, get no shared cache."""
+        bytecode_cache = batch_generate.MemoryBytecodeCache()
+        seen = []
+        with batch_generate.shared_compiled_templates(bytecode_cache):
+            assert cookiecutter.generate.create_env_with_context({}).bytecode_cache is bytecode_cache
+            thread = threading.Thread(
+                target=lambda: seen.append(cookiecutter.generate.create_env_with_context({}).bytecode_cache)
+            )
+            thread.start()
+            thread.join()
+        
+        assert seen == [None]
+        assert cookiecutter.generate.create_env_with_context({}).bytecode_cache is None
+
+    def test_cookiecutter_restored_after_rendering(self, tmp_path):
+        """Test that cookiecutter creates its environments unchanged once the block exits, even on error."""
+        with pytest.raises(RuntimeError):
+            with batch_generate.shared_compiled_templates(batch_generate.MemoryBytecodeCache()):
+                with batch_generate.shared_compiled_templates(batch_generate.MemoryBytecodeCache()):
+                    pass
+                assert cookiecutter.generate.create_env_with_context is not cookiecutter.utils.create_env_with_context
+                raise RuntimeError
+        
+        assert cookiecutter.generate.create_env_with_context is cookiecutter.utils.create_env_with_context
+
+    def test_parallel_generation(self, manifest, tmp_path):
+        """Test that plugins can be generated in a process pool."""
+        results = batch_generate.generate_all(batch_generate.load_manifest(manifest), tmp_path, workers=2)
+        
+        assert all(result.ok for result in results)
+        assert all(result.path.exists() for result in results)
+
+    def test_main_prints_summary(self, manifest, tmp_path, capsys):
+        """Test that the command line entry point prints a per-plugin summary."""
+        exit_code = batch_generate.main([str(manifest), "--output-dir", str(tmp_path)])
+        
+        output = capsys.readouterr().out
+        assert exit_code == 0
+        assert "Dataset Export" in output
+        assert "3/3 plugins generated" in output
@@ -1,6 +1,5 @@
 """Test that generated file contents are correct."""
 
-import ast
 import json5
 import tomllib
 
@@ -10,66 +9,64 @@ import pytest
 class TestPythonFiles:
     """Test that Python files have correct content and are valid."""
 
-    def test_plugins_file_is_valid_python(self, generated_project):
+    def test_plugins_file_is_valid_python(self, file_index, generated_project):
         """Test that plugins.py is valid Python code."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
         
         # Should be valid Python
         try:
-            ast.parse(content)
+            file_index.module(plugins_file)
         except SyntaxError as e:
             pytest.fail(f"plugins.py has invalid Python syntax: {e}")
 
-    def test_plugins_file_has_correct_template_name(self, generated_project):
+    def test_plugins_file_has_correct_template_name(self, file_index, generated_project):
         """Test that plugins.py references the correctly named template."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         # Should reference test_plugin/test_plugin.html, not plugin.html
         assert 'template_name = "test_plugin/test_plugin.html"' in content
         assert 'template_name = "test_plugin/plugin.html"' not in content
 
-    def test_plugins_file_has_correct_registration(self, generated_project):
+    def test_plugins_file_has_correct_registration(self, file_index, generated_project):
         """Test that @plugins.register decorator has correct models."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         # Default context has project and dataset
         assert "@plugins.register" in content
         assert "Project" in content
         assert "Dataset" in content
 
-    def test_apps_file_is_valid_python(self, generated_project):
+    def test_apps_file_is_valid_python(self, file_index, generated_project):
         """Test that apps.py is valid Python code."""
         apps_file = generated_project / "test_plugin" / "apps.py"
-        content = apps_file.read_text()
         
         try:
-            ast.parse(content)
+            file_index.module(apps_file)
         except SyntaxError as e:
             pytest.fail(f"apps.py has invalid Python syntax: {e}")
 
-    def test_apps_file_imports_plugins(self, generated_project):
+    def test_apps_file_imports_plugins(self, file_index, generated_project):
         """Test that apps.py imports plugins in ready() method."""
         apps_file = generated_project / "test_plugin" / "apps.py"
-        content = apps_file.read_text()
+        content = file_index.text(apps_file)
         
         assert "def ready(self):" in content
         assert "from . import plugins" in content
 
-    def test_init_file_has_version(self, generated_project):
+    def test_init_file_has_version(self, file_index, generated_project):
         """Test that __init__.py defines __version__."""
         init_file = generated_project / "test_plugin" / "__init__.py"
-        content = init_file.read_text()
+        content = file_index.text(init_file)
         
         assert '__version__' in content
         assert '0.1.0' in content
 
-    def test_conftest_has_fixtures(self, generated_project):
+    def test_conftest_has_fixtures(self, file_index, generated_project):
         """Test that tests/conftest.py has the expected fixtures."""
         conftest_file = generated_project / "tests" / "conftest.py"
-        content = conftest_file.read_text()
+        content = file_index.text(conftest_file)
         
         # Should have fixtures for FairDM models
         assert "def project(" in content
@@ -78,28 +75,42 @@ class TestPythonFiles:
         assert "def measurement(" in content
 
 
+    @pytest.mark.parametrize("project", ["generated_project", "full_features_project"])
+    def test_no_jinja_left_over(self, file_index, request, project):
+        """Test that no file contains unrendered cookiecutter variables or Jinja-only syntax."""
+        project_dir = request.getfixturevalue(project)
+        # The template manifest lists template paths, which are Jinja by design
+        leftovers = {
+            str(path.relative_to(project_dir)): file_index.jinja_leftovers(path)
+            for path in project_dir.rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts and path.name != ".template-manifest.json"
+        }
+        
+        assert not {path: lines for path, lines in leftovers.items() if lines}
+
+
 class TestTemplateFiles:
     """Test that template files are correct."""
 
-    def test_main_template_extends_fairdm_plugin(self, generated_project):
+    def test_main_template_extends_fairdm_plugin(self, file_index, generated_project):
         """Test that the main template extends fairdm/plugin.html."""
         template_file = generated_project / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
-        content = template_file.read_text()
+        content = file_index.text(template_file)
         
         assert '{% extends "fairdm/plugin.html" %}' in content
 
-    def test_main_template_has_plugin_block(self, generated_project):
+    def test_main_template_has_plugin_block(self, file_index, generated_project):
         """Test that the main template defines the plugin block."""
         template_file = generated_project / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
-        content = template_file.read_text()
+        content = file_index.text(template_file)
         
         assert '{% block plugin %}' in content
         assert '{% endblock %}' in content
 
-    def test_main_template_mentions_base_object(self, generated_project):
+    def test_main_template_mentions_base_object(self, file_index, generated_project):
         """Test that the template references base_object."""
         template_file = generated_project / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
-        content = template_file.read_text()
+        content = file_index.text(template_file)
         
         assert 'base_object' in content
 
@@ -180,10 +191,10 @@ class TestConfigurationFiles:
         assert "charliermarsh.ruff" in recommendations
         assert "batisteo.vscode-django" in recommendations
 
-    def test_gitignore_excludes_common_files(self, generated_project):
+    def test_gitignore_excludes_common_files(self, file_index, generated_project):
         """Test that .gitignore excludes common Python/Django files."""
         gitignore_file = generated_project / ".gitignore"
-        content = gitignore_file.read_text()
+        content = file_index.text(gitignore_file)
         
         assert "__pycache__" in content
         assert "*.py[cod]" in content
@@ -209,34 +220,34 @@ class TestConfigurationFiles:
 class TestDocumentation:
     """Test that documentation files are properly generated."""
 
-    def test_readme_has_plugin_name(self, generated_project):
+    def test_readme_has_plugin_name(self, file_index, generated_project):
         """Test that README.md contains the plugin name."""
         readme_file = generated_project / "README.md"
-        content = readme_file.read_text()
+        content = file_index.text(readme_file)
         
         assert "Test Plugin" in content
 
-    def test_readme_has_installation_instructions(self, generated_project):
+    def test_readme_has_installation_instructions(self, file_index, generated_project):
         """Test that README.md has installation instructions."""
         readme_file = generated_project / "README.md"
-        content = readme_file.read_text()
+        content = file_index.text(readme_file)
         
         assert "Installation" in content
         assert "poetry add" in content or "fairdm.setup" in content
 
-    def test_contributing_has_guidelines(self, generated_project):
+    def test_contributing_has_guidelines(self, file_index, generated_project):
         """Test that CONTRIBUTING.md exists and has content."""
         contributing_file = generated_project / "CONTRIBUTING.md"
-        content = contributing_file.read_text()
+        content = file_index.text(contributing_file)
         
         assert "Contributing" in content or "contribute" in content.lower()
 
-    def test_changelog_exists(self, generated_project):
+    def test_changelog_exists(self, file_index, generated_project):
         """Test that CHANGELOG.md exists."""
         changelog_file = generated_project / "CHANGELOG.md"
         assert changelog_file.exists()
         
-        content = changelog_file.read_text()
+        content = file_index.text(changelog_file)
         assert "0.1.0" in content
 
 
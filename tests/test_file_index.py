@@ -0,0 +1,94 @@
+"""Test the shared index of generated files."""
+
+import pytest
+
+from file_index import FileIndex
+
+MODULE = '''\
+import os.path
+from fairdm import plugins
+from fairdm.core.project.models import Project as ProjectModel
+from . import conf
+
+LIMIT = 10
+
+
+@plugins.register(ProjectModel)
+class Example(plugins.FairDMPlugin):
+    title = "Example"
+    sizes: list = [1, 2]
+
+    def export(self):
+        from . import exports
+
+        return exports
+'''
+
+
+@pytest.fixture
+def module_file(tmp_path):
+    path = tmp_path / "example.py"
+    path.write_text(MODULE)
+    return path
+
+
+class TestFileIndex:
+    """Test reading and parsing files through FileIndex."""
+
+    def test_files_are_read_once(self, module_file):
+        """Test that text and modules are cached by path."""
+        index = FileIndex()
+        module = index.module(module_file)
+        module_file.write_text("changed = True\n")
+        
+        assert index.text(module_file) == MODULE
+        assert index.module(module_file) is module
+
+    def test_class_structure(self, module_file):
+        """Test the bases, decorators, methods and attributes of a class."""
+        example = FileIndex().module(module_file).classes["Example"]
+        
+        assert example.bases == ["plugins.FairDMPlugin"]
+        assert example.decorators == ["plugins.register(ProjectModel)"]
+        assert set(example.methods) == {"export"}
+        assert example.literal("title") == "Example"
+        assert example.literal("sizes") == [1, 2]
+        assert len(example.decorator_calls("plugins.register")) == 1
+
+    def test_imports(self, module_file):
+        """Test that imports map local names to qualified names."""
+        module = FileIndex().module(module_file)
+        
+        assert module.imports == {
+            "os": "os.path",
+            "plugins": "fairdm.plugins",
+            "ProjectModel": "fairdm.core.project.models.Project",
+            "conf": ".conf",
+        }
+        assert module.local_imports == {"exports": ".exports"}
+        assert module.literal("LIMIT") == 10
+
+    def test_invalid_python_raises(self, tmp_path):
+        """Test that parsing an invalid module raises SyntaxError."""
+        path = tmp_path / "broken.py"
+        path.write_text("def broken(:\n")
+        
+        with pytest.raises(SyntaxError):
+            FileIndex().module(path)
+
+    @pytest.mark.parametrize(
+        ("line", "leftover"),
+        [
+            ('name = "{{ cookiecutter.plugin_slug }}"', True),
+            ("{%- if use_cache %}", True),
+            ("{% raw %}", True),
+            ("{% if user.is_staff %}", False),
+            ("{{ base_object.name }}", False),
+        ],
+    )
+    def test_jinja_leftovers(self, tmp_path, line, leftover):
+        """Test that Jinja-only syntax is reported but Django template syntax is not."""
+        path = tmp_path / "template.html"
+        path.write_text(f"<div>\n{line}\n</div>\n")
+        
+        assert FileIndex().jinja_leftovers(path) == ([(2, line)] if leftover else [])
@@ -1,5 +1,6 @@
 """Test basic cookiecutter template generation."""
 
+import shutil
 import pytest
 from pathlib import Path
 
@@ -58,6 +59,7 @@ class TestBasicGeneration:
         assert (tests_dir / "conftest.py").exists()
         assert (tests_dir / "test_apps.py").exists()
         assert (tests_dir / "test_plugins.py").exists()
+        assert (tests_dir / "test_queries.py").exists()
         assert (tests_dir / "README.md").exists()
 
     def test_github_directory_structure(self, generated_project):
@@ -110,6 +112,18 @@ class TestConditionalGeneration:
         assert "TEST_PLUGIN_" in content.upper()
         assert "Default settings" in content
 
+    def test_conf_module_always_included(self, generated_project):
+        """Test that the typed settings module and its tests are always created."""
+        conf_file = generated_project / "test_plugin" / "conf.py"
+        assert conf_file.exists()
+        assert (generated_project / "tests" / "test_conf.py").exists()
+        
+        content = conf_file.read_text()
+        assert 'PREFIX = "TEST_PLUGIN_"' in content
+        assert "@dataclass(frozen=True)" in content
+        assert "QUERY_BUDGET: int = 10" in content
+        assert "CACHE_ALIAS" not in content
+
     def test_settings_file_included_in_full_features(self, full_features_project):
         """Test that settings.py is created in full features project too."""
         settings_file = full_features_project / "full_features_plugin" / "settings.py"
@@ -141,6 +155,16 @@ class TestConditionalGeneration:
         assert "from fairdm.core.sample.models import Sample" in content
         assert "from fairdm.core.measurement.models import Measurement" in content
 
+    def test_render_cache_excluded_by_default(self, generated_project):
+        """Test that the render cache module is not created unless enabled."""
+        assert not (generated_project / "test_plugin" / "cache.py").exists()
+        assert not (generated_project / "tests" / "test_cache.py").exists()
+
+    def test_render_cache_included_when_enabled(self, full_features_project):
+        """Test that the render cache module and its tests are created when enabled."""
+        assert (full_features_project / "full_features_plugin" / "cache.py").exists()
+        assert (full_features_project / "tests" / "test_cache.py").exists()
+
 
 class TestLicenseGeneration:
     """Test that different license files are generated correctly."""
@@ -172,3 +196,79 @@ class TestLicenseGeneration:
         # Basic validation that it's not empty
         assert len(content) > 100
         assert "2025" in content or context["author_name"] in content
+
+
+class TestContextValidation:
+    """Test that contexts that cannot produce a working plugin are rejected."""
+
+    def test_plugin_without_models_is_rejected(self, make_project):
+        """Test that generation fails when the plugin is registered to no model."""
+        from cookiecutter.exceptions import FailedHookException
+
+        with pytest.raises(FailedHookException):
+            make_project(
+                register_to_models__project="no",
+                register_to_models__dataset="no",
+                register_to_models__sample="no",
+                register_to_models__measurement="no",
+            )
+
+
+class TestGenerationCache:
+    """Test the session-wide cache of generated projects."""
+
+    def test_same_context_rendered_once(self, project_cache, default_context, generated_project):
+        """Test that identical contexts share one generated project."""
+        assert project_cache.get(dict(default_context)) == generated_project
+
+    def test_distinct_contexts_rendered_separately(self, generated_project, minimal_project, make_project):
+        """Test that every distinct context gets its own project."""
+        assert generated_project != minimal_project
+        assert make_project(use_render_cache="yes") != generated_project
+
+    def test_key_depends_on_template_contents(self, project_cache, default_context):
+        """Test that the cache key changes when the template changes."""
+        key = project_cache.key(default_context)
+        original = project_cache.template_hash
+        try:
+            project_cache.template_hash = "changed"
+            assert project_cache.key(default_context) != key
+        finally:
+            project_cache.template_hash = original
+
+    def test_cached_files_are_read_only(self, generated_project):
+        """Test that shared projects are protected against accidental edits."""
+        plugins_file = generated_project / "test_plugin" / "plugins.py"
+        
+        assert not plugins_file.stat().st_mode & 0o222
+
+    def test_writable_copy_is_independent(self, writable_project, generated_project):
+        """Test that a writable copy can be changed without touching the shared project."""
+        project_dir = writable_project()
+        plugins_file = project_dir / "test_plugin" / "plugins.py"
+        
+        assert project_dir != generated_project
+        plugins_file.write_text("# changed\n")
+        assert (generated_project / "test_plugin" / "plugins.py").read_text() != "# changed\n"
+
+
+class TestPostGeneration:
+    """Test the post-generation pipeline in hooks/post_gen_project.py."""
+
+    def test_nothing_is_byte_compiled(self, generated_project):
+        """Test that generation leaves byte-compiling to the interpreter that runs the plugin."""
+        assert not list(generated_project.rglob("__pycache__"))
+
+    def test_ruff_format_disabled_by_default(self, generated_project):
+        """Test that generated code is left as rendered unless ruff formatting is enabled."""
+        plugins_file = generated_project / "test_plugin" / "plugins.py"
+        assert any(line and not line.strip() for line in plugins_file.read_text().splitlines())
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff is not installed")
+    def test_ruff_format_enabled(self, make_project):
+        """Test that the generated code is formatted when ruff formatting is enabled."""
+        project_dir = make_project(use_ruff_format="yes")
+        plugins_file = project_dir / "test_plugin" / "plugins.py"
+        
+        assert not any(line != line.rstrip() for line in plugins_file.read_text().splitlines())
+        assert not (project_dir / ".ruff_cache").exists()
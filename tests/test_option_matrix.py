@@ -0,0 +1,106 @@
+"""Render and validate combinations of the template's options."""
+
+import itertools
+
+import pytest
+
+from option_matrix import (
+    MODEL_OPTIONS,
+    build_matrix,
+    check_register_call,
+    covering_array,
+    format_failure,
+    has_models,
+    load_choices,
+    run_matrix,
+)
+
+
+class TestOptionMatrix:
+    """Test that every branch of the template renders valid Python."""
+
+    def test_pairwise_matrix_covers_every_pair(self):
+        """Test that every pair of values is rendered together in a context that registers a model."""
+        choices = load_choices()
+        matrix = [context for context in build_matrix() if has_models(context)]
+
+        for first, second in itertools.combinations(choices, 2):
+            covered = {(context[first], context[second]) for context in matrix}
+            assert covered == set(itertools.product(choices[first], choices[second])), (first, second)
+
+    def test_pairwise_matrix_stays_small(self):
+        """Test that the default matrix grows with the number of options, not with their product."""
+        assert len(build_matrix()) < 40
+
+    def test_pairwise_matrix_checks_rejection_once(self):
+        """Test that exactly one context registers no model, to check that it is rejected."""
+        assert [has_models(context) for context in build_matrix()].count(False) == 1
+        assert not has_models(dict.fromkeys(MODEL_OPTIONS, "no"))
+
+    def test_covering_array_of_higher_strength(self):
+        """Test that a strength of 3 covers every triple of values."""
+        choices = {name: ["a", "b"] for name in "wxyz"}
+        contexts = covering_array(choices, strength=3)
+
+        for subset in itertools.combinations(choices, 3):
+            assert {tuple(context[name] for name in subset) for context in contexts} == set(
+                itertools.product("ab", repeat=3)
+            )
+
+    def test_unknown_mode_rejected(self):
+        """Test that an unknown matrix mode raises an error."""
+        with pytest.raises(ValueError, match="Unknown matrix mode"):
+            build_matrix("everything")
+
+    def test_toggles_matrix_covers_every_choice_combination(self):
+        """Test that --toggles contains every non-toggle combination and every toggle combination."""
+        choices = load_choices()
+        toggles = [name for name in choices if name.startswith("use_")]
+        others = [name for name in choices if name not in toggles]
+        matrix = build_matrix("toggles")
+
+        assert {tuple(context[name] for name in others) for context in matrix} == set(
+            itertools.product(*(choices[name] for name in others))
+        )
+        assert {tuple(context[name] for name in toggles) for context in matrix} == set(
+            itertools.product(*(choices[name] for name in toggles))
+        )
+
+    def test_register_check_accepts_expected_models(self):
+        """Test that a well-formed register call passes."""
+        source = (
+            "from fairdm.core.project.models import Project\n"
+            "from fairdm.core.dataset.models import Dataset\n"
+            "@plugins.register(Project, Dataset)\n"
+            "class Plugin: pass\n"
+        )
+        assert check_register_call(source, ["Project", "Dataset"]) == []
+
+    @pytest.mark.parametrize(
+        "register, expected",
+        [
+            ("Project", ["Project", "Dataset"]),
+            ("Dataset, Project", ["Project", "Dataset"]),
+            ("Project, Sample", ["Project", "Sample"]),
+        ],
+    )
+    def test_register_check_reports_problems(self, register, expected):
+        """Test that missing, reordered or unimported models are reported."""
+        source = (
+            "from fairdm.core.project.models import Project\n"
+            "from fairdm.core.dataset.models import Dataset\n"
+            f"@plugins.register({register})\n"
+            "class Plugin: pass\n"
+        )
+        assert check_register_call(source, expected)
+
+    def test_every_combination_renders_valid_python(self, request):
+        """
+        Test that every combination renders, compiles and registers the right models.
+
+        The pairwise matrix is rendered by default. Pass --option-matrix=toggles
+        or --option-matrix=exhaustive to render more combinations.
+        """
+        failures = run_matrix(build_matrix(request.config.getoption("--option-matrix")))
+
+        assert not failures, "\n\n".join(format_failure(context, problems) for context, problems in failures)
@@ -1,109 +1,126 @@
 """Test that the generated plugin would work correctly in a FairDM project."""
 
 import ast
+import gzip
+import json
+import re
+import subprocess
+import sys
+
 import pytest
 
 
 class TestPluginClass:
     """Test that the generated plugin class is correctly structured."""
 
-    def test_plugin_inherits_from_fairdm_plugin(self, generated_project):
+    def test_plugin_inherits_from_fairdm_plugin(self, file_index, generated_project):
         """Test that plugin class inherits from FairDMPlugin."""
-        plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
-        
-        # Parse the Python file
-        tree = ast.parse(content)
-        
-        # Find the plugin class
-        plugin_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == "TestPlugin":
-                plugin_class = node
-                break
+        module = file_index.module(generated_project / "test_plugin" / "plugins.py")
         
-        assert plugin_class is not None, "Plugin class 'TestPlugin' not found"
-        
-        # Check inheritance
-        base_names = [base.id if hasattr(base, 'id') else str(base.attr) for base in plugin_class.bases]
-        assert any('FairDMPlugin' in name for name in base_names), "Plugin doesn't inherit from FairDMPlugin"
+        assert "TestPlugin" in module.classes, "Plugin class 'TestPlugin' not found"
+        assert "plugins.FairDMPlugin" in module.classes["TestPlugin"].bases, "Plugin doesn't inherit from FairDMPlugin"
+        assert module.imports["plugins"] == "fairdm.plugins"
 
-    def test_plugin_has_required_attributes(self, generated_project):
+    def test_plugin_has_required_attributes(self, file_index, generated_project):
         """Test that plugin class has required attributes."""
-        plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        plugin_class = file_index.module(generated_project / "test_plugin" / "plugins.py").classes["TestPlugin"]
         
         # Should have required attributes
-        assert 'title =' in content
-        assert 'menu_item =' in content
-        assert 'template_name =' in content
+        assert {"title", "menu_item", "template_name"} <= set(plugin_class.attributes)
 
-    def test_plugin_has_menu_item_with_category(self, generated_project):
+    def test_plugin_has_menu_item_with_category(self, file_index, generated_project):
         """Test that menu_item has a category."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         assert 'PluginMenuItem' in content
         assert 'category=plugins.EXPLORE' in content
 
-    def test_plugin_has_get_context_data_method(self, generated_project):
+    def test_plugin_has_get_context_data_method(self, file_index, generated_project):
         """Test that plugin has get_context_data method."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         assert 'def get_context_data(self, **kwargs):' in content
         assert 'super().get_context_data(**kwargs)' in content
 
-    def test_plugin_category_matches_context(self, minimal_project):
+    def test_plugin_category_matches_context(self, file_index, minimal_project):
         """Test that plugin category matches the selected category."""
         plugins_file = minimal_project / "minimal_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         # Minimal context uses ACTIONS category
         assert 'category=plugins.ACTIONS' in content
 
-    def test_plugin_icon_matches_context(self, generated_project):
+    def test_plugin_icon_matches_context(self, file_index, generated_project):
         """Test that plugin icon matches the context."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         # Default context uses puzzle-piece icon
         assert 'icon="puzzle-piece"' in content
 
 
+class TestBaseQueryset:
+    """Test the get_base_queryset hook and its related-object defaults."""
+
+    def test_plugin_has_queryset_hooks(self, file_index, generated_project):
+        """Test that the plugin exposes overridable queryset hooks."""
+        plugin_class = file_index.module(generated_project / "test_plugin" / "plugins.py").classes["TestPlugin"]
+        
+        assert {"get_base_queryset", "get_base_object", "get_related_lookups"} <= set(plugin_class.methods)
+
+    def test_dispatch_reloads_base_object(self, file_index, generated_project):
+        """Test that dispatch loads base_object through the queryset hook."""
+        content = file_index.text(generated_project / "test_plugin" / "plugins.py")
+        
+        assert "self.base_object = self.get_base_object()" in content
+
+    def test_related_defaults_for_all_models(self, file_index, full_features_project):
+        """Test that every registered model gets empty related-object defaults, so base_object is not fetched again."""
+        plugin_class = file_index.module(full_features_project / "full_features_plugin" / "plugins.py").classes["FullFeaturesPlugin"]
+        attributes = plugin_class.attributes
+        
+        select_related = {key.id: ast.literal_eval(value) for key, value in zip(attributes["select_related"].keys, attributes["select_related"].values, strict=True)}
+        prefetch_related = {key.id for key in attributes["prefetch_related"].keys}
+        
+        assert select_related == {"Project": [], "Dataset": [], "Sample": [], "Measurement": []}
+        assert "return self.base_object" in plugin_class.method_source("get_base_object")
+        assert prefetch_related == {"Project", "Dataset", "Sample", "Measurement"}
+
+    def test_related_defaults_only_for_registered_models(self, file_index, minimal_project):
+        """Test that only registered models appear in the related-object defaults."""
+        content = file_index.text(minimal_project / "minimal_plugin" / "plugins.py")
+        
+        assert "Project: []," in content
+        assert "Dataset:" not in content
+        assert "Sample:" not in content
+
+
 class TestPluginRegistration:
     """Test that plugin registration is correct."""
 
-    def test_register_decorator_present(self, generated_project):
+    def test_register_decorator_present(self, file_index, generated_project):
         """Test that @plugins.register decorator is present."""
         plugins_file = generated_project / "test_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         assert '@plugins.register(' in content
 
-    def test_register_decorator_has_correct_models(self, generated_project):
+    def test_register_decorator_has_correct_models(self, file_index, generated_project):
         """Test that decorator registers to correct models."""
-        plugins_file = generated_project / "test_plugin" / "plugins.py"
-        
-        # Parse the file to find the decorator
-        tree = ast.parse(plugins_file.read_text())
+        module = file_index.module(generated_project / "test_plugin" / "plugins.py")
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == "TestPlugin":
-                # Find the decorator
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Call):
-                        if hasattr(decorator.func, 'attr') and decorator.func.attr == 'register':
-                            # Check that it has arguments (models)
-                            assert len(decorator.args) > 0, "No models registered"
-                            return
+        [register] = module.classes["TestPlugin"].decorator_calls("plugins.register")
+        models = [ast.unparse(arg) for arg in register.args]
         
-        pytest.fail("@plugins.register decorator not found")
+        assert models == ["Project", "Dataset"]
+        assert all(module.imports[model].startswith("fairdm.core.") for model in models)
 
-    def test_only_selected_models_imported(self, minimal_project):
+    def test_only_selected_models_imported(self, file_index, minimal_project):
         """Test that only selected models are imported."""
         plugins_file = minimal_project / "minimal_plugin" / "plugins.py"
-        content = plugins_file.read_text()
+        content = file_index.text(plugins_file)
         
         # Minimal context only registers to Project
         assert "from fairdm.core.project.models import Project" in content
@@ -117,28 +134,890 @@ class TestPluginRegistration:
 class TestAppConfig:
     """Test Django app configuration."""
 
-    def test_app_config_name_matches_plugin(self, generated_project):
+    def test_app_config_name_matches_plugin(self, file_index, generated_project):
         """Test that AppConfig name matches plugin slug."""
         apps_file = generated_project / "test_plugin" / "apps.py"
-        content = apps_file.read_text()
+        content = file_index.text(apps_file)
         
         assert 'name = "test_plugin"' in content
 
-    def test_app_config_imports_plugins_in_ready(self, generated_project):
+    def test_app_config_imports_plugins_in_ready(self, file_index, generated_project):
         """Test that ready() method imports plugins."""
+        module = file_index.module(generated_project / "test_plugin" / "apps.py")
+        
+        assert "ready" in module.functions, "ready() method not found in apps.py"
+        assert module.local_imports["plugins"] == ".plugins"
+
+
+class TestRenderCache:
+    """Test the optional rendered-panel cache."""
+
+    def test_cache_module_is_valid_python(self, file_index, full_features_project):
+        """Test that cache.py is valid Python code."""
+        cache_file = full_features_project / "full_features_plugin" / "cache.py"
+        
+        try:
+            file_index.module(cache_file)
+        except SyntaxError as e:
+            pytest.fail(f"cache.py has invalid Python syntax: {e}")
+
+    def test_signals_connected_for_registered_models(self, file_index, full_features_project):
+        """Test that ready() wires invalidation signals for every registered model and its subclasses."""
+        apps_file = full_features_project / "full_features_plugin" / "apps.py"
+        content = file_index.text(apps_file)
+        
+        file_index.module(apps_file)
+        assert "post_save.connect(cache.invalidate" in content
+        assert "post_delete.connect(cache.invalidate" in content
+        assert "registered = (Project, Dataset, Sample, Measurement)" in content
+        assert "for model in apps.get_models():" in content
+        assert "if issubclass(model, registered):" in content
+
+    def test_versions_shared_by_subclasses(self, file_index, full_features_project):
+        """Test that version tokens are keyed on the root model, so subclass saves retire the same panels."""
+        module = file_index.module(full_features_project / "full_features_plugin" / "cache.py")
+        
+        assert "get_root_model" in module.functions
+        assert "{get_root_model(instance)._meta.label_lower}" in module.source
+
+    def test_single_registered_model_is_a_tuple(self, file_index, make_project):
+        """Test that a plugin registered to one model still passes a tuple to issubclass()."""
+        project_dir = make_project(use_render_cache="yes", register_to_models__dataset="no")
+        
+        assert "registered = (Project,)" in file_index.text(project_dir / "test_plugin" / "apps.py")
+
+    def test_signals_not_connected_by_default(self, file_index, generated_project):
+        """Test that no cache signals are wired when the cache is disabled."""
         apps_file = generated_project / "test_plugin" / "apps.py"
-        content = apps_file.read_text()
+        content = file_index.text(apps_file)
+        
+        assert "post_save" not in content
+        assert "cache" not in content
+
+    def test_template_wraps_plugin_block_in_cache(self, file_index, make_project):
+        """Test that the plugin block is wrapped in a per-object cache fragment."""
+        project_dir = make_project(use_render_cache="yes")
+        
+        template_file = project_dir / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
+        content = file_index.text(template_file)
+        
+        assert "{% load cache %}" in content
+        assert '{% cache panel_cache_timeout "test_plugin_panel" panel_cache_key using=panel_cache_alias %}' in content
+        assert "{% endcache %}" in content
+
+    def test_cache_fragment_excludes_task_form(self, file_index, make_project):
+        """Test that the cached fragment never contains the per-user CSRF token."""
+        project_dir = make_project(use_render_cache="yes", use_background_tasks="yes")
+        
+        template_file = project_dir / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
+        content = file_index.text(template_file)
+        cached = content[content.index("{% cache"):content.index("{% endcache %}")]
+        
+        assert "{% csrf_token %}" in content
+        assert "csrf_token" not in cached
+
+    def test_deferred_content_is_cached_instead_of_shell(self, file_index, full_features_project):
+        """Test that with deferred content the cache wraps the partial, not the shell."""
+        templates_dir = full_features_project / "full_features_plugin" / "templates" / "full_features_plugin"
+        shell = file_index.text(templates_dir / "full_features_plugin.html")
+        partial = file_index.text(templates_dir / "full_features_plugin_content.html")
+        
+        assert "{% cache" not in shell
+        assert '{% cache panel_cache_timeout "full_features_plugin_panel" panel_cache_key using=panel_cache_alias %}' in partial
+        assert "{% endcache %}" in partial
+
+    def test_plugin_exposes_panel_cache_key(self, file_index, full_features_project):
+        """Test that get_context_data provides the panel cache key."""
+        plugins_file = full_features_project / "full_features_plugin" / "plugins.py"
+        content = file_index.text(plugins_file)
+        
+        assert file_index.module(plugins_file).imports["cache"] == ".cache"
+        assert 'context["panel_cache_key"] = cache.get_panel_key(self.base_object)' in content
+
+
+class TestDeferredContent:
+    """Test the optional deferred (lazy-loaded) plugin content."""
+
+    def test_plugin_switches_template_for_partial_requests(self, file_index, full_features_project):
+        """Test that the plugin renders the partial template for deferred requests."""
+        plugins_file = full_features_project / "full_features_plugin" / "plugins.py"
+        content = file_index.text(plugins_file)
+        
+        file_index.module(plugins_file)
+        assert 'partial_template_name = "full_features_plugin/full_features_plugin_content.html"' in content
+        assert "def is_partial_request(self):" in content
+        assert "def get_template_names(self):" in content
+        assert "def get_partial_context_data(self):" in content
+
+    def test_shell_extends_plugin_base_and_loads_partial(self, file_index, full_features_project):
+        """Test that the shell extends fairdm/plugin.html and requests the partial."""
+        template_file = full_features_project / "full_features_plugin" / "templates" / "full_features_plugin" / "full_features_plugin.html"
+        content = file_index.text(template_file)
+        
+        assert '{% extends "fairdm/plugin.html" %}' in content
+        assert 'hx-get="{{ request.path }}?{{ view.partial_parameter }}=1"' in content
+        assert 'hx-trigger="load"' in content
+        assert "fetch(" in content
+
+    def test_partial_template_does_not_extend(self, file_index, full_features_project):
+        """Test that the partial template renders without the page layout."""
+        template_file = full_features_project / "full_features_plugin" / "templates" / "full_features_plugin" / "full_features_plugin_content.html"
+        content = file_index.text(template_file)
+        
+        assert "{% extends" not in content
+        assert "base_object" in content
+
+    def test_template_selection_tests_need_no_database(self, file_index, full_features_project):
+        """Test that the generated tests which use database fixtures are marked django_db."""
+        module = file_index.module(full_features_project / "tests" / "test_plugins.py")
+        database_fixtures = {"user", "project", "dataset", "sample", "measurement"}
+        
+        for node in ast.walk(module.tree):
+            if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
+                arguments = {arg.arg for arg in node.args.args}
+                decorators = {ast.unparse(decorator) for decorator in node.decorator_list}
+                if arguments & database_fixtures:
+                    assert "pytest.mark.django_db" in decorators, node.name
+        assert "request.user = AnonymousUser()" in module.source
+
+    def test_deferred_content_absent_by_default(self, file_index, generated_project):
+        """Test that default plugins render synchronously without a partial template."""
+        templates_dir = generated_project / "test_plugin" / "templates" / "test_plugin"
+        plugins_content = file_index.text(generated_project / "test_plugin" / "plugins.py")
+        
+        assert not (templates_dir / "test_plugin_content.html").exists()
+        assert "hx-get" not in file_index.text(templates_dir / "test_plugin.html")
+        assert "partial_template_name" not in plugins_content
+
+
+class TestStreamingExport:
+    """Test the optional streaming CSV/NDJSON export for ACTIONS plugins."""
+
+    def test_export_generated_for_actions_plugins(self, file_index, make_project):
+        """Test that exports.py and its tests are generated for ACTIONS plugins."""
+        project_dir = make_project(plugin_category="ACTIONS", use_streaming_export="yes")
+        exports_file = project_dir / "test_plugin" / "exports.py"
+        
+        assert exports_file.exists()
+        assert (project_dir / "tests" / "test_exports.py").exists()
+        
+        content = file_index.text(exports_file)
+        file_index.module(exports_file)
+        assert "StreamingHttpResponse" in content
+        assert ".iterator(chunk_size=CHUNK_SIZE)" in content
+        assert "values_list(" in content
+
+    def test_plugin_streams_export_on_request(self, file_index, make_project):
+        """Test that the plugin answers ?export= with a streaming response."""
+        project_dir = make_project(plugin_category="ACTIONS", use_streaming_export="yes")
+        plugins_content = file_index.text(project_dir / "test_plugin" / "plugins.py")
+        template_content = file_index.text(project_dir / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html")
+        
+        file_index.module(project_dir / "test_plugin" / "plugins.py")
+        assert "from . import exports" in plugins_content
+        assert 'export_parameter = "export"' in plugins_content
+        assert "return exports.export_response(self.base_object, export_format, filename)" in plugins_content
+        assert "?{{ view.export_parameter }}=csv" in template_content
+        assert "?{{ view.export_parameter }}=ndjson" in template_content
+
+    def test_export_buttons_only_for_exportable_objects(self, file_index, make_project):
+        """Test that the export buttons are hidden on pages whose object the export does not support."""
+        project_dir = make_project(
+            plugin_category="ACTIONS",
+            use_streaming_export="yes",
+            register_to_models__sample="yes",
+            register_to_models__measurement="yes",
+        )
+        plugin_class = file_index.module(project_dir / "test_plugin" / "plugins.py").classes["TestPlugin"]
+        template_content = file_index.text(project_dir / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html")
+        
+        assert "return bool(self.get_related_lookups(exports.SAMPLE_LOOKUPS))" in plugin_class.method_source("can_export")
+        buttons = template_content.split("{% if view.can_export %}", 1)[1].split("{% endif %}", 1)[0]
+        assert "?{{ view.export_parameter }}=csv" in buttons
+        assert "?{{ view.export_parameter }}=ndjson" in buttons
+
+    def test_export_not_generated_for_other_categories(self, file_index, full_features_project):
+        """Test that the export option is ignored outside the ACTIONS category."""
+        package_dir = full_features_project / "full_features_plugin"
+        
+        assert not (package_dir / "exports.py").exists()
+        assert not (full_features_project / "tests" / "test_exports.py").exists()
+        assert "export" not in file_index.text(package_dir / "plugins.py")
+
+    def test_export_not_generated_by_default(self, minimal_project):
+        """Test that ACTIONS plugins get no export unless it is enabled."""
+        assert not (minimal_project / "minimal_plugin" / "exports.py").exists()
+
+
+class TestBackgroundTasks:
+    """Test the optional background task scaffold."""
+
+    def test_tasks_generated_when_enabled(self, file_index, full_features_project):
+        """Test that tasks.py and its tests are generated."""
+        tasks_file = full_features_project / "full_features_plugin" / "tasks.py"
+        
+        assert tasks_file.exists()
+        assert (full_features_project / "tests" / "test_tasks.py").exists()
+        
+        content = file_index.text(tasks_file)
+        file_index.module(tasks_file)
+        assert "class TaskBackend:" in content
+        assert "class ThreadPoolBackend(TaskBackend):" in content
+        assert "class ImmediateBackend(TaskBackend):" in content
+
+    def test_plugin_enqueues_and_reports_jobs(self, file_index, full_features_project):
+        """Test that the plugin starts jobs on POST and reports them on ?job=."""
+        package_dir = full_features_project / "full_features_plugin"
+        plugins_content = file_index.text(package_dir / "plugins.py")
+        settings_content = file_index.text(package_dir / "settings.py")
+        
+        file_index.module(package_dir / "plugins.py")
+        assert 'job_parameter = "job"' in plugins_content
+        assert "def post(self, request, *args, **kwargs):" in plugins_content
+        assert "tasks.get_backend().enqueue(" in plugins_content
+        assert 'FULL_FEATURES_PLUGIN_TASK_BACKEND = "full_features_plugin.tasks.ThreadPoolBackend"' in settings_content
+
+    def test_jobs_restricted_to_their_owner(self, file_index, full_features_project):
+        """Test that starting a job needs the change permission and only its owner may poll it."""
+        plugin_class = file_index.module(full_features_project / "full_features_plugin" / "plugins.py").classes[
+            "FullFeaturesPlugin"
+        ]
+        post = plugin_class.method_source("post")
+        
+        assert plugin_class.literal("task_permission_required") == ("change_{model_name}",)
+        assert post.index("raise PermissionDenied") < post.index("self.enqueue_task()")
+        assert "except tasks.QueueFull:" in post
+        assert "owner=self.get_job_owner()" in plugin_class.method_source("enqueue_task")
+        assert "job.owner != self.get_job_owner()" in plugin_class.method_source("job_status")
+
+    def test_task_backend_is_bounded(self, file_index, full_features_project):
+        """Test that the thread pool bounds its queue and the job store its size."""
+        package_dir = full_features_project / "full_features_plugin"
+        tasks_module = file_index.module(package_dir / "tasks.py")
+        
+        assert "threading.BoundedSemaphore(queue_size)" in tasks_module.classes["ThreadPoolBackend"].method_source(
+            "__init__"
+        )
+        assert "raise QueueFull" in tasks_module.classes["InMemoryJobStore"].method_source("create")
+        assert "FULL_FEATURES_PLUGIN_TASK_QUEUE_SIZE = 100" in file_index.text(package_dir / "settings.py")
+        assert "FULL_FEATURES_PLUGIN_TASK_MAX_JOBS = 1000" in file_index.text(package_dir / "settings.py")
+
+    def test_task_form_is_not_cached(self, file_index, full_features_project):
+        """Test that the CSRF-protected task form stays outside the cached fragment."""
+        template_file = full_features_project / "full_features_plugin" / "templates" / "full_features_plugin" / "full_features_plugin.html"
+        content = file_index.text(template_file)
+        
+        assert "{% csrf_token %}" in content
+        assert "{% cache" not in content
+
+    def test_tasks_not_generated_by_default(self, file_index, generated_project):
+        """Test that no task scaffold is generated unless it is enabled."""
+        package_dir = generated_project / "test_plugin"
+        
+        assert not (package_dir / "tasks.py").exists()
+        assert not (generated_project / "tests" / "test_tasks.py").exists()
+        assert "JsonResponse" not in file_index.text(package_dir / "plugins.py")
+
+
+class TestConditionalGet:
+    """Test the optional ETag/Last-Modified handling in dispatch."""
+
+    def test_dispatch_answers_conditional_requests(self, file_index, full_features_project):
+        """Test that dispatch wraps rendering in Django's condition() decorator."""
+        plugins_file = full_features_project / "full_features_plugin" / "plugins.py"
+        content = file_index.text(plugins_file)
+        
+        file_index.module(plugins_file)
+        assert "from django.views.decorators.http import condition" in content
+        assert "from . import __version__" in content
+        assert "return self.patch_cache_headers(response)" in content
+        assert 'patch_vary_headers(response, ["Cookie"])' in content
+
+    def test_etag_covers_object_version_and_user(self, file_index, full_features_project):
+        """Test that the ETag combines the object timestamp, plugin version and permission scope."""
+        content = file_index.text(full_features_project / "full_features_plugin" / "plugins.py")
+        etag_source = content[content.index("def get_etag(self):"):content.index("def patch_cache_headers(")]
+        
+        assert "last_modified.isoformat()" in etag_source
+        assert "__version__" in etag_source
+        assert "self.get_permission_scope()" in etag_source
+        assert "self.job_parameter not in self.request.GET" in content
+
+    def test_etag_covers_child_listing(self, file_index, full_features_project):
+        """Test that the ETag changes with the listed children and differs per page and cursor."""
+        package_dir = full_features_project / "full_features_plugin"
+        plugin_class = file_index.module(package_dir / "plugins.py").classes["FullFeaturesPlugin"]
+        get_etag = plugin_class.method_source("get_etag")
+        pagination = file_index.module(package_dir / "pagination.py")
+        
+        assert "self.get_child_state()" in get_etag
+        assert "self.request.GET.get(self.cursor_parameter, '')" in get_etag
+        assert "','.join(self.get_template_names())" in get_etag
+        assert "self.get_child_state()" in plugin_class.method_source("get_last_modified")
+        assert "request_memoize" in plugin_class.method_source("get_child_state")
+        assert "get_child_state" in pagination.functions
+        assert 'children.aggregate(count=Count("pk"), latest=Max(modified_field))' in pagination.source
+
+    def test_conditional_tests_generated(self, file_index, full_features_project):
+        """Test that the conditional GET tests are generated."""
+        test_file = full_features_project / "tests" / "test_conditional.py"
+        
+        assert test_file.exists()
+        file_index.module(test_file)
+
+    def test_conditional_get_absent_by_default(self, file_index, generated_project):
+        """Test that dispatch is a plain pass-through unless the option is enabled."""
+        content = file_index.text(generated_project / "test_plugin" / "plugins.py")
+        
+        assert "condition" not in content
+        assert "return super().dispatch(request, *args, **kwargs)" in content
+        assert not (generated_project / "tests" / "test_conditional.py").exists()
+
+
+class TestSummaryStore:
+    """Test the optional precomputed summary store for Project and Dataset plugins."""
+
+    SUMMARY_FILES = [
+        "full_features_plugin/models.py",
+        "full_features_plugin/summaries.py",
+        "full_features_plugin/migrations/0001_initial.py",
+        "full_features_plugin/management/commands/rebuild_full_features_plugin_summaries.py",
+        "tests/test_summaries.py",
+    ]
+
+    @pytest.mark.parametrize("path", SUMMARY_FILES)
+    def test_summary_files_are_valid_python(self, file_index, full_features_project, path):
+        """Test that the summary store modules are generated and valid Python."""
+        file_index.module(full_features_project / path)
+
+    def test_summary_model_has_unique_object_index(self, file_index, full_features_project):
+        """Test that summaries are looked up through a unique (content_type, object_id) index."""
+        package_dir = full_features_project / "full_features_plugin"
+        model = file_index.module(package_dir / "models.py").classes["Summary"]
+        migration = file_index.text(package_dir / "migrations" / "0001_initial.py")
+        
+        assert model.bases == ["models.Model"]
+        assert {"content_type", "object_id", "sample_count", "measurement_count"} <= set(model.attributes)
+        assert 'name="full_features_plugin_summary_object"' in file_index.text(package_dir / "models.py")
+        assert 'name="full_features_plugin_summary_object"' in migration
+
+    def test_summaries_cover_registered_models(self, file_index, make_project):
+        """Test that only the registered Project/Dataset models are summarised."""
+        project_dir = make_project(use_summary_store="yes", register_to_models__dataset="no")
+        module = file_index.module(project_dir / "test_plugin" / "summaries.py")
+        
+        assert ast.unparse(module.assignments["SAMPLE_LOOKUPS"]) == "{Project: 'dataset__project'}"
+        # Datasets are not summarised, but moving or deleting one recounts its project
+        assert "dataset_post_save" in module.functions
+
+    def test_dataset_receivers_only_with_projects(self, file_index, make_project):
+        """Test that Dataset plugins without Project get no dataset receivers."""
+        project_dir = make_project(use_summary_store="yes", register_to_models__project="no")
+        module = file_index.module(project_dir / "test_plugin" / "summaries.py")
+        
+        assert ast.unparse(module.assignments["SAMPLE_LOOKUPS"]) == "{Dataset: 'dataset'}"
+        assert "Project" not in module.imports
+        assert "dataset_post_save" not in module.functions
+
+    def test_counts_adjusted_by_signals(self, file_index, full_features_project):
+        """Test that ready() connects receivers that adjust counts with F() updates."""
+        package_dir = full_features_project / "full_features_plugin"
+        apps_module = file_index.module(package_dir / "apps.py")
+        summaries_module = file_index.module(package_dir / "summaries.py")
+        connect = apps_module.classes["FullFeaturesPluginConfig"].method_source("connect_summary_signals")
+        
+        assert "self.connect_summary_signals()" in apps_module.classes["FullFeaturesPluginConfig"].method_source("ready")
+        for receiver in [
+            "sample_pre_save",
+            "sample_post_save",
+            "measurement_pre_save",
+            "measurement_post_save",
+            "dataset_pre_save",
+            "dataset_post_save",
+            "pre_delete",
+            "post_delete",
+        ]:
+            assert receiver in summaries_module.functions
+            assert f"summaries.{receiver}," in connect
+        assert 'F("sample_count") + samples' in file_index.text(package_dir / "summaries.py")
+
+    def test_plugin_reads_summary(self, file_index, full_features_project):
+        """Test that the plugin reads the stored summary and renders it outside the panel cache."""
+        package_dir = full_features_project / "full_features_plugin"
+        plugins_module = file_index.module(package_dir / "plugins.py")
+        partial = file_index.text(package_dir / "templates" / "full_features_plugin" / "full_features_plugin_content.html")
+        
+        assert plugins_module.imports["summaries"] == ".summaries"
+        assert 'context["summary"] = self.get_summary()' in plugins_module.source
+        assert "summaries.get_summary(self.base_object)" in plugins_module.classes["FullFeaturesPlugin"].method_source(
+            "get_summary"
+        )
+        assert "{{ summary.sample_count }}" in partial[partial.index("{% endcache %}"):]
+
+    def test_summary_in_etag(self, file_index, full_features_project):
+        """Test that the ETag and Last-Modified change when the stored counts do."""
+        plugin_class = file_index.module(full_features_project / "full_features_plugin" / "plugins.py").classes[
+            "FullFeaturesPlugin"
+        ]
+        
+        assert "summary.updated.isoformat()" in plugin_class.method_source("get_etag")
+        assert "summary.updated" in plugin_class.method_source("get_last_modified")
+        assert "request_memoize" in plugin_class.method_source("get_summary")
+
+    def test_summary_store_absent_by_default(self, file_index, generated_project):
+        """Test that default plugins get no models, migrations or summary code."""
+        package_dir = generated_project / "test_plugin"
+        
+        for path in ["models.py", "summaries.py", "migrations", "management/commands/rebuild_test_plugin_summaries.py"]:
+            assert not (package_dir / path).exists()
+        assert not (generated_project / "tests" / "test_summaries.py").exists()
+        assert "summar" not in file_index.text(package_dir / "plugins.py")
+        assert "summar" not in file_index.text(package_dir / "templates" / "test_plugin" / "test_plugin.html")
+
+    def test_summary_store_ignored_without_project_or_dataset(self, make_project):
+        """Test that the option is ignored for plugins registered to samples or measurements only."""
+        project_dir = make_project(
+            use_summary_store="yes",
+            register_to_models__project="no",
+            register_to_models__dataset="no",
+            register_to_models__sample="yes",
+        )
+        
+        assert not (project_dir / "test_plugin" / "summaries.py").exists()
+        assert not (project_dir / "test_plugin" / "migrations").exists()
+        assert "summar" not in (project_dir / "test_plugin" / "apps.py").read_text()
+
+class TestChildListing:
+    """Test the optional keyset-paginated listing of child objects."""
+
+    def test_children_cover_registered_models(self, file_index, full_features_project):
+        """Test that every registered model with children gets a listing."""
+        module = file_index.module(full_features_project / "full_features_plugin" / "pagination.py")
         
-        # Parse to find ready method
-        tree = ast.parse(content)
+        assert ast.unparse(module.assignments["CHILDREN"]) == (
+            "{Project: (Dataset, 'project'), Dataset: (Sample, 'dataset'), Sample: (Measurement, 'sample')}"
+        )
+        assert module.literal("ORDERING") == ("pk",)
+
+    def test_children_imported_for_parents_only(self, file_index, make_project):
+        """Test that a plugin only imports the models its listings need."""
+        project_dir = make_project(use_child_listing="yes", register_to_models__project="no")
+        module = file_index.module(project_dir / "test_plugin" / "pagination.py")
+        
+        assert ast.unparse(module.assignments["CHILDREN"]) == "{Dataset: (Sample, 'dataset')}"
+        assert {"Dataset", "Sample"} <= set(module.imports)
+        assert not {"Project", "Measurement"} & set(module.imports)
+
+    def test_pages_without_offset_or_count(self, file_index, full_features_project):
+        """Test that pages are selected by keyset and fetch one extra row instead of counting."""
+        module = file_index.module(full_features_project / "full_features_plugin" / "pagination.py")
+        get_page = module.classes["KeysetPaginator"].method_source("get_page")
+        
+        assert "queryset[:self.page_size + 1]" in get_page
+        assert "self.after(self.decode_cursor(cursor))" in get_page
+        assert ".count()" not in module.source
+        assert "Paginator(" not in module.source.replace("KeysetPaginator(", "")
+
+    def test_plugin_serves_listing_rows(self, file_index, full_features_project):
+        """Test that ?listing=1 renders the partial and bad cursors are answered with 404."""
+        package_dir = full_features_project / "full_features_plugin"
+        plugin_class = file_index.module(package_dir / "plugins.py").classes["FullFeaturesPlugin"]
+        
+        assert plugin_class.literal("listing_template_name") == "full_features_plugin/full_features_plugin_children.html"
+        assert "self.is_listing_request()" in plugin_class.method_source("get_template_names")
+        assert "except pagination.InvalidCursor" in plugin_class.method_source("get_child_page")
+        assert "from . import pagination" in plugin_class.method_source("get_child_page")
+        assert (package_dir / "templates" / "full_features_plugin" / "full_features_plugin_children.html").exists()
+
+    def test_listing_rendered_outside_panel_cache(self, file_index, make_project):
+        """Test that the listing is included after the cached panel, with a Load more link."""
+        project_dir = make_project(use_child_listing="yes", use_render_cache="yes")
+        templates_dir = project_dir / "test_plugin" / "templates" / "test_plugin"
+        content = file_index.text(templates_dir / "test_plugin.html")
+        rows = file_index.text(templates_dir / "test_plugin_children.html")
+        
+        assert content.index('{% include "test_plugin/test_plugin_children.html" %}') > content.index("{% endcache %}")
+        assert "?{{ view.cursor_parameter }}={{ child_page.next_cursor }}&amp;{{ view.listing_parameter }}=1" in rows
+        assert 'hx-swap="outerHTML"' in rows
+
+    def test_page_size_setting(self, file_index, full_features_project):
+        """Test that the page size is a validated plugin setting."""
+        package_dir = full_features_project / "full_features_plugin"
+        
+        assert "FULL_FEATURES_PLUGIN_PAGE_SIZE = 25" in file_index.text(package_dir / "settings.py")
+        assert "PAGE_SIZE" in file_index.module(package_dir / "conf.py").classes["PluginSettings"].attributes
+
+    def test_child_listing_absent_by_default(self, file_index, generated_project):
+        """Test that default plugins get no listing."""
+        package_dir = generated_project / "test_plugin"
+        
+        assert not (package_dir / "pagination.py").exists()
+        assert not (generated_project / "tests" / "test_pagination.py").exists()
+        assert "cursor" not in file_index.text(package_dir / "plugins.py")
+
+    def test_child_listing_ignored_for_measurements(self, make_project):
+        """Test that the option is ignored for plugins registered to Measurement only."""
+        project_dir = make_project(
+            use_child_listing="yes",
+            register_to_models__project="no",
+            register_to_models__dataset="no",
+            register_to_models__measurement="yes",
+        )
+        
+        assert not (project_dir / "test_plugin" / "pagination.py").exists()
+        assert "listing" not in (project_dir / "test_plugin" / "plugins.py").read_text()
+
+class TestJsonApi:
+    """Test the optional read-only JSON API served from the plugin URL."""
+
+    def test_api_generated_without_urls(self, file_index, full_features_project):
+        """Test that api.py and its tests are generated and no urls.py is needed."""
+        package_dir = full_features_project / "full_features_plugin"
+        
+        file_index.module(package_dir / "api.py")
+        file_index.module(full_features_project / "tests" / "test_api.py")
+        assert not (package_dir / "urls.py").exists()
+
+    def test_rows_serialized_from_values(self, file_index, full_features_project):
+        """Test that the API reads values() rows and pages them by keyset."""
+        module = file_index.module(full_features_project / "full_features_plugin" / "api.py")
+        
+        assert module.imports["KeysetPaginator"] == ".pagination.KeysetPaginator"
+        assert "children.values(" in module.source
+        assert "JsonResponse(" in module.source
+        assert ast.unparse(module.assignments["FIELDS"]) == (
+            "{Dataset: ('id', 'name', 'project_id'), Sample: ('id', 'name', 'dataset_id'), "
+            "Measurement: ('id', 'name', 'sample_id')}"
+        )
+
+    def test_plugin_answers_format_json_before_rendering(self, file_index, full_features_project):
+        """Test that get() returns the JSON response before the page is rendered."""
+        plugin_class = file_index.module(full_features_project / "full_features_plugin" / "plugins.py").classes[
+            "FullFeaturesPlugin"
+        ]
+        get = plugin_class.method_source("get")
+        
+        assert plugin_class.literal("format_parameter") == "format"
+        assert get.index("return self.json_response()") < get.index("return super().get(request, *args, **kwargs)")
+        assert "from . import api" in plugin_class.method_source("json_response")
+        assert "self.request.GET.get(self.format_parameter) != 'json'" in plugin_class.method_source(
+            "is_conditional_request"
+        )
+
+    def test_api_settings(self, file_index, full_features_project):
+        """Test that the page size limit is a validated plugin setting."""
+        package_dir = full_features_project / "full_features_plugin"
+        
+        assert "FULL_FEATURES_PLUGIN_API_MAX_PAGE_SIZE = 500" in file_index.text(package_dir / "settings.py")
+        assert "API_MAX_PAGE_SIZE" in file_index.module(package_dir / "conf.py").classes["PluginSettings"].attributes
+
+    def test_api_shares_pagination_with_listing(self, file_index, make_project):
+        """Test that the API alone still generates the paginator, without the listing."""
+        project_dir = make_project(use_json_api="yes")
+        package_dir = project_dir / "test_plugin"
+        plugins_content = file_index.text(package_dir / "plugins.py")
+        
+        assert (package_dir / "pagination.py").exists()
+        assert not (package_dir / "templates" / "test_plugin" / "test_plugin_children.html").exists()
+        assert "class TestChildListing" not in file_index.text(project_dir / "tests" / "test_pagination.py")
+        assert 'cursor_parameter = "cursor"' in plugins_content
+        assert "listing" not in plugins_content
+
+    def test_json_api_absent_by_default(self, file_index, generated_project):
+        """Test that default plugins serve no JSON."""
+        assert not (generated_project / "test_plugin" / "api.py").exists()
+        assert not (generated_project / "tests" / "test_api.py").exists()
+        assert "format_parameter" not in file_index.text(generated_project / "test_plugin" / "plugins.py")
+
+
+class TestStaticBundle:
+    """Test the optional fingerprinted, precompressed static asset bundle."""
+
+    def test_bundle_files_generated(self, file_index, full_features_project):
+        """Test that the sources, the build module, the template tag and its tests are generated."""
+        package_dir = full_features_project / "full_features_plugin"
+        
+        assert (package_dir / "static" / "full_features_plugin" / "css" / "full_features_plugin.css").exists()
+        assert (package_dir / "static" / "full_features_plugin" / "js" / "full_features_plugin.js").exists()
+        file_index.module(package_dir / "assets.py")
+        file_index.module(package_dir / "templatetags" / "full_features_plugin_assets.py")
+        file_index.module(full_features_project / "tests" / "test_assets.py")
+
+    def test_build_writes_hashed_compressed_files_and_manifest(self, full_features_project, tmp_path):
+        """Test that the build runs without Django and writes a ManifestStaticFilesStorage manifest."""
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"from pathlib import Path; from full_features_plugin import assets; assets.build(output_dir=Path({str(tmp_path)!r}))",
+            ],
+            cwd=full_features_project,
+            check=True,
+        )
+        manifest = json.loads((tmp_path / "staticfiles.json").read_text())
+        hashed = manifest["paths"]["js/full_features_plugin.js"]
+        
+        assert manifest["version"] == "1.1"
+        assert re.fullmatch(r"js/full_features_plugin\.[0-9a-f]{12}\.js", hashed)
+        assert gzip.decompress((tmp_path / f"{hashed}.gz").read_bytes()) == (tmp_path / hashed).read_bytes()
+
+    def test_template_loads_hashed_assets(self, file_index, full_features_project):
+        """Test that the main template loads the assets through the plugin_asset tag."""
+        template_file = full_features_project / "full_features_plugin" / "templates" / "full_features_plugin" / "full_features_plugin.html"
+        content = file_index.text(template_file)
+        
+        assert "{% load full_features_plugin_assets %}" in content
+        assert '{% plugin_asset "css/full_features_plugin.css" %}' in content
+        assert '{% plugin_asset "js/full_features_plugin.js" %}' in content
+
+    def test_static_bundle_absent_by_default(self, file_index, generated_project):
+        """Test that default plugins ship no static tree or template tags."""
+        package_dir = generated_project / "test_plugin"
+        
+        assert not (package_dir / "static").exists()
+        assert not (package_dir / "assets.py").exists()
+        assert not (package_dir / "templatetags").exists()
+        assert "plugin_asset" not in file_index.text(package_dir / "templates" / "test_plugin" / "test_plugin.html")
+
+
+class TestRequestMemoization:
+    """Test the request-scoped memoization helpers."""
+
+    def test_memo_generated_by_default(self, file_index, generated_project):
+        """Test that every plugin gets memo.py and its tests."""
+        module = file_index.module(generated_project / "test_plugin" / "memo.py")
+        
+        assert {"get_memo", "request_memoize"} <= module.functions
+        assert "object_property" in module.classes
+        file_index.module(generated_project / "tests" / "test_memo.py")
+
+    def test_results_stored_on_request_per_base_object(self, file_index, generated_project):
+        """Test that results live on the request and are keyed by the model and pk of base_object."""
+        module = file_index.module(generated_project / "test_plugin" / "memo.py")
+        
+        assert module.literal("MEMO_ATTRIBUTE") == "_test_plugin_memo"
+        assert "def get_memo(request, attribute=MEMO_ATTRIBUTE):" in module.source
+        assert "setattr(request, attribute, memo)" in module.source
+        assert "return base_object._meta.label_lower, base_object.pk" in module.source
+
+    def test_object_property_is_read_only(self, file_index, generated_project):
+        """Test that object_property is a data descriptor, so instances cannot shadow it."""
+        object_property = file_index.module(generated_project / "test_plugin" / "memo.py").classes["object_property"]
+        
+        assert {"__get__", "__set__"} <= set(object_property.methods)
+
+    def test_context_hook_points_to_memoization(self, file_index, generated_project):
+        """Test that get_context_data suggests memoizing expensive helpers."""
+        content = file_index.text(generated_project / "test_plugin" / "plugins.py")
+        
+        assert "@request_memoize (see memo.py)" in content
+
+
+class TestPermissions:
+    """Test the per-request permission checks."""
+
+    def test_permissions_generated_by_default(self, file_index, generated_project):
+        """Test that every plugin gets permissions.py and its tests."""
+        module = file_index.module(generated_project / "test_plugin" / "permissions.py")
+        
+        assert {"get_permissions", "has_perm", "has_perms", "get_required_permissions"} <= module.functions
+        assert module.imports["get_memo"] == ".memo.get_memo"
+        file_index.module(generated_project / "tests" / "test_permissions.py")
+
+    def test_permissions_fetched_once_per_object(self, file_index, generated_project):
+        """Test that the user's permissions are memoized on the request per user and object, for every plugin."""
+        module = file_index.module(generated_project / "test_plugin" / "permissions.py")
+        
+        # Shared by all plugins generated from the template, unlike the per-plugin memo
+        assert module.literal("PERMISSIONS_ATTRIBUTE") == "_fairdm_plugin_permissions"
+        assert "key = (user.pk, obj._meta.label_lower, obj.pk)" in module.source
+        assert "memo = get_memo(request, PERMISSIONS_ATTRIBUTE)" in module.source
+        assert "user.get_all_permissions(obj)" in module.source
+
+    def test_dispatch_enforces_permission_required(self, file_index, generated_project):
+        """Test that dispatch denies users missing permission_required before reloading base_object."""
+        module = file_index.module(generated_project / "test_plugin" / "plugins.py")
+        plugin_class = module.classes["TestPlugin"]
+        dispatch = plugin_class.method_source("dispatch")
+        
+        assert "permission_required" in plugin_class.attributes
+        assert module.imports["PermissionDenied"] == "django.core.exceptions.PermissionDenied"
+        assert dispatch.index("self.has_permission()") < dispatch.index("self.get_base_object()")
+        assert "request.user.has_perm(" not in dispatch
+
+    def test_etag_scope_reuses_permission_lookup(self, file_index, full_features_project):
+        """Test that the ETag's permission scope shares the lookup made by has_permission()."""
+        plugin_class = file_index.module(full_features_project / "full_features_plugin" / "plugins.py").classes["FullFeaturesPlugin"]
+        
+        scope = plugin_class.method_source("get_permission_scope")
+        assert "permissions.get_permissions(self.request, self.base_object)" in scope
+        assert "get_all_permissions" not in scope
+
+
+class TestFeatureFlag:
+    """Test the optional django-waffle feature flag and its in-process cache."""
+
+    def test_flag_files_generated(self, file_index, full_features_project):
+        """Test that the flag module, its tests and the django-waffle dependency are generated."""
+        module = file_index.module(full_features_project / "full_features_plugin" / "flags.py")
         
-        ready_method_found = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "ready":
-                ready_method_found = True
-                break
+        assert {"get_flags", "invalidate", "is_active"} <= module.functions
+        file_index.module(full_features_project / "tests" / "test_flags.py")
+        assert 'django-waffle = "^4.1"' in file_index.text(full_features_project / "pyproject.toml")
+
+    def test_flags_cached_in_process_and_per_request(self, file_index, full_features_project):
+        """Test that all flags are loaded by one query per TTL and evaluated once per request."""
+        package_dir = full_features_project / "full_features_plugin"
+        module = file_index.module(package_dir / "flags.py")
+        
+        assert "get_waffle_flag_model().objects.all()" in module.source
+        assert "time.monotonic() + get_settings().FEATURE_FLAG_TTL" in module.source
+        assert "memo = get_memo(request)" in module.source
+        assert "FEATURE_FLAG_TTL" in file_index.module(package_dir / "conf.py").classes["PluginSettings"].attributes
+
+    def test_flag_gates_dispatch(self, file_index, full_features_project):
+        """Test that dispatch answers 404 while the flag is inactive, before any other check."""
+        package_dir = full_features_project / "full_features_plugin"
+        plugin_class = file_index.module(package_dir / "plugins.py").classes["FullFeaturesPlugin"]
+        dispatch = plugin_class.method_source("dispatch")
+        
+        assert ast.literal_eval(plugin_class.attributes["feature_flag"]) == "full_features_plugin"
+        assert dispatch.index("self.is_enabled()") < dispatch.index("self.has_permission()")
+        assert "flags.is_active(self.request, self.feature_flag)" in plugin_class.method_source("is_enabled")
+
+    def test_saving_flag_invalidates_cache(self, file_index, full_features_project):
+        """Test that saving or deleting a flag drops the copy held by the process."""
+        apps = file_index.module(full_features_project / "full_features_plugin" / "apps.py")
+        connect = apps.classes["FullFeaturesPluginConfig"].method_source("connect_flag_signals")
+        
+        assert "post_save.connect(flags.invalidate, sender=get_waffle_flag_model()" in connect
+        assert "post_delete.connect(flags.invalidate, sender=get_waffle_flag_model()" in connect
+
+    def test_feature_flag_absent_by_default(self, file_index, generated_project):
+        """Test that default plugins have no feature flag and do not depend on django-waffle."""
+        package_dir = generated_project / "test_plugin"
+        
+        assert not (package_dir / "flags.py").exists()
+        assert "feature_flag" not in file_index.module(package_dir / "plugins.py").classes["TestPlugin"].attributes
+        assert "waffle" not in file_index.text(generated_project / "pyproject.toml")
+
+
+class TestWarmup:
+    """Test the deploy-time warmup module and management command."""
+
+    def test_warmup_generated_by_default(self, file_index, generated_project):
+        """Test that every plugin gets the warmup module, its command and its tests."""
+        package_dir = generated_project / "test_plugin"
+        
+        file_index.module(package_dir / "warmup.py")
+        file_index.module(package_dir / "management" / "commands" / "warmup_test_plugin.py")
+        file_index.module(generated_project / "tests" / "test_warmup.py")
+
+    def test_views_resolved_through_registry(self, file_index, generated_project):
+        """Test that the registered models are listed and resolved with get_view_for_model."""
+        module = file_index.module(generated_project / "test_plugin" / "warmup.py")
+        
+        assert ast.unparse(module.assignments["REGISTERED_MODELS"]) == "[Project, Dataset]"
+        assert "plugins.registry.get_view_for_model(model)" in module.source
+        assert {"compile_modules", "compile_templates", "resolve_views", "prime", "warm_up"} <= module.functions
+
+    def test_modules_compiled_at_deploy_time(self, file_index, generated_project):
+        """Test that warmup byte-compiles the package into hash-based .pyc files with the deployed interpreter."""
+        module = file_index.module(generated_project / "test_plugin" / "warmup.py")
         
-        assert ready_method_found, "ready() method not found in apps.py"
+        assert "invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH" in module.source
+        assert "timed('Compiled modules', compile_modules)" in ast.unparse(module.tree)
+
+    def test_command_reports_step_timings(self, file_index, generated_project):
+        """Test that the command accepts --prime and reports every step."""
+        command = file_index.module(generated_project / "test_plugin" / "management" / "commands" / "warmup_test_plugin.py")
+        
+        assert '"--prime"' in command.source
+        assert command.imports["warmup"] == "...warmup"
+        assert "warmup.warm_up(count=prime)" in command.classes["Command"].method_source("handle")
+
+    def test_deferred_plugins_prime_the_partial(self, file_index, full_features_project):
+        """Test that priming renders the deferred partial, which holds the cached panel."""
+        module = file_index.module(full_features_project / "full_features_plugin" / "warmup.py")
+        
+        assert ast.unparse(module.assignments["REGISTERED_MODELS"]) == "[Project, Dataset, Sample, Measurement]"
+        assert "{view.partial_parameter: '1'}" in ast.unparse(module.tree)
+
+    def test_summary_command_shares_management_package(self, full_features_project):
+        """Test that the warmup and summary rebuild commands are generated side by side."""
+        commands_dir = full_features_project / "full_features_plugin" / "management" / "commands"
+        
+        assert (commands_dir / "warmup_full_features_plugin.py").exists()
+        assert (commands_dir / "rebuild_full_features_plugin_summaries.py").exists()
+
+
+class TestPluginSettings:
+    """Test the typed, startup-frozen plugin settings."""
+
+    def test_settings_declared_for_enabled_features(self, file_index, full_features_project):
+        """Test that every enabled feature declares its settings in conf.py."""
+        content = file_index.text(full_features_project / "full_features_plugin" / "conf.py")
+        
+        file_index.module(full_features_project / "full_features_plugin" / "conf.py")
+        assert "RENDER_CACHE_ENABLED: bool = True" in content
+        assert 'CACHE_ALIAS: str = "default"' in content
+        assert "CONDITIONAL_GET_ENABLED: bool = True" in content
+        assert "TASK_WORKERS: int = 4" in content
+
+    def test_settings_loaded_in_ready(self, file_index, generated_project):
+        """Test that the settings are validated when the app is ready."""
+        content = file_index.text(generated_project / "test_plugin" / "apps.py")
+        
+        file_index.module(generated_project / "test_plugin" / "apps.py")
+        assert "conf.load()" in content
+
+    def test_settings_reload_on_setting_changed(self, file_index, generated_project):
+        """Test that overridden settings are picked up in tests."""
+        content = file_index.text(generated_project / "test_plugin" / "conf.py")
+        
+        assert "@receiver(setting_changed)" in content
+        assert "setting.startswith(PREFIX)" in content
+
+    def test_call_sites_read_frozen_settings(self, file_index, full_features_project):
+        """Test that generated modules no longer look settings up per call."""
+        package_dir = full_features_project / "full_features_plugin"
+        
+        for name in ["cache.py", "tasks.py", "plugins.py"]:
+            content = file_index.text(package_dir / name)
+            assert "getattr(settings" not in content, name
+            assert "from .conf import get_settings" in content, name
+
+
+class TestImportCost:
+    """Test that importing the plugin at startup stays cheap."""
+
+    def test_feature_modules_imported_on_first_use(self, file_index, make_project):
+        """Test that exports and tasks are not imported when the plugin is registered."""
+        project_dir = make_project(plugin_category="ACTIONS", use_streaming_export="yes", use_background_tasks="yes")
+        module = file_index.module(project_dir / "test_plugin" / "plugins.py")
+        
+        assert not set(module.imports) & {"exports", "tasks"}
+        assert {"exports", "tasks"} <= set(module.local_imports)
+
+    def test_deferred_imports_explained(self, file_index, full_features_project):
+        """Test that every import made inside a method says why it is deferred."""
+        lines = file_index.text(full_features_project / "full_features_plugin" / "plugins.py").splitlines()
+        
+        deferred = [i for i, line in enumerate(lines) if line.startswith("        from . import ")]
+        assert deferred
+        for i in deferred:
+            assert lines[i - 1].strip() == "# Imported on first use so that registering the plugin stays cheap", lines[i]
+
+    def test_import_time_test_generated(self, file_index, generated_project):
+        """Test that the import-time budget test is always generated."""
+        test_file = generated_project / "tests" / "test_import_time.py"
+        content = file_index.text(test_file)
+        
+        file_index.module(test_file)
+        assert '"-X", "importtime"' in content
+        assert "get_settings().IMPORT_TIME_BUDGET" in content
+        assert "IMPORT_TIME_BUDGET: int = 100" in file_index.text(generated_project / "test_plugin" / "conf.py")
+        assert "TEST_PLUGIN_IMPORT_TIME_BUDGET = 100" in file_index.text(generated_project / "test_plugin" / "settings.py")
 
 
 class TestTemplateStructure:
@@ -149,10 +1028,10 @@ class TestTemplateStructure:
         template_path = generated_project / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
         assert template_path.exists()
 
-    def test_template_uses_bootstrap(self, generated_project):
+    def test_template_uses_bootstrap(self, file_index, generated_project):
         """Test that template uses Bootstrap classes."""
         template_file = generated_project / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
-        content = template_file.read_text()
+        content = file_index.text(template_file)
         
         # Should use Bootstrap classes
         assert 'class="' in content
@@ -160,10 +1039,10 @@ class TestTemplateStructure:
         bootstrap_present = any(cls in content for cls in ['card', 'container', 'row', 'col'])
         assert bootstrap_present, "No Bootstrap classes found in template"
 
-    def test_template_accesses_base_object(self, generated_project):
+    def test_template_accesses_base_object(self, file_index, generated_project):
         """Test that template accesses base_object variable."""
         template_file = generated_project / "test_plugin" / "templates" / "test_plugin" / "test_plugin.html"
-        content = template_file.read_text()
+        content = file_index.text(template_file)
         
         assert "base_object" in content
 
@@ -171,40 +1050,110 @@ class TestTemplateStructure:
 class TestTestSuite:
     """Test that the generated test suite is valid."""
 
-    def test_conftest_is_valid_python(self, generated_project):
+    def test_conftest_is_valid_python(self, file_index, generated_project):
         """Test that conftest.py is valid Python."""
         conftest_file = generated_project / "tests" / "conftest.py"
-        content = conftest_file.read_text()
         
         try:
-            ast.parse(content)
+            file_index.module(conftest_file)
         except SyntaxError as e:
             pytest.fail(f"tests/conftest.py has invalid Python syntax: {e}")
 
-    def test_test_apps_is_valid_python(self, generated_project):
+    def test_test_apps_is_valid_python(self, file_index, generated_project):
         """Test that test_apps.py is valid Python."""
         test_file = generated_project / "tests" / "test_apps.py"
-        content = test_file.read_text()
         
         try:
-            ast.parse(content)
+            file_index.module(test_file)
         except SyntaxError as e:
             pytest.fail(f"tests/test_apps.py has invalid Python syntax: {e}")
 
-    def test_test_plugins_is_valid_python(self, generated_project):
+    def test_test_plugins_is_valid_python(self, file_index, generated_project):
         """Test that test_plugins.py is valid Python."""
         test_file = generated_project / "tests" / "test_plugins.py"
-        content = test_file.read_text()
         
         try:
-            ast.parse(content)
+            file_index.module(test_file)
         except SyntaxError as e:
             pytest.fail(f"tests/test_plugins.py has invalid Python syntax: {e}")
 
-    def test_test_plugins_uses_parametrize(self, generated_project):
+    def test_query_budget_test_is_valid_python(self, file_index, generated_project):
+        """Test that test_queries.py is valid Python."""
+        test_file = generated_project / "tests" / "test_queries.py"
+        
+        try:
+            file_index.module(test_file)
+        except SyntaxError as e:
+            pytest.fail(f"tests/test_queries.py has invalid Python syntax: {e}")
+
+    def test_query_budget_covers_registered_models(self, file_index, generated_project):
+        """Test that a query-budget test is generated for every registered model."""
+        content = file_index.text(generated_project / "tests" / "test_queries.py")
+        
+        assert '["project", "dataset"],' in content
+        assert "django_assert_max_num_queries(get_settings().QUERY_BUDGET)" in content
+        assert "def test_deferred_content_within_query_budget(" not in content
+
+    def test_query_budget_covers_all_models_and_deferred_content(self, file_index, full_features_project):
+        """Test that all models and the deferred content get query-budget tests."""
+        content = file_index.text(full_features_project / "tests" / "test_queries.py")
+        
+        assert '["project", "dataset", "sample", "measurement"],' in content
+        assert "def test_deferred_content_within_query_budget(" in content
+
+    def test_query_budget_setting_defined(self, file_index, generated_project):
+        """Test that the query budget is configurable in settings.py."""
+        settings_file = generated_project / "test_plugin" / "settings.py"
+        
+        assert "TEST_PLUGIN_QUERY_BUDGET = 10" in file_index.text(settings_file)
+
+    def test_conftest_detects_n_plus_one(self, file_index, generated_project):
+        """Test that conftest.py ships the N+1 query detector."""
+        conftest_file = generated_project / "tests" / "conftest.py"
+        content = file_index.text(conftest_file)
+        
+        module = file_index.module(conftest_file)
+        
+        assert "QueryRecorder" in module.classes
+        assert {"detect_n_plus_one", "render_plugin", "pytest_configure"} <= module.functions
+        assert "connection.execute_wrapper" in content
+        assert "allow_duplicate_queries" in content
+
+    def test_view_fixtures_shared_through_conftest(self, file_index, full_features_project):
+        """Test that base_object, children and make_view are defined once, in conftest.py."""
+        tests_dir = full_features_project / "tests"
+        conftest = file_index.module(tests_dir / "conftest.py")
+
+        assert {"base_object", "children", "make_view"} <= conftest.functions
+        assert "def base_object(project):" in conftest.source
+        assert "return [DatasetFactory(project=base_object) for _ in range(5)]" in conftest.source
+        for test_file in sorted(tests_dir.glob("test_*.py")):
+            module = file_index.module(test_file)
+            assert not {"base_object", "children", "make_view"} & module.functions, test_file.name
+
+    def test_benchmarks_cover_registered_models_and_sizes(self, file_index, generated_project):
+        """Test that render benchmarks are generated for each model and dataset size."""
+        content = file_index.text(generated_project / "tests" / "test_benchmarks.py")
+        
+        file_index.module(generated_project / "tests" / "test_benchmarks.py")
+        assert "SIZES = [10, 1_000, 10_000]" in content
+        assert '["project", "dataset"],' in content
+        assert "benchmark(render_plugin, populated[model])" in content
+        assert "--benchmark-save=baseline" in content
+
+    def test_benchmarks_skipped_by_default(self, file_index, generated_project):
+        """Test that benchmarks only run when requested and pytest-benchmark is installed."""
+        conftest = file_index.text(generated_project / "tests" / "conftest.py")
+        pyproject = file_index.text(generated_project / "pyproject.toml")
+        
+        assert 'config.getoption("benchmark_only", default=False)' in conftest
+        assert 'pytest-benchmark = "^4.0"' in pyproject
+        assert ".benchmarks/" in file_index.text(generated_project / ".gitignore")
+
+    def test_test_plugins_uses_parametrize(self, file_index, generated_project):
         """Test that test_plugins.py uses parametrization for models."""
         test_file = generated_project / "tests" / "test_plugins.py"
-        content = test_file.read_text()
+        content = file_index.text(test_file)
         
         # Should use pytest.mark.parametrize for testing different models
         assert "@pytest.mark.parametrize" in content
@@ -0,0 +1,75 @@
+"""Test the per-file render profiler."""
+
+import json
+
+import pytest
+from cookiecutter.environment import StrictEnvironment
+
+import profile_template
+
+
+@pytest.fixture(scope="module")
+def profiler():
+    """Profile two generations of the default plugin."""
+    return profile_template.profile_template({"plugin_name": "Profiled Plugin"}, repeat=2)
+
+
+class TestCountBranches:
+    """Test counting conditional branches in template sources."""
+
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("plain text", 0),
+            ("{% if a %}x{% endif %}", 1),
+            ("{% if a %}x{% else %}y{% endif %}", 2),
+            ("{% if a %}x{% elif b %}y{% elif c %}z{% else %}w{% endif %}", 4),
+            ("{{ 'x' if a else 'y' }}", 2),
+            ("{% if a %}{% if b %}x{% endif %}{% endif %}", 2),
+        ],
+    )
+    def test_count_branches(self, source, expected):
+        """Test that every if, elif, else and inline conditional is counted."""
+        assert profile_template.count_branches(StrictEnvironment(), source) == expected
+
+
+class TestRenderProfiler:
+    """Test profiling a real generation."""
+
+    def test_every_rendered_file_is_profiled(self, profiler):
+        """Test that each file has one timing per generation and a measured output."""
+        profile = profiler.files["{{cookiecutter.plugin_slug}}/plugins.py"]
+        
+        assert len(profile.timings) == 2
+        assert profile.output_bytes > 0
+        assert profile.branches > 0
+        assert len(profiler.runs) == 2
+
+    def test_generate_file_is_restored(self, profiler):
+        """Test that instrumentation does not outlive the profiling run."""
+        import cookiecutter.generate
+
+        assert cookiecutter.generate.generate_file.__module__ == "cookiecutter.generate"
+
+    @pytest.mark.parametrize("key", list(profile_template.SORT_KEYS))
+    def test_report_is_sorted(self, profiler, key):
+        """Test that the report lists the most expensive files first."""
+        values = [profile_template.SORT_KEYS[key](profile) for profile in profiler.sorted(key)]
+        
+        assert values == sorted(values, reverse=True)
+
+    def test_json_output(self, profiler):
+        """Test that the JSON profile is serialisable and has one entry per file."""
+        data = json.loads(json.dumps(profile_template.to_json(profiler, key="branches")))
+        
+        assert len(data["files"]) == len(profiler.files)
+        assert set(data["files"][0]) == {"path", "cold_ms", "warm_ms", "output_bytes", "branches"}
+
+    def test_main_writes_report_and_json(self, tmp_path, capsys):
+        """Test the command line entry point."""
+        output = tmp_path / "profile.json"
+        exit_code = profile_template.main(["plugin_name=Cli Plugin", "--repeat", "1", "--json", str(output)])
+        
+        assert exit_code == 0
+        assert "template file" in capsys.readouterr().out
+        assert json.loads(output.read_text())["context"] == {"plugin_name": "Cli Plugin"}
@@ -0,0 +1,192 @@
+"""Test updating generated plugins to a newer template revision."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import update_plugins
+from batch_generate import TemplateRenderer
+from hooks import manifest
+
+
+def git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def template_repo(tmp_path, template_dir):
+    """Copy the template into a fresh git repository."""
+    repo = tmp_path / "template"
+    repo.mkdir()
+    for path in manifest.template_sources(template_dir):
+        if path.is_dir():
+            shutil.copytree(path, repo / path.name, ignore=shutil.ignore_patterns("__pycache__"))
+        else:
+            shutil.copy(path, repo / path.name)
+    git(repo, "init", "-q")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-qm", "Initial template")
+    return repo
+
+
+@pytest.fixture
+def plugin(tmp_path, template_repo):
+    """Generate a plugin from the first revision of the template."""
+    return TemplateRenderer(template_repo).render({"plugin_name": "Fleet Plugin"}, tmp_path / "plugins")
+
+
+def edit(path, old, new):
+    content = path.read_text()
+    assert old in content
+    path.write_text(content.replace(old, new, 1))
+
+
+def change_template(repo, relative, old, new):
+    edit(repo / "{{cookiecutter.plugin_slug}}" / relative, old, new)
+    git(repo, "commit", "-qam", f"Change {relative}")
+
+
+PLUGINS = "{{cookiecutter.plugin_slug}}/plugins.py"
+ICON = 'icon="{{ cookiecutter.icon_name }}",'
+NEW_ICON = 'icon="{{ cookiecutter.icon_name }}",  # django-easy-icons alias'
+
+
+class TestManifest:
+    """Test the manifest recorded by the post-generation hook."""
+
+    def test_manifest_records_generated_files(self, plugin, template_repo):
+        """Test that the manifest holds the revision, context and file hashes."""
+        manifest = json.loads((plugin / ".template-manifest.json").read_text())
+        plugins_file = plugin / "fleet_plugin" / "plugins.py"
+        
+        assert manifest["revision"] == update_plugins.template_revision(template_repo)
+        assert manifest["context"]["plugin_slug"] == "fleet_plugin"
+        assert manifest["templates"] == update_plugins.template_hashes(template_repo)
+        assert manifest["files"]["fleet_plugin/plugins.py"] == update_plugins.sha256(plugins_file.read_bytes())
+        assert "fleet_plugin/tasks.py" not in manifest["files"]
+
+    def test_revision_unknown_without_git(self, template_repo, monkeypatch):
+        """Test that a missing git executable leaves the revision unknown instead of failing generation."""
+        
+        def missing_git(*args, **kwargs):
+            raise FileNotFoundError("git")
+
+        monkeypatch.setattr(manifest.subprocess, "run", missing_git)
+        assert manifest.template_revision(template_repo) is None
+
+    def test_revision_of_enclosing_repository_ignored(self, tmp_path, template_repo):
+        """Test that a template inside another project's checkout records no revision."""
+        outer = tmp_path / "outer"
+        shutil.copytree(template_repo, outer / "template", ignore=shutil.ignore_patterns(".git"))
+        git(outer, "init", "-q")
+        git(outer, "add", "-A")
+        git(outer, "commit", "-qm", "Vendored template")
+        plugin = TemplateRenderer(outer / "template").render({"plugin_name": "Fleet Plugin"}, tmp_path / "plugins")
+        
+        assert manifest.template_revision(outer / "template") is None
+        assert json.loads((plugin / ".template-manifest.json").read_text())["revision"] is None
+
+    def test_manifest_ignores_files_not_rendered(self, plugin, template_repo):
+        """Test that regenerating over an existing plugin records only the template's files."""
+        (plugin / ".git").mkdir()
+        (plugin / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (plugin / "notes.txt").write_text("Local notes\n")
+        TemplateRenderer(template_repo).render({"plugin_name": "Fleet Plugin"}, plugin.parent, overwrite=True)
+        manifest = json.loads((plugin / ".template-manifest.json").read_text())
+        
+        assert "fleet_plugin/plugins.py" in manifest["files"]
+        assert not [path for path in manifest["files"] if path.startswith(".git/") or path == "notes.txt"]
+        assert ".template-manifest.json" not in manifest["files"]
+
+
+class TestUpdate:
+    """Test updating a plugin after the template changed."""
+
+    def test_unchanged_template_renders_nothing(self, plugin, template_repo, monkeypatch):
+        """Test that plugins are skipped without rendering when the template did not change."""
+        monkeypatch.setattr(update_plugins, "render_files", pytest.fail)
+        [result] = update_plugins.update_all([plugin], template_repo)
+        
+        assert result.summary() == "up to date"
+
+    def test_unmodified_file_is_replaced(self, plugin, template_repo):
+        """Test that a file the plugin never touched takes the new rendering."""
+        change_template(template_repo, PLUGINS, ICON, NEW_ICON)
+        [result] = update_plugins.update_all([plugin], template_repo)
+        
+        assert result.actions == {"fleet_plugin/plugins.py": "updated"}
+        assert "# django-easy-icons alias" in (plugin / "fleet_plugin" / "plugins.py").read_text()
+
+    def test_modified_file_is_merged(self, plugin, template_repo):
+        """Test that local and template changes to different lines are both kept."""
+        plugins_file = plugin / "fleet_plugin" / "plugins.py"
+        edit(plugins_file, "from fairdm import plugins", "from fairdm import plugins  # local change")
+        change_template(template_repo, PLUGINS, ICON, NEW_ICON)
+        [result] = update_plugins.update_all([plugin], template_repo)
+        
+        content = plugins_file.read_text()
+        assert result.actions == {"fleet_plugin/plugins.py": "merged"}
+        assert "from fairdm import plugins  # local change" in content
+        assert "# django-easy-icons alias" in content
+
+    def test_overlapping_changes_conflict(self, plugin, template_repo, capsys):
+        """Test that conflicting changes are left with conflict markers and reported."""
+        plugins_file = plugin / "fleet_plugin" / "plugins.py"
+        edit(plugins_file, 'icon="puzzle-piece",', 'icon="map",')
+        change_template(template_repo, PLUGINS, ICON, NEW_ICON)
+        
+        exit_code = update_plugins.main([str(plugin), "--template", str(template_repo)])
+        
+        assert exit_code == 1
+        assert "fleet_plugin/plugins.py: conflict (1 hunks)" in capsys.readouterr().out
+        assert "<<<<<<< plugin" in plugins_file.read_text()
+
+    def test_manifest_advances_to_new_revision(self, plugin, template_repo, monkeypatch):
+        """Test that a second update after a successful one has nothing to do."""
+        change_template(template_repo, PLUGINS, ICON, NEW_ICON)
+        update_plugins.update_all([plugin], template_repo)
+        
+        monkeypatch.setattr(update_plugins, "render_files", pytest.fail)
+        [result] = update_plugins.update_all([plugin], template_repo)
+        assert result.summary() == "up to date"
+
+    def test_disabled_feature_files_are_not_added(self, plugin, template_repo):
+        """Test that changed templates of disabled options are pruned again."""
+        change_template(template_repo, "{{cookiecutter.plugin_slug}}/tasks.py", '"""', '"""Updated. ')
+        [result] = update_plugins.update_all([plugin], template_repo)
+        
+        assert result.summary() == "up to date"
+        assert not (plugin / "fleet_plugin" / "tasks.py").exists()
+
+    def test_dry_run_writes_nothing(self, plugin, template_repo):
+        """Test that --dry-run reports changes without applying them."""
+        manifest = (plugin / ".template-manifest.json").read_text()
+        change_template(template_repo, PLUGINS, ICON, NEW_ICON)
+        [result] = update_plugins.update_all([plugin], template_repo, dry_run=True)
+        
+        assert result.actions == {"fleet_plugin/plugins.py": "updated"}
+        assert "django-easy-icons" not in (plugin / "fleet_plugin" / "plugins.py").read_text()
+        assert (plugin / ".template-manifest.json").read_text() == manifest
+
+    def test_revision_exported_without_tar_filters(self, plugin, template_repo, monkeypatch):
+        """Test that old revisions are still merged on Pythons without tarfile extraction filters."""
+        monkeypatch.delattr(update_plugins.tarfile, "data_filter")
+        plugins_file = plugin / "fleet_plugin" / "plugins.py"
+        edit(plugins_file, "from fairdm import plugins", "from fairdm import plugins  # local change")
+        change_template(template_repo, PLUGINS, ICON, NEW_ICON)
+        [result] = update_plugins.update_all([plugin], template_repo)
+        
+        assert result.actions == {"fleet_plugin/plugins.py": "merged"}
+
+    def test_plugin_without_manifest_fails(self, tmp_path, template_repo):
+        """Test that plugins generated before manifests existed are reported."""
+        [result] = update_plugins.update_all([tmp_path], template_repo)
+        
+        assert ".template-manifest.json not found" in result.error
@@ -0,0 +1,319 @@
+"""
+Update generated plugins to the current revision of the template.
+
+When a plugin is generated, hooks/post_gen_project.py records in
+``.template-manifest.json`` the template revision, the context, the hash of
+every template file and the hash of every generated file. Updating a plugin
+compares those template hashes with the current template and re-renders only
+the files whose template changed (every file if ``cookiecutter.json`` or a
+hook changed). For each re-rendered file:
+
+- if the plugin never modified it, it is replaced by the new rendering;
+- otherwise the old rendering, the plugin's version and the new rendering are
+  three-way merged with ``git merge-file``, leaving conflict markers where the
+  plugin and the template changed the same lines.
+
+Plugins whose template files did not change are skipped without rendering
+anything, so updating a fleet costs time proportional to what changed.
+
+Usage:
+    python update_plugins.py PLUGIN_DIR [PLUGIN_DIR ...] [--template DIR] [--dry-run]
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cookiecutter.find import find_template
+from cookiecutter.generate import generate_file
+from cookiecutter.hooks import run_hook_from_repo_dir
+from cookiecutter.utils import create_env_with_context, work_in
+from jinja2 import FileSystemLoader
+
+from batch_generate import TEMPLATE_DIR, TemplateRenderer
+from hooks.manifest import project_template_name, sha256, template_hashes, template_revision
+
+MANIFEST = ".template-manifest.json"
+
+
+def export_revision(template_dir, revision, destination):
+    """Extract the template at git ``revision`` into ``destination``; return False if it is unavailable."""
+    prefix = subprocess.run(
+        ["git", "-C", str(template_dir), "rev-parse", "--show-prefix"], capture_output=True, text=True, check=False
+    ).stdout.strip()
+    archive = subprocess.run(
+        ["git", "-C", str(template_dir), "archive", "--format=tar", f"{revision}:{prefix}"],
+        capture_output=True,
+        check=False,
+    )
+    if archive.returncode != 0:
+        return False
+    with tarfile.open(fileobj=io.BytesIO(archive.stdout)) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(destination, filter="data")
+        else:
+            # Python < 3.11.4 has no extraction filters. The template holds only
+            # regular files and directories, so refuse links and anything that
+            # would land outside destination
+            tar.extractall(destination, members=safe_members(tar, destination))
+    return True
+
+
+def safe_members(tar, destination):
+    """Return the members of ``tar``, raising ValueError for any that could escape ``destination``."""
+    destination = Path(destination).resolve()
+    members = tar.getmembers()
+    for member in members:
+        target = (destination / member.name).resolve()
+        if not (member.isfile() or member.isdir()) or not target.is_relative_to(destination):
+            raise ValueError(f"Refusing to extract {member.name!r} from the template archive")
+    return members
+
+
+def render_files(renderer, extra_context, infiles, output_dir):
+    """
+    Render only ``infiles`` of the project template into ``output_dir``.
+
+    ``infiles`` are relative to the project template directory. The
+    post-generation hook runs afterwards, so files the options do not need are
+    pruned exactly as in a full generation. Returns ``{path: bytes}`` of the
+    rendered files, relative to the project directory.
+    """
+    context = renderer.build_context(extra_context, output_dir)
+    env = create_env_with_context(context)
+    env.bytecode_cache = renderer.bytecode_cache
+    project_template = find_template(renderer.template_dir, env)
+    project_dir = Path(output_dir) / env.from_string(project_template.name).render(**context)
+    project_dir.mkdir(parents=True)
+
+    with work_in(project_template):
+        env.loader = FileSystemLoader([".", "../templates"])
+        for infile in infiles:
+            (project_dir / env.from_string(infile).render(**context)).parent.mkdir(parents=True, exist_ok=True)
+            generate_file(str(project_dir), infile, context, env)
+    run_hook_from_repo_dir(str(renderer.template_dir), "post_gen_project", str(project_dir), context, False)
+
+    return {
+        path.relative_to(project_dir).as_posix(): path.read_bytes()
+        for path in project_dir.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts and path.name != MANIFEST
+    }
+
+
+def output_paths(renderer, extra_context, infiles):
+    """Return ``{output path: infile}`` for ``infiles`` without rendering their contents."""
+    context = renderer.build_context(extra_context)
+    env = create_env_with_context(context)
+    return {env.from_string(infile).render(**context): infile for infile in infiles}
+
+
+def merge(ours, base, theirs, labels):
+    """Three-way merge three versions of a file; return ``(merged bytes, number of conflicts)``."""
+    with tempfile.TemporaryDirectory(prefix="merge-") as tmp:
+        paths = []
+        for name, data in [("ours", ours), ("base", base), ("theirs", theirs)]:
+            path = Path(tmp) / name
+            path.write_bytes(data)
+            paths.append(str(path))
+        label_args = [arg for label in labels for arg in ("-L", label)]
+        result = subprocess.run(["git", "merge-file", "-p", *label_args, *paths], capture_output=True, check=False)
+    if result.returncode < 0:
+        raise RuntimeError(result.stderr.decode())
+    return result.stdout, result.returncode
+
+
+@dataclass
+class Update:
+    """Outcome of updating one plugin."""
+
+    plugin_dir: Path
+    actions: dict = field(default_factory=dict)
+    error: str = ""
+
+    @property
+    def conflicts(self):
+        return sorted(path for path, action in self.actions.items() if action.startswith("conflict"))
+
+    def summary(self):
+        if self.error:
+            return f"FAILED {self.error}"
+        if not self.actions:
+            return "up to date"
+        counts = {}
+        for action in self.actions.values():
+            kind = action.split(" ", 1)[0]
+            counts[kind] = counts.get(kind, 0) + 1
+        return ", ".join(f"{count} {kind}" for kind, count in sorted(counts.items()))
+
+
+class PluginUpdater:
+    """Update plugins to the current template, sharing template state across a fleet."""
+
+    def __init__(self, template_dir=TEMPLATE_DIR, dry_run=False):
+        self.template_dir = Path(template_dir).resolve()
+        self.dry_run = dry_run
+        self.renderer = TemplateRenderer(self.template_dir)
+        self.prefix = project_template_name(self.template_dir) + "/"
+        self.hashes = template_hashes(self.template_dir)
+        self.revision = template_revision(self.template_dir)
+        self.workdir = tempfile.TemporaryDirectory(prefix="update-")
+        self.old_renderers = {}
+
+    def close(self):
+        self.workdir.cleanup()
+
+    def old_renderer(self, revision):
+        """Return a renderer for the template at ``revision``, or None if it cannot be checked out."""
+        if revision not in self.old_renderers:
+            destination = Path(self.workdir.name) / "revisions" / revision
+            destination.mkdir(parents=True)
+            exported = revision is not None and export_revision(self.template_dir, revision, destination)
+            self.old_renderers[revision] = (destination, TemplateRenderer(destination) if exported else None)
+        return self.old_renderers[revision]
+
+    def changed_infiles(self, recorded):
+        """Return the project template files whose source changed since ``recorded``, and those removed."""
+        changed = {path for path in self.hashes.keys() | recorded.keys() if self.hashes.get(path) != recorded.get(path)}
+        if any(not path.startswith(self.prefix) for path in changed):
+            # cookiecutter.json and the hooks can change any generated file
+            changed = {path for path in self.hashes.keys() | recorded.keys() if path.startswith(self.prefix)}
+        current = sorted(path.removeprefix(self.prefix) for path in changed if path in self.hashes)
+        removed = sorted(path.removeprefix(self.prefix) for path in changed if path not in self.hashes)
+        return current, removed
+
+    def base_versions(self, manifest, paths, infiles):
+        """Return the old rendering of ``paths`` from the recorded revision, if it can be reproduced."""
+        destination, renderer = self.old_renderer(manifest.get("revision"))
+        if renderer is None:
+            return {}
+        # Only files whose template at that revision matches the recorded hash render the original
+        old_hashes = template_hashes(destination)
+        reproducible = [
+            infiles[path]
+            for path in paths
+            if old_hashes.get(self.prefix + infiles[path]) == manifest["templates"].get(self.prefix + infiles[path])
+        ]
+        if not reproducible:
+            return {}
+        output_dir = Path(tempfile.mkdtemp(dir=self.workdir.name))
+        rendered = render_files(renderer, manifest["context"], reproducible, output_dir)
+        return {path: rendered.get(path) for path in paths if infiles[path] in reproducible}
+
+    def update(self, plugin_dir):
+        """Update the plugin in ``plugin_dir`` and return an Update."""
+        plugin_dir = Path(plugin_dir)
+        result = Update(plugin_dir)
+        manifest_file = plugin_dir / MANIFEST
+        if not manifest_file.exists():
+            result.error = f"{MANIFEST} not found; regenerate the plugin once to create it"
+            return result
+        manifest = json.loads(manifest_file.read_text())
+
+        current, removed = self.changed_infiles(manifest["templates"])
+        if not current and not removed:
+            return result
+
+        output_dir = Path(tempfile.mkdtemp(dir=self.workdir.name))
+        theirs = render_files(self.renderer, manifest["context"], current, output_dir)
+        infiles = output_paths(self.renderer, manifest["context"], current)
+        removed_paths = output_paths(self.renderer, manifest["context"], removed)
+        infiles.update(removed_paths)
+        recorded = manifest["files"]
+
+        needs_merge = []
+        for path in sorted(set(theirs) | set(removed_paths)):
+            new = theirs.get(path)
+            new_hash = sha256(new) if new is not None else None
+            if new_hash == recorded.get(path):
+                continue
+            target = plugin_dir / path
+            ours_hash = sha256(target.read_bytes()) if target.exists() else None
+            if ours_hash == recorded.get(path):
+                result.actions[path] = "removed" if new is None else "updated" if ours_hash else "added"
+                self.write(target, new)
+            else:
+                needs_merge.append(path)
+
+        bases = self.base_versions(manifest, needs_merge, infiles) if needs_merge else {}
+        labels = ["plugin", f"template {manifest.get('revision') or 'unknown'}", f"template {self.revision or 'current'}"]
+        for path in needs_merge:
+            target = plugin_dir / path
+            new = theirs.get(path)
+            if new is None:
+                result.actions[path] = "kept (modified here, removed from the template)"
+            elif not target.exists():
+                result.actions[path] = "kept (deleted here)"
+            elif path not in bases or bases[path] is None:
+                result.actions[path] = f"conflict (no common base; new version in {path}.template-new)"
+                self.write(plugin_dir / f"{path}.template-new", new)
+            else:
+                merged, conflicts = merge(target.read_bytes(), bases[path], new, labels)
+                result.actions[path] = f"conflict ({conflicts} hunks)" if conflicts else "merged"
+                self.write(target, merged)
+
+        if not self.dry_run:
+            files = dict(recorded)
+            for path in set(theirs) | set(removed_paths):
+                if path in theirs:
+                    files[path] = sha256(theirs[path])
+                else:
+                    files.pop(path, None)
+            manifest.update(revision=self.revision, templates=self.hashes, files=files)
+            manifest_file.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+        return result
+
+    def write(self, target, data):
+        """Write ``data`` to ``target``, or delete it when ``data`` is None."""
+        if self.dry_run:
+            return
+        if data is None:
+            target.unlink(missing_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+
+
+def update_all(plugin_dirs, template_dir=TEMPLATE_DIR, dry_run=False):
+    """Update every plugin in ``plugin_dirs`` and return their Updates in order."""
+    updater = PluginUpdater(template_dir, dry_run=dry_run)
+    try:
+        results = []
+        for plugin_dir in plugin_dirs:
+            try:
+                results.append(updater.update(plugin_dir))
+            except Exception as e:
+                results.append(Update(Path(plugin_dir), error=f"{type(e).__name__}: {e}"))
+        return results
+    finally:
+        updater.close()
+
+
+def format_summary(results):
+    """Return a per-plugin summary with the files that need attention."""
+    lines = []
+    for result in results:
+        lines.append(f"{result.plugin_dir}: {result.summary()}")
+        lines.extend(f"  {path}: {result.actions[path]}" for path in result.conflicts)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("plugin_dirs", nargs="+", type=Path, help="generated plugin directories")
+    parser.add_argument("--template", type=Path, default=TEMPLATE_DIR, help="template directory (a git checkout)")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args(argv)
+
+    results = update_all(args.plugin_dirs, args.template, dry_run=args.dry_run)
+    print(format_summary(results))
+    return 0 if not any(result.error or result.conflicts for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,14 @@ Pytest configuration and fixtures for {{ cookiecutter.plugin_name }} tests.
 
 This file contains reusable pytest fixtures that can be used across all test files.
 """
+{%- set models = ["project" if cookiecutter.register_to_models__project == "yes" else "", "dataset" if cookiecutter.register_to_models__dataset == "yes" else "", "sample" if cookiecutter.register_to_models__sample == "yes" else "", "measurement" if cookiecutter.register_to_models__measurement == "yes" else ""] | select | list %}
+{%- set child_factory, child_field = {"project": ("DatasetFactory", "project"), "dataset": ("SampleFactory", "dataset"), "sample": ("MeasurementFactory", "sample")}.get(models[0], ("", "")) %}
+
+from collections import Counter
+from contextlib import contextmanager
 
 import pytest
+from django.db import connection
 from fairdm.factories import (
     DatasetFactory,
     MeasurementFactory,
@@ -13,8 +19,111 @@ from fairdm.factories import (
     UserFactory,
 )
 
+{% if cookiecutter.use_waffle == "yes" %}from {{ cookiecutter.plugin_slug }} import flags
+{% endif %}from {{ cookiecutter.plugin_slug }}.plugins import {{ cookiecutter.plugin_class_name }}
 
-@pytest.fixture
+
+def pytest_configure(config):
+    """Register the markers used by the N+1 query detector."""
+    config.addinivalue_line(
+        "markers",
+        "allow_duplicate_queries: do not fail the test when a plugin render repeats a query",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they are requested with --benchmark-only."""
+    if config.getoption("benchmark_only", default=False):
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+class QueryRecorder:
+    """
+    Record the SQL executed while a plugin view renders.
+
+    Queries are grouped by their SQL text before parameters are bound, so
+    ``SELECT ... WHERE id = %s`` run once per row shows up as a single
+    statement executed many times - the signature of an N+1 query.
+    """
+
+    def __init__(self):
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.statements[sql] += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def record(self):
+        """Record every query executed inside the block."""
+        with connection.execute_wrapper(self):
+            yield
+
+    def duplicates(self):
+        """Return the statements that were executed more than once."""
+        return {sql: count for sql, count in self.statements.items() if count > 1}
+
+    def check(self):
+        """Fail the current test if any statement was repeated, then start over."""
+        duplicates = self.duplicates()
+        self.statements.clear()
+        if duplicates:
+            report = "\n".join(f"  {count}x {sql}" for sql, count in duplicates.items())
+            pytest.fail(
+                "Plugin render ran the same query more than once (N+1):\n"
+                f"{report}\n"
+                "Use select_related()/prefetch_related(), or mark the test with "
+                "@pytest.mark.allow_duplicate_queries if this is intended."
+            )
+
+
+@pytest.fixture(autouse=True)
+def detect_n_plus_one(request, monkeypatch):
+    """Fail any test whose plugin render runs the same SQL more than once."""
+    if request.node.get_closest_marker("allow_duplicate_queries"):
+        yield None
+        return
+
+    recorder = QueryRecorder()
+    get_context_data = {{ cookiecutter.plugin_class_name }}.get_context_data
+    render_to_response = {{ cookiecutter.plugin_class_name }}.render_to_response
+
+    def recorded_get_context_data(self, **kwargs):
+        with recorder.record():
+            return get_context_data(self, **kwargs)
+
+    def recorded_render_to_response(self, context, **response_kwargs):
+        response = render_to_response(self, context, **response_kwargs)
+        with recorder.record():
+            response.render()
+        recorder.check()
+        return response
+
+    monkeypatch.setattr({{ cookiecutter.plugin_class_name }}, "get_context_data", recorded_get_context_data)
+    monkeypatch.setattr({{ cookiecutter.plugin_class_name }}, "render_to_response", recorded_render_to_response)
+    yield recorder
+
+
+{% if cookiecutter.use_waffle == "yes" %}@pytest.fixture(autouse=True)
+def enable_feature_flags(settings):
+    """
+    Show the plugin unless a test creates its feature flag.
+
+    Flags that do not exist are treated as active, and the flags held by the
+    process are dropped so that no test sees the flags of another.
+    """
+    settings.WAFFLE_FLAG_DEFAULT = True
+    flags.invalidate()
+    yield
+    flags.invalidate()
+
+
+{% endif %}@pytest.fixture
 def user():
     """Create a test user."""
     return UserFactory()
@@ -44,6 +153,56 @@ def measurement(sample):
     return MeasurementFactory(sample=sample)
 
 
+@pytest.fixture
+def base_object({{ models[0] }}):
+    """Return an object of the first model the plugin is registered to."""
+    return {{ models[0] }}
+
+{% if child_factory %}
+@pytest.fixture
+def children(base_object):
+    """Create five child objects of base_object, in the order they are listed."""
+    return [{{ child_factory }}({{ child_field }}=base_object) for _ in range(5)]
+
+{% endif %}
+@pytest.fixture
+def make_view(rf, user):
+    """
+    Return a function that builds the plugin view for a model instance.
+
+    The request is made by ``user`` unless ``request_user`` is given. Extra
+    keyword arguments are passed as request headers, e.g. HTTP_IF_NONE_MATCH.
+    """
+
+    def make(base_object, method="get", params=None, request_user=None, **headers):
+        request = getattr(rf, method)("/", params, **headers)
+        request.user = request_user or user
+
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.setup(request)
+        view.base_object = base_object
+        return view
+
+    return make
+
+
+@pytest.fixture
+def render_plugin(make_view):
+    """
+    Return a function that fully renders the plugin for a model instance.
+
+    Extra keyword arguments are passed as GET parameters.
+    """
+
+    def render(base_object, **params):
+        view = make_view(base_object, params=params)
+        view.base_object = view.get_base_object()
+
+        return view.render_to_response(view.get_context_data())
+
+    return render
+
+
 # Add your plugin-specific fixtures here
 # Example:
 # @pytest.fixture
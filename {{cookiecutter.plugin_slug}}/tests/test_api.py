@@ -0,0 +1,70 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} JSON API.
+"""
+
+import json
+
+import pytest
+from django.core.exceptions import BadRequest
+
+from {{ cookiecutter.plugin_slug }}.api import FIELDS
+from {{ cookiecutter.plugin_slug }}.pagination import get_children
+
+
+@pytest.fixture
+def get_json(make_view):
+    """Return a function that requests ?format=json for a model instance and decodes the response."""
+
+    def get(base_object, **params):
+        view = make_view(base_object, params={"format": "json", **params})
+        response = view.get(view.request)
+        assert response["Content-Type"] == "application/json"
+        return json.loads(response.content)
+
+    return get
+
+
+@pytest.mark.django_db
+class TestJsonApi:
+    """Tests for the read-only JSON endpoint of the plugin."""
+
+    def test_default_fields(self, base_object, children, get_json):
+        """Test that every child is returned with the default fields."""
+        data = get_json(base_object)
+        fields = FIELDS[get_children(base_object).model]
+
+        assert [row["id"] for row in data["results"]] == [child.pk for child in children]
+        assert all(set(row) == set(fields) for row in data["results"])
+        assert data["next_cursor"] is None
+
+    def test_field_selection(self, base_object, children, get_json):
+        """Test that ?fields= limits each row to the selected fields."""
+        data = get_json(base_object, fields="name")
+
+        assert data["results"] == [{"name": child.name} for child in children]
+
+    def test_unknown_field_is_rejected(self, base_object, get_json):
+        """Test that fields outside FIELDS cannot be requested."""
+        with pytest.raises(BadRequest):
+            get_json(base_object, fields="name,password")
+
+    def test_cursor_pagination(self, base_object, children, get_json):
+        """Test that following next_cursor returns every child once."""
+        pages = [get_json(base_object, limit="2")]
+        while pages[-1]["next_cursor"]:
+            assert "format=json" in pages[-1]["next"]
+            pages.append(get_json(base_object, limit="2", cursor=pages[-1]["next_cursor"]))
+
+        assert [row["id"] for page in pages for row in page["results"]] == [child.pk for child in children]
+        assert len(pages) == 3
+
+    @pytest.mark.parametrize("params", [{"limit": "0"}, {"limit": "100000"}, {"limit": "x"}, {"cursor": "not base64!"}])
+    def test_invalid_parameters_are_rejected(self, base_object, get_json, params):
+        """Test that bad limits and cursors are answered with 400 Bad Request."""
+        with pytest.raises(BadRequest):
+            get_json(base_object, **params)
+
+    def test_page_is_one_query(self, base_object, children, get_json, django_assert_num_queries):
+        """Test that a page is read with a single values() query and no template is rendered."""
+        with django_assert_num_queries(1):
+            get_json(base_object)
@@ -0,0 +1,140 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} static asset bundle.
+"""
+
+import gzip
+import json
+import re
+
+import pytest
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+from {{ cookiecutter.plugin_slug }} import assets
+from {{ cookiecutter.plugin_slug }}.templatetags import {{ cookiecutter.plugin_slug }}_assets as tags
+
+HASHED_NAME = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{12}(?P<suffix>\.\w+)$")
+
+
+@pytest.fixture(autouse=True)
+def static_storage(settings):
+    """Serve static files without the project's own manifest, which has no test entries."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Return a source tree with one stylesheet, one script and one image."""
+    source = tmp_path / "src"
+    (source / "css").mkdir(parents=True)
+    (source / "js").mkdir()
+    (source / "css" / "plugin.css").write_text(".plugin { color: red; }\n" * 50)
+    (source / "js" / "plugin.js").write_text("console.log('plugin');\n" * 50)
+    (source / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    return source
+
+
+@pytest.fixture
+def bundle(source_dir, tmp_path):
+    """Build the source tree and return the output directory and its manifest paths."""
+    output_dir = tmp_path / "dist"
+    return output_dir, assets.build(source_dir, output_dir)
+
+
+@pytest.fixture
+def built_storage(bundle, monkeypatch):
+    """Make the template tag read the manifest of the test bundle."""
+    output_dir, _ = bundle
+    storage = ManifestStaticFilesStorage(location=output_dir)
+    monkeypatch.setattr(tags, "get_manifest_storage", lambda: storage)
+    return storage
+
+
+class TestBuild:
+    """Test the fingerprinted, precompressed build."""
+
+    def test_every_source_gets_a_hashed_copy(self, source_dir, bundle):
+        output_dir, paths = bundle
+
+        assert set(paths) == {"css/plugin.css", "js/plugin.js", "logo.png"}
+        for name, hashed in paths.items():
+            match = HASHED_NAME.match(hashed)
+            assert match and f"{match['stem']}{match['suffix']}" == name
+            assert (output_dir / hashed).read_bytes() == (source_dir / name).read_bytes()
+
+    def test_hash_changes_with_content(self, source_dir, tmp_path, bundle):
+        _, paths = bundle
+        (source_dir / "js" / "plugin.js").write_text("console.log('changed');\n")
+
+        rebuilt = assets.build(source_dir, tmp_path / "dist")
+
+        assert rebuilt["js/plugin.js"] != paths["js/plugin.js"]
+        assert rebuilt["css/plugin.css"] == paths["css/plugin.css"]
+        assert not (tmp_path / "dist" / paths["js/plugin.js"]).exists()
+
+    def test_text_assets_are_precompressed(self, source_dir, bundle):
+        output_dir, paths = bundle
+        compressed = output_dir / (paths["css/plugin.css"] + ".gz")
+
+        assert gzip.decompress(compressed.read_bytes()) == (source_dir / "css" / "plugin.css").read_bytes()
+        assert not (output_dir / (paths["logo.png"] + ".gz")).exists()
+
+    def test_brotli_siblings(self, source_dir, bundle):
+        brotli = pytest.importorskip("brotli")
+        output_dir, paths = bundle
+        compressed = output_dir / (paths["js/plugin.js"] + ".br")
+
+        assert brotli.decompress(compressed.read_bytes()) == (source_dir / "js" / "plugin.js").read_bytes()
+
+    def test_build_is_reproducible(self, source_dir, tmp_path, bundle):
+        output_dir, paths = bundle
+        first = (output_dir / (paths["js/plugin.js"] + ".gz")).read_bytes()
+
+        assets.build(source_dir, output_dir)
+
+        assert (output_dir / (paths["js/plugin.js"] + ".gz")).read_bytes() == first
+
+    def test_manifest_is_read_by_manifest_storage(self, bundle, built_storage):
+        output_dir, paths = bundle
+        manifest = json.loads((output_dir / assets.MANIFEST_NAME).read_text())
+
+        assert manifest["version"] == assets.MANIFEST_VERSION
+        assert built_storage.stored_name("js/plugin.js") == paths["js/plugin.js"]
+
+    def test_plugin_assets_are_bundled(self, tmp_path):
+        paths = assets.build(assets.SOURCE_DIR, tmp_path / "dist")
+
+        assert "css/{{ cookiecutter.plugin_slug }}.css" in paths
+        assert "js/{{ cookiecutter.plugin_slug }}.js" in paths
+
+
+class TestPluginAssetTag:
+    """Test that the template tag serves the hashed copies outside DEBUG."""
+
+    def test_hashed_url_outside_debug(self, settings, bundle, built_storage):
+        _, paths = bundle
+        settings.DEBUG = False
+
+        url = tags.plugin_asset("js/plugin.js")
+
+        assert url.endswith(f"{{ cookiecutter.plugin_slug }}/dist/{paths['js/plugin.js']}")
+
+    def test_source_url_in_debug(self, settings, built_storage):
+        settings.DEBUG = True
+
+        assert tags.plugin_asset("js/plugin.js").endswith("{{ cookiecutter.plugin_slug }}/js/plugin.js")
+
+    def test_source_url_for_unbuilt_assets(self, settings, built_storage):
+        settings.DEBUG = False
+
+        assert tags.plugin_asset("js/new.js").endswith("{{ cookiecutter.plugin_slug }}/js/new.js")
+
+    def test_source_url_before_first_build(self, settings, monkeypatch):
+        settings.DEBUG = False
+        monkeypatch.setattr(tags, "get_manifest_storage", lambda: None)
+
+        url = tags.plugin_asset("css/{{ cookiecutter.plugin_slug }}.css")
+
+        assert url.endswith("{{ cookiecutter.plugin_slug }}/css/{{ cookiecutter.plugin_slug }}.css")
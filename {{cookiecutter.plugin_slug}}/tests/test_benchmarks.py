@@ -0,0 +1,65 @@
+{% set model_fixtures = ["project" if cookiecutter.register_to_models__project == "yes" else "", "dataset" if cookiecutter.register_to_models__dataset == "yes" else "", "sample" if cookiecutter.register_to_models__sample == "yes" else "", "measurement" if cookiecutter.register_to_models__measurement == "yes" else ""] | select | list -%}
+"""
+Rendering benchmarks for {{ cookiecutter.plugin_name }}.
+
+Each registered model is rendered against a dataset of 10, 1,000 and 10,000
+samples. Benchmarks are skipped in normal test runs; run them and save a
+baseline with:
+
+    poetry run pytest tests/test_benchmarks.py --benchmark-only --benchmark-save=baseline
+
+and compare later runs against the saved baseline with:
+
+    poetry run pytest tests/test_benchmarks.py --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Results are stored as JSON in ``.benchmarks/``.
+"""
+
+import pytest
+from django.db import transaction
+from fairdm.factories import (
+    DatasetFactory,
+    MeasurementFactory,
+    ProjectFactory,
+    SampleFactory,
+)
+
+SIZES = [10, 1_000, 10_000]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}-samples")
+def populated(request, django_db_setup, django_db_blocker):
+    """
+    Create a dataset with the given number of samples, shared by every benchmark.
+
+    The objects are created once per size inside a transaction that is rolled
+    back when the module has finished, so the test database stays clean.
+    """
+    with django_db_blocker.unblock(), transaction.atomic():
+        project = ProjectFactory()
+        dataset = DatasetFactory(project=project)
+        samples = SampleFactory.create_batch(request.param, dataset=dataset)
+        measurement = MeasurementFactory(sample=samples[0])
+
+        yield {
+            "size": request.param,
+            "project": project,
+            "dataset": dataset,
+            "sample": samples[0],
+            "measurement": measurement,
+        }
+        transaction.set_rollback(True)
+
+
+@pytest.mark.django_db
+@pytest.mark.allow_duplicate_queries
+@pytest.mark.parametrize(
+    "model",
+    [{% for name in model_fixtures %}"{{ name }}"{% if not loop.last %}, {% endif %}{% endfor %}],
+)
+def test_render_benchmark(benchmark, populated, model, render_plugin):
+    """Benchmark a full render of the plugin for a registered model."""
+    benchmark.extra_info["samples"] = populated["size"]
+
+    response = benchmark(render_plugin, populated[model])
+    assert response.status_code == 200
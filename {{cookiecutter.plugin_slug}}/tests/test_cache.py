@@ -0,0 +1,58 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} rendered-panel cache.
+"""
+
+import pytest
+from django.apps import apps
+
+from {{ cookiecutter.plugin_slug }} import cache
+
+APP_LABEL = "{{ cookiecutter.plugin_slug }}"
+
+
+@pytest.fixture
+def subtype(base_object):
+    """Return a proxy subclass of the model of base_object, saved with itself as the signal sender."""
+    model = type(base_object)
+    name = f"{model.__name__}Subtype"
+    try:
+        return apps.get_model(APP_LABEL, name)
+    except LookupError:
+        meta = type("Meta", (), {"proxy": True, "app_label": APP_LABEL})
+        return type(name, (model,), {"Meta": meta, "__module__": __name__})
+
+
+@pytest.mark.django_db
+class TestPanelCache:
+    """Tests for panel cache keys and their invalidation."""
+
+    def test_panel_key_is_stable(self, base_object):
+        """Test that the panel key does not change while the object is untouched."""
+        assert cache.get_panel_key(base_object) == cache.get_panel_key(base_object)
+
+    def test_panel_key_identifies_object(self, base_object):
+        """Test that the panel key includes the model and primary key."""
+        key = cache.get_panel_key(base_object)
+        assert key.startswith(f"{base_object._meta.label_lower}:{base_object.pk}:")
+
+    def test_save_invalidates_panel(self, base_object):
+        """Test that saving the object retires its cached panel."""
+        key = cache.get_panel_key(base_object)
+        base_object.save()
+        assert cache.get_panel_key(base_object) != key
+
+    def test_delete_invalidates_panel(self, base_object):
+        """Test that deleting the object retires its cached panel."""
+        key = cache.get_panel_key(base_object)
+        pk = base_object.pk
+        base_object.delete()
+        base_object.pk = pk
+        assert cache.get_panel_key(base_object) != key
+
+    def test_subclass_save_invalidates_panel(self, base_object, subtype):
+        """Test that saving the object through a subclass retires its cached panel."""
+        # Connect again, as ready() would with the subclass defined in an installed app
+        apps.get_app_config(APP_LABEL).connect_cache_signals()
+        key = cache.get_panel_key(base_object)
+        subtype.objects.get(pk=base_object.pk).save()
+        assert cache.get_panel_key(base_object) != key
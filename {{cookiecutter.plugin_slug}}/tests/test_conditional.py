@@ -0,0 +1,139 @@
+"""
+Tests for conditional GET support in {{ cookiecutter.plugin_name }}.
+"""
+{%- set child_listing = cookiecutter.use_child_listing == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+{%- set summary_store = cookiecutter.use_summary_store == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset) %}
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from fairdm.factories import UserFactory
+
+from {{ cookiecutter.plugin_slug }} import plugins as plugin_module
+
+
+@pytest.mark.django_db
+class TestETag:
+    """Tests for the ETag of the plugin page."""
+
+    def test_etag_is_stable(self, make_view, base_object):
+        """Test that the same user sees the same ETag for an unchanged object."""
+        etag = make_view(base_object).get_etag()
+
+        assert etag
+        assert make_view(base_object).get_etag() == etag
+
+    def test_etag_changes_when_object_is_modified(self, make_view, base_object):
+        """Test that modifying base_object invalidates the ETag."""
+        etag = make_view(base_object).get_etag()
+        base_object.modified += timedelta(seconds=1)
+
+        assert make_view(base_object).get_etag() != etag
+
+    def test_etag_changes_with_plugin_version(self, make_view, base_object, monkeypatch):
+        """Test that upgrading the plugin invalidates the ETag."""
+        etag = make_view(base_object).get_etag()
+        monkeypatch.setattr(plugin_module, "__version__", "99.0.0")
+
+        assert make_view(base_object).get_etag() != etag
+
+    def test_etag_depends_on_user(self, make_view, base_object):
+        """Test that users with a different permission scope get different ETags."""
+        etag = make_view(base_object).get_etag()
+
+        assert make_view(base_object, request_user=UserFactory()).get_etag() != etag
+        assert make_view(base_object, request_user=AnonymousUser()).get_etag() != etag
+
+{%- if summary_store %}
+
+    def test_etag_changes_with_summary(self, request, make_view, base_object):
+        """Test that the stored counts shown on the page invalidate the ETag when they change."""
+        etag = make_view(base_object).get_etag()
+        # Creates a sample and a measurement below base_object
+        request.getfixturevalue("measurement")
+
+        assert make_view(base_object).get_etag() != etag
+{%- endif %}
+
+    def test_no_etag_without_modification_time(self, make_view, base_object):
+        """Test that conditional GET is skipped when the object has no timestamp."""
+        view = make_view(base_object)
+        view.last_modified_field = None
+
+        assert view.get_etag() is None
+        assert view.get_last_modified() is None
+
+
+@pytest.mark.django_db
+class TestConditionalDispatch:
+    """Tests for 304 responses and cache headers."""
+
+    def test_matching_etag_returns_not_modified(self, make_view, base_object):
+        """Test that a current client copy is answered with 304 without rendering."""
+        etag = make_view(base_object).get_etag()
+        view = make_view(base_object, HTTP_IF_NONE_MATCH=f'"{etag}"')
+
+        response = view.dispatch(view.request)
+        assert response.status_code == 304
+        assert response["ETag"] == f'"{etag}"'
+
+    def test_not_modified_response_has_cache_headers(self, make_view, base_object):
+        """Test that responses are private, revalidated and vary on the session cookie."""
+        etag = make_view(base_object).get_etag()
+        view = make_view(base_object, HTTP_IF_NONE_MATCH=f'"{etag}"')
+
+        response = view.dispatch(view.request)
+        assert "private" in response["Cache-Control"]
+        assert "no-cache" in response["Cache-Control"]
+        assert "Cookie" in response["Vary"]
+{%- if child_listing %}
+
+
+@pytest.mark.django_db
+class TestChildListing:
+    """Tests that the child listing is never answered from a stale copy."""
+
+    def get(self, make_view, base_object, etag=None, **params):
+        """Dispatch a GET request, revalidating ``etag`` if given."""
+        headers = {"HTTP_IF_NONE_MATCH": f'"{etag}"'} if etag else {}
+        view = make_view(base_object, params=params, **headers)
+        return view.dispatch(view.request)
+
+    @pytest.mark.parametrize("params", [{% if cookiecutter.use_deferred_content == "yes" %}{"partial": "1"}{% else %}{}{% endif %}, {"listing": "1"}])
+    def test_edited_child_is_rendered(self, make_view, base_object, children, params):
+        """Test that editing a child answers 200 with the new rows, though base_object is unchanged."""
+        etag = make_view(base_object, params=params).get_etag()
+        child = children[0]
+        child.name = "Renamed child"
+        child.save()
+
+        response = self.get(make_view, base_object, etag, **params)
+        assert response.status_code == 200
+        assert response["ETag"] != f'"{etag}"'
+        assert str(child) in response.content.decode()
+
+    def test_added_and_removed_children_change_etag(self, request, make_view, base_object):
+        """Test that adding or removing a child changes the ETag."""
+        etag = make_view(base_object).get_etag()
+        children = request.getfixturevalue("children")
+        added = make_view(base_object).get_etag()
+        children[0].delete()
+
+        assert added != etag
+        assert make_view(base_object).get_etag() not in (etag, added)
+
+    def test_etag_differs_per_page(self, make_view, base_object, children):
+        """Test that the page, the listing rows and each cursor get their own ETag."""
+        etags = {
+            make_view(base_object).get_etag(),
+            make_view(base_object, params={"listing": "1"}).get_etag(),
+            make_view(base_object, params={"listing": "1", "cursor": "WzFd"}).get_etag(),
+        }
+        assert len(etags) == 3
+
+    def test_current_listing_is_not_modified(self, make_view, base_object, children):
+        """Test that an unchanged listing is still answered with 304."""
+        etag = make_view(base_object, params={"listing": "1"}).get_etag()
+        assert self.get(make_view, base_object, etag, listing="1").status_code == 304
+{%- endif %}
@@ -0,0 +1,56 @@
+"""
+Tests for {{ cookiecutter.plugin_name }} settings.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from {{ cookiecutter.plugin_slug }} import conf
+
+
+class TestPluginSettings:
+    """Tests for loading, validating and reloading the plugin settings."""
+
+    def test_settings_are_typed_attributes(self):
+        """Test that settings are read as attributes of the declared type."""
+        plugin_settings = conf.get_settings()
+
+        assert isinstance(plugin_settings.QUERY_BUDGET, int)
+        assert plugin_settings.QUERY_BUDGET >= 1
+
+    def test_settings_are_frozen(self):
+        """Test that the loaded settings cannot be changed at runtime."""
+        with pytest.raises(FrozenInstanceError):
+            conf.get_settings().QUERY_BUDGET = 100
+
+    def test_settings_are_cached(self):
+        """Test that repeated reads return the same instance."""
+        assert conf.get_settings() is conf.get_settings()
+
+    def test_override_reloads_settings(self, settings):
+        """Test that overriding a setting is picked up via setting_changed."""
+        settings.{{ cookiecutter.plugin_slug.upper() }}_QUERY_BUDGET = 42
+
+        assert conf.get_settings().QUERY_BUDGET == 42
+
+    def test_override_is_undone(self):
+        """Test that the settings are reloaded again when an override ends."""
+        default = conf.get_settings().QUERY_BUDGET
+        with override_settings({{ cookiecutter.plugin_slug.upper() }}_QUERY_BUDGET=default + 1):
+            assert conf.get_settings().QUERY_BUDGET == default + 1
+
+        assert conf.get_settings().QUERY_BUDGET == default
+
+    @pytest.mark.parametrize("value", ["10", 1.5, True])
+    def test_wrong_type_is_rejected(self, value):
+        """Test that a value of the wrong type raises ImproperlyConfigured."""
+        with pytest.raises(ImproperlyConfigured, match="QUERY_BUDGET"):
+            conf.PluginSettings(QUERY_BUDGET=value)
+
+    def test_out_of_range_value_is_rejected(self):
+        """Test that a value below its minimum raises ImproperlyConfigured."""
+        with pytest.raises(ImproperlyConfigured, match="at least 1"):
+            conf.PluginSettings(QUERY_BUDGET=0)
@@ -0,0 +1,78 @@
+"""
+Tests for {{ cookiecutter.plugin_name }} streaming exports.
+"""
+
+import json
+
+import pytest
+from django.http import Http404
+
+from {{ cookiecutter.plugin_slug }} import exports
+from {{ cookiecutter.plugin_slug }}.plugins import {{ cookiecutter.plugin_class_name }}
+
+
+def read(response):
+    """Consume a streaming response and return its content as text."""
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestStreamingExport:
+    """Tests for CSV and NDJSON exports of a dataset."""
+
+    def test_csv_export_streams_samples_and_measurements(self, dataset, measurement):
+        """Test that the CSV export has a header and one row per object."""
+        response = exports.export_response(dataset, "csv", "export")
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+
+        lines = read(response).splitlines()
+        assert lines[0] == ",".join(exports.COLUMNS)
+        assert any(line.startswith(f"sample,{measurement.sample.pk},") for line in lines)
+        assert any(line.startswith(f"measurement,{measurement.pk},") for line in lines)
+
+    def test_ndjson_export_streams_one_object_per_line(self, dataset, measurement):
+        """Test that every NDJSON line is a JSON object with the export columns."""
+        response = exports.export_response(dataset, "ndjson", "export")
+
+        records = [json.loads(line) for line in read(response).splitlines()]
+        assert {record["type"] for record in records} == {"sample", "measurement"}
+        assert all(set(record) == set(exports.COLUMNS) for record in records)
+
+    def test_project_export_includes_its_datasets(self, project, measurement):
+        """Test that exporting a project walks the samples of its datasets."""
+        response = exports.export_response(project, "csv", "export")
+
+        assert f"measurement,{measurement.pk}," in read(response)
+
+    def test_unknown_format_raises_404(self, dataset):
+        """Test that an unsupported format is rejected."""
+        with pytest.raises(Http404):
+            exports.export_response(dataset, "xlsx", "export")
+
+    def test_unsupported_object_raises_404(self, sample):
+        """Test that objects without samples cannot be exported."""
+        with pytest.raises(Http404):
+            exports.export_response(sample, "csv", "export")
+
+    def test_plugin_export_sets_filename(self, rf, user, dataset):
+        """Test that the plugin names the download after the exported object."""
+        request = rf.get("/", {"export": "csv"})
+        request.user = user
+
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.request = request
+        view.base_object = dataset
+
+        response = view.export("csv")
+        assert response["Content-Disposition"] == (
+            f'attachment; filename="{{ cookiecutter.plugin_slug }}-dataset-{dataset.pk}.csv"'
+        )
+
+    def test_export_offered_for_supported_objects(self, rf, project, dataset, sample, measurement):
+        """Test that the export buttons are only shown where the export has something to return."""
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.setup(rf.get("/"))
+        for base_object, exportable in [(project, True), (dataset, True), (sample, False), (measurement, False)]:
+            view.base_object = base_object
+            assert view.can_export() is exportable, base_object._meta.model_name
@@ -0,0 +1,120 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} feature flag.
+"""
+
+import pytest
+from django.http import Http404
+from waffle import get_waffle_flag_model
+
+from {{ cookiecutter.plugin_slug }} import flags
+from {{ cookiecutter.plugin_slug }}.plugins import {{ cookiecutter.plugin_class_name }}
+
+FLAG = {{ cookiecutter.plugin_class_name }}.feature_flag
+
+
+@pytest.fixture
+def make_request(rf, user):
+    """Return a function that builds a new request."""
+
+    def make():
+        request = rf.get("/")
+        request.user = user
+        return request
+
+    return make
+
+
+@pytest.fixture
+def make_flag():
+    """Return a function that creates the plugin's flag, active for everyone or for no one."""
+
+    def make(active, name=FLAG):
+        return get_waffle_flag_model().objects.create(name=name, everyone=active)
+
+    return make
+
+
+@pytest.mark.django_db
+class TestFeatureFlag:
+    """Tests for gating the plugin behind its flag."""
+
+    def test_active_flag_enables_plugin(self, make_view, make_flag, base_object):
+        """Test that the plugin is served while its flag is active."""
+        make_flag(True)
+        view = make_view(base_object)
+        assert flags.is_active(view.request, FLAG)
+        assert view.is_enabled()
+
+    def test_inactive_flag_answers_404(self, make_view, make_flag, base_object):
+        """Test that the plugin answers 404 while its flag is inactive."""
+        make_flag(False)
+        view = make_view(base_object)
+        assert not view.is_enabled()
+        with pytest.raises(Http404):
+            view.dispatch(view.request)
+
+    def test_missing_flag_uses_waffle_default(self, make_request, settings):
+        """Test that a flag that does not exist follows WAFFLE_FLAG_DEFAULT."""
+        settings.WAFFLE_FLAG_DEFAULT = False
+        assert not flags.is_active(make_request(), FLAG)
+
+    def test_plugin_without_flag_always_enabled(self, make_view, make_flag, base_object):
+        """Test that setting feature_flag to None disables the check."""
+        make_flag(False)
+        view = make_view(base_object)
+        view.feature_flag = None
+        assert view.is_enabled()
+
+
+@pytest.mark.django_db
+class TestFlagCache:
+    """Tests for the in-process flag cache."""
+
+    def test_flags_loaded_with_one_query(self, make_flag, django_assert_num_queries):
+        """Test that every flag is loaded by a single query."""
+        make_flag(True)
+        make_flag(False, name="other")
+        with django_assert_num_queries(1):
+            assert set(flags.get_flags()) == {FLAG, "other"}
+
+    def test_no_queries_until_ttl_expires(self, make_request, make_flag, django_assert_num_queries):
+        """Test that later requests are answered from the process without queries."""
+        make_flag(True)
+        flags.is_active(make_request(), FLAG)
+        with django_assert_num_queries(0):
+            assert flags.is_active(make_request(), FLAG)
+
+    def test_reloaded_after_ttl(self, make_request, make_flag, settings, django_assert_num_queries):
+        """Test that the flags are reloaded once the TTL has passed."""
+        settings.{{ cookiecutter.plugin_slug.upper() }}_FEATURE_FLAG_TTL = 0
+        make_flag(True)
+        flags.is_active(make_request(), FLAG)
+        with django_assert_num_queries(1):
+            flags.is_active(make_request(), FLAG)
+
+    def test_saving_flag_invalidates(self, make_request, make_flag):
+        """Test that saving a flag is seen by the next request, without waiting for the TTL."""
+        flag = make_flag(False)
+        assert not flags.is_active(make_request(), FLAG)
+        flag.everyone = True
+        flag.save()
+        assert flags.is_active(make_request(), FLAG)
+
+    def test_deleting_flag_invalidates(self, make_request, make_flag, settings):
+        """Test that deleting a flag is seen by the next request."""
+        settings.WAFFLE_FLAG_DEFAULT = False
+        flag = make_flag(True)
+        assert flags.is_active(make_request(), FLAG)
+        flag.delete()
+        assert not flags.is_active(make_request(), FLAG)
+
+    def test_evaluated_once_per_request(self, make_view, make_flag, base_object, django_assert_num_queries):
+        """Test that every check of the flag in a request shares one result."""
+        flag = make_flag(True)
+        view = make_view(base_object)
+        flags.is_active(view.request, FLAG)
+        flag.everyone = False
+        flag.save()
+        with django_assert_num_queries(0):
+            assert flags.is_active(view.request, FLAG)
+            assert all(view.is_enabled() for _ in range(3))
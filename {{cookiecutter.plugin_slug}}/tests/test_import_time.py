@@ -0,0 +1,77 @@
+"""
+Import-time budget test for {{ cookiecutter.plugin_name }}.
+
+Django is started in a fresh interpreter with ``python -X importtime``, which
+imports the plugin through ``AppConfig.ready()`` exactly as a portal does. The
+time spent importing the plugin's own modules, and every module first pulled in
+by them, must stay within ``{{ cookiecutter.plugin_slug.upper() }}_IMPORT_TIME_BUDGET`` milliseconds (see
+{{ cookiecutter.plugin_slug }}/conf.py). Modules that Django or FairDM already loaded do not count.
+"""
+
+import os
+import subprocess
+import sys
+
+from {{ cookiecutter.plugin_slug }}.conf import get_settings
+
+PACKAGE = "{{ cookiecutter.plugin_slug }}"
+
+
+def parse_import_times(stderr):
+    """
+    Return ``{module: microseconds}`` for every module imported by the plugin.
+
+    ``-X importtime`` prints one line per module after its own imports have
+    finished, indented by nesting depth, so the output is walked backwards to
+    see each module before the modules it imported.
+    """
+    times = {}
+    stack = []
+    for line in reversed(stderr.splitlines()):
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        owned = name == PACKAGE or name.startswith(f"{PACKAGE}.") or bool(stack and stack[-1][1])
+        stack.append((depth, owned))
+        if owned:
+            times[name] = int(self_time)
+    return times
+
+
+def test_parse_import_times_attributes_dependencies_to_the_plugin():
+    """Test that modules first imported by the plugin count towards its cost."""
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:        50 |         50 |     csv",
+            f"import time:       200 |        250 |   {PACKAGE}.exports",
+            f"import time:       100 |        350 | {PACKAGE}",
+            "import time:       300 |        300 | json",
+        ]
+    )
+
+    assert parse_import_times(stderr) == {"csv": 50, f"{PACKAGE}.exports": 200, PACKAGE: 100}
+
+
+def test_import_time_within_budget():
+    """Test that importing the plugin stays within the configured import-time budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import django; django.setup()"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+
+    times = parse_import_times(result.stderr)
+    assert PACKAGE in times, "The plugin was not imported during django.setup()"
+
+    budget = get_settings().IMPORT_TIME_BUDGET
+    total = sum(times.values()) / 1000
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+    report = "\n".join(f"  {us / 1000:8.1f} ms  {name}" for name, us in slowest)
+    assert total <= budget, f"Importing {PACKAGE} took {total:.1f} ms (budget {budget} ms). Slowest modules:\n{report}"
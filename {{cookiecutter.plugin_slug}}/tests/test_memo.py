@@ -0,0 +1,132 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} request-scoped memoization helpers.
+"""
+
+import pytest
+
+from {{ cookiecutter.plugin_slug }}.memo import get_memo, object_property, request_memoize
+
+
+class View:
+    """A minimal view whose helpers record every time they run."""
+
+    def __init__(self, request, base_object, calls):
+        self.request = request
+        self.base_object = base_object
+        self.calls = calls
+
+    @request_memoize
+    def get_data(self, limit=10):
+        self.calls.append(("get_data", limit))
+        return [self.base_object.pk] * limit
+
+    @request_memoize
+    def fail(self):
+        self.calls.append(("fail",))
+        raise ValueError("failed")
+
+    @object_property
+    def total(self):
+        self.calls.append(("total",))
+        return self.base_object.pk
+
+
+@pytest.fixture
+def calls():
+    """Return the list the views record their calls in."""
+    return []
+
+
+@pytest.fixture
+def make_memo_view(rf, base_object, calls):
+    """Return a function that builds a View, for a new request unless one is given."""
+
+    def make(request=None, obj=base_object):
+        return View(request or rf.get("/"), obj, calls)
+
+    return make
+
+
+@pytest.mark.django_db
+class TestRequestMemoize:
+    """Tests for @request_memoize."""
+
+    def test_runs_once_per_request(self, make_memo_view, calls):
+        """Test that repeated calls within one request share the first result."""
+        view = make_memo_view()
+        assert view.get_data() == view.get_data()
+        assert calls == [("get_data", 10)]
+
+    def test_shared_between_views_of_a_request(self, make_memo_view, calls):
+        """Test that a second view serving the same request reuses the result."""
+        view = make_memo_view()
+        view.get_data()
+        make_memo_view(request=view.request).get_data()
+        assert calls == [("get_data", 10)]
+
+    def test_not_reused_by_the_next_request(self, make_memo_view, calls):
+        """Test that a new request computes the result again."""
+        make_memo_view().get_data()
+        make_memo_view().get_data()
+        assert len(calls) == 2
+
+    def test_keyed_by_arguments(self, make_memo_view, calls):
+        """Test that different arguments are memoized separately."""
+        view = make_memo_view()
+        view.get_data(1)
+        view.get_data(limit=2)
+        view.get_data(1)
+        assert calls == [("get_data", 1), ("get_data", 2)]
+
+    def test_kept_when_base_object_is_reloaded(self, make_memo_view, base_object, calls):
+        """Test that a reloaded copy of base_object is treated as the same object."""
+        view = make_memo_view()
+        view.get_data()
+        view.base_object = type(base_object)._default_manager.get(pk=base_object.pk)
+        view.get_data()
+        assert len(calls) == 1
+
+    def test_exceptions_are_not_memoized(self, make_memo_view, calls):
+        """Test that a failed call is run again by the next caller."""
+        view = make_memo_view()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                view.fail()
+        assert len(calls) == 2
+
+    def test_without_request_nothing_is_stored(self, make_memo_view, calls):
+        """Test that views without a request always run the helper."""
+        view = make_memo_view()
+        view.request = None
+        view.get_data()
+        view.get_data()
+        assert len(calls) == 2
+
+    def test_results_live_on_the_request(self, make_memo_view):
+        """Test that the results are stored on, and discarded with, the request."""
+        view = make_memo_view()
+        view.get_data()
+        assert len(get_memo(view.request)) == 1
+
+
+@pytest.mark.django_db
+class TestObjectProperty:
+    """Tests for @object_property."""
+
+    def test_computed_once_per_request(self, make_memo_view, base_object, calls):
+        """Test that the property is computed on first access only."""
+        view = make_memo_view()
+        assert view.total == view.total == base_object.pk
+        assert calls == [("total",)]
+
+    def test_recomputed_for_another_object(self, make_memo_view, base_object, user, calls):
+        """Test that the value is not reused for a different base_object."""
+        view = make_memo_view()
+        assert view.total == base_object.pk
+        assert make_memo_view(request=view.request, obj=user).total == user.pk
+        assert len(calls) == 2
+
+    def test_is_read_only(self, make_memo_view):
+        """Test that the property cannot be assigned."""
+        with pytest.raises(AttributeError):
+            make_memo_view().total = 1
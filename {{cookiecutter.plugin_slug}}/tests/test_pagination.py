@@ -0,0 +1,86 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} keyset pagination.
+"""
+{%- set child_listing = cookiecutter.use_child_listing == "yes" %}
+
+import pytest
+{% if child_listing %}from django.http import Http404
+{% endif %}
+from {{ cookiecutter.plugin_slug }}.pagination import InvalidCursor, KeysetPaginator, get_children
+
+
+@pytest.mark.django_db
+class TestKeysetPaginator:
+    """Tests for paging through the child objects by their ordering key."""
+
+    def test_first_page(self, base_object, children):
+        """Test that the first page holds page_size rows and points to the next one."""
+        page = KeysetPaginator(get_children(base_object), page_size=2).get_page()
+
+        assert page.object_list == children[:2]
+        assert page.cursor is None
+        assert page.has_next
+
+    def test_pages_cover_every_row_once(self, base_object, children):
+        """Test that following the cursors visits every child once, in order."""
+        paginator = KeysetPaginator(get_children(base_object), page_size=2)
+        seen = []
+        page = paginator.get_page()
+        seen += page.object_list
+        while page.has_next:
+            page = paginator.get_page(page.next_cursor)
+            seen += page.object_list
+
+        assert seen == children
+        assert len(page.object_list) == 1
+
+    def test_page_costs_one_query(self, base_object, children, django_assert_num_queries):
+        """Test that a later page is a single query, without OFFSET or COUNT."""
+        paginator = KeysetPaginator(get_children(base_object), page_size=2)
+        cursor = paginator.get_page().next_cursor
+
+        with django_assert_num_queries(1) as captured:
+            paginator.get_page(cursor)
+        assert "OFFSET" not in captured.captured_queries[0]["sql"].upper()
+
+    def test_descending_values_rows(self, base_object, children):
+        """Test that values() rows and descending orderings are paged too."""
+        queryset = get_children(base_object).values()
+        pk_name = queryset.model._meta.pk.attname
+        paginator = KeysetPaginator(queryset, ordering=("-pk",), page_size=3)
+        first = paginator.get_page()
+        second = paginator.get_page(first.next_cursor)
+
+        assert [row[pk_name] for row in first.object_list + second.object_list] == [
+            child.pk for child in reversed(children)
+        ]
+        assert not second.has_next
+
+    @pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", "WzEsMiwzXQ"])
+    def test_invalid_cursor_is_rejected(self, base_object, cursor):
+        """Test that malformed cursors raise InvalidCursor."""
+        with pytest.raises(InvalidCursor):
+            KeysetPaginator(get_children(base_object)).get_page(cursor)
+
+{%- if child_listing %}
+
+@pytest.mark.django_db
+class TestChildListing:
+    """Tests for the child listing rendered by the plugin."""
+
+    def test_listing_request_renders_next_rows(self, base_object, children, render_plugin, settings):
+        """Test that ?listing=1 renders only the listing rows of the requested page."""
+        settings.{{ cookiecutter.plugin_slug.upper() }}_PAGE_SIZE = 2
+        first = render_plugin(base_object, listing="1")
+        assert first.template_name == ["{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}_children.html"]
+        assert "Load more" in first.rendered_content
+
+        page = first.context_data["child_page"]
+        second = render_plugin(base_object, listing="1", cursor=page.next_cursor)
+        assert second.context_data["child_page"].object_list == children[2:4]
+
+    def test_invalid_cursor_is_not_found(self, base_object, render_plugin):
+        """Test that the plugin answers an invalid cursor with 404."""
+        with pytest.raises(Http404):
+            render_plugin(base_object, listing="1", cursor="not base64!")
+{%- endif %}
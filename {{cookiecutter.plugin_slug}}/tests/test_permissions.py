@@ -0,0 +1,149 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} per-request permission checks.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import PermissionDenied
+from fairdm.factories import UserFactory
+
+from {{ cookiecutter.plugin_slug }}.memo import MEMO_ATTRIBUTE
+from {{ cookiecutter.plugin_slug }}.permissions import (
+    PERMISSIONS_ATTRIBUTE,
+    get_permissions,
+    get_required_permissions,
+    has_perm,
+    has_perms,
+    normalize,
+)
+from {{ cookiecutter.plugin_slug }}.plugins import {{ cookiecutter.plugin_class_name }}
+
+
+class OpenPlugin:
+    """A plugin everyone may see."""
+
+
+class RestrictedPlugin:
+    """A plugin that requires the view permission of the object."""
+
+    permission_required = "view_{model_name}"
+
+
+@pytest.fixture
+def grant(base_object):
+    """Return a function that gives a user a model-level permission of base_object's model."""
+
+    def grant(user, action="view"):
+        opts = base_object._meta
+        permission, _ = Permission.objects.get_or_create(
+            content_type=ContentType.objects.get_for_model(base_object),
+            codename=f"{action}_{opts.model_name}",
+            defaults={"name": f"Can {action} {opts.verbose_name}"},
+        )
+        user.user_permissions.add(permission)
+        # Reload the user, since Django caches permissions on the instance
+        return type(user)._default_manager.get(pk=user.pk)
+
+    return grant
+
+
+@pytest.fixture
+def make_request(rf, user):
+    """Return a function that builds a request for ``user`` unless another user is given."""
+
+    def make(request_user=None):
+        request = rf.get("/")
+        request.user = request_user or user
+        return request
+
+    return make
+
+
+@pytest.mark.django_db
+class TestHasPerm:
+    """Tests for has_perm() and has_perms()."""
+
+    def test_denied_without_permission(self, make_request, base_object):
+        """Test that a user without the permission is denied."""
+        assert not has_perm(make_request(), "view_{model_name}", base_object)
+
+    def test_granted_with_model_permission(self, make_request, base_object, user, grant):
+        """Test that a model-level permission is granted for every object."""
+        request = make_request(grant(user))
+        assert has_perm(request, "view_{model_name}", base_object)
+        assert has_perm(request, normalize("view_{model_name}", base_object), base_object)
+
+    def test_superuser_has_every_permission(self, make_request, base_object):
+        """Test that active superusers are granted everything."""
+        assert has_perm(make_request(UserFactory(is_superuser=True)), "delete_{model_name}", base_object)
+
+    def test_anonymous_user_is_denied(self, make_request, base_object):
+        """Test that anonymous users have no permissions."""
+        assert not has_perm(make_request(AnonymousUser()), "view_{model_name}", base_object)
+
+    def test_no_permissions_required(self, make_request, base_object):
+        """Test that an empty list of permissions is always satisfied."""
+        assert has_perms(make_request(AnonymousUser()), [], base_object)
+
+    def test_all_permissions_required(self, make_request, base_object, user, grant):
+        """Test that has_perms() requires every permission."""
+        request = make_request(grant(user))
+        assert not has_perms(request, ["view_{model_name}", "change_{model_name}"], base_object)
+
+    def test_permissions_fetched_once_per_request(
+        self, make_request, base_object, user, grant, django_assert_num_queries
+    ):
+        """Test that later checks in the same request run no queries."""
+        request = make_request(grant(user))
+        has_perm(request, "view_{model_name}", base_object)
+        with django_assert_num_queries(0):
+            has_perm(request, "change_{model_name}", base_object)
+            has_perms(request, ["view_{model_name}", "delete_{model_name}"], base_object)
+
+    def test_shared_with_other_plugins(self, make_request, base_object, user, grant):
+        """Test that the permissions are stored where other template-generated plugins look them up."""
+        request = make_request(grant(user))
+        has_perm(request, "view_{model_name}", base_object)
+        shared = getattr(request, PERMISSIONS_ATTRIBUTE)
+        assert shared[(user.pk, base_object._meta.label_lower, base_object.pk)] == get_permissions(request, base_object)
+        assert not hasattr(request, MEMO_ATTRIBUTE)
+
+    def test_new_permission_seen_by_next_request(self, make_request, base_object, user, grant):
+        """Test that a permission granted during a request is seen by the next one."""
+        request = make_request()
+        assert not has_perm(request, "view_{model_name}", base_object)
+        user = grant(user)
+        assert not get_permissions(request, base_object)
+        assert has_perm(make_request(user), "view_{model_name}", base_object)
+
+
+@pytest.mark.django_db
+class TestPluginPermissions:
+    """Tests for the plugin's permission_required."""
+
+    def test_required_permissions_as_tuple(self):
+        """Test that permission_required may be a string, a list or missing."""
+        assert get_required_permissions(OpenPlugin) == ()
+        assert get_required_permissions(RestrictedPlugin) == ("view_{model_name}",)
+
+    def test_plugin_open_by_default(self, make_request, base_object):
+        """Test that the plugin is open to everyone when it requires no permissions."""
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.setup(make_request(AnonymousUser()))
+        view.base_object = base_object
+        assert view.has_permission()
+
+    def test_dispatch_denies_without_permission(self, make_request, base_object):
+        """Test that the plugin refuses users missing permission_required."""
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.setup(make_request())
+        view.base_object = base_object
+        view.permission_required = ["view_{model_name}"]
+        with pytest.raises(PermissionDenied):
+            view.dispatch(view.request)
+
+    def test_bare_codenames_use_the_app_of_the_object(self, base_object):
+        """Test that bare codenames are qualified with the object's app label."""
+        opts = base_object._meta
+        assert normalize("view_{model_name}", base_object) == f"{opts.app_label}.view_{opts.model_name}"
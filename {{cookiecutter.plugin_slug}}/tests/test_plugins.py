@@ -3,7 +3,8 @@ Tests for {{ cookiecutter.plugin_name }} plugin.
 """
 
 import pytest
-from django.test import RequestFactory
+{% if cookiecutter.use_deferred_content == "yes" %}from django.contrib.auth.models import AnonymousUser
+{% endif %}from django.test import RequestFactory
 from fairdm import plugins
 {% if cookiecutter.register_to_models__project == "yes" %}from fairdm.core.project.models import Project
 {% endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}from fairdm.core.dataset.models import Dataset
@@ -60,7 +61,30 @@ class Test{{ cookiecutter.plugin_class_name }}Attributes:
 
 class Test{{ cookiecutter.plugin_class_name }}View:
     """Tests for {{ cookiecutter.plugin_class_name }} view functionality."""
-{% if cookiecutter.register_to_models__project == "yes" %}
+{% if cookiecutter.register_to_models__project == "yes" or cookiecutter.register_to_models__dataset == "yes" or cookiecutter.register_to_models__sample == "yes" or cookiecutter.register_to_models__measurement == "yes" %}
+    @pytest.mark.parametrize(
+        "model_fixture",
+        [{% if cookiecutter.register_to_models__project == "yes" %}"project", {% endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}"dataset", {% endif %}{% if cookiecutter.register_to_models__sample == "yes" %}"sample", {% endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}"measurement"{% endif %}],
+    )
+    @pytest.mark.django_db
+    def test_base_queryset_loads_related_objects(self, request, model_fixture, django_assert_num_queries):
+        """Test that base_object is only fetched again once related objects are configured for it."""
+        base_object = request.getfixturevalue(model_fixture)
+        
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.base_object = base_object
+        
+        queryset = view.get_base_queryset()
+        assert queryset.model is type(base_object)
+        with django_assert_num_queries(0):
+            assert view.get_base_object() is base_object
+        
+        parent = {"dataset": "project", "sample": "dataset", "measurement": "sample"}.get(model_fixture)
+        if parent:
+            view.select_related = {type(base_object): [parent]}
+            assert view.get_base_queryset().query.select_related == {parent: {}}
+            assert view.get_base_object() == base_object
+{% endif %}{% if cookiecutter.register_to_models__project == "yes" %}
     @pytest.mark.django_db
     def test_plugin_view_with_project(self, rf, user, project):
         """Test that the plugin view works with a Project instance."""
@@ -88,6 +112,29 @@ class Test{{ cookiecutter.plugin_class_name }}View:
         context = view.get_context_data()
         assert "base_object" in context
         assert context["base_object"] == dataset
+{% endif %}{% if cookiecutter.use_deferred_content == "yes" %}
+    def test_shell_uses_page_template(self, rf):
+        """Test that a regular request renders the lightweight page shell."""
+        request = rf.get("/")
+        # Template selection does not look at the user, so no database is needed
+        request.user = AnonymousUser()
+        
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.request = request
+        
+        assert not view.is_partial_request()
+        assert view.get_template_names() == ["{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}.html"]
+
+    def test_partial_request_uses_content_template(self, rf):
+        """Test that the deferred request renders only the plugin content."""
+        request = rf.get("/", {"partial": "1"})
+        request.user = AnonymousUser()
+        
+        view = {{ cookiecutter.plugin_class_name }}()
+        view.request = request
+        
+        assert view.is_partial_request()
+        assert view.get_template_names() == ["{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}_content.html"]
 {% endif %}
     # Add more view tests here
     # Example:
@@ -0,0 +1,40 @@
+{% set model_fixtures = ["project" if cookiecutter.register_to_models__project == "yes" else "", "dataset" if cookiecutter.register_to_models__dataset == "yes" else "", "sample" if cookiecutter.register_to_models__sample == "yes" else "", "measurement" if cookiecutter.register_to_models__measurement == "yes" else ""] | select | list -%}
+"""
+Query-budget tests for {{ cookiecutter.plugin_name }}.
+
+Every render of the plugin must stay within
+``{{ cookiecutter.plugin_slug.upper() }}_QUERY_BUDGET`` queries (see {{ cookiecutter.plugin_slug }}/conf.py). Renders
+that repeat a query are additionally caught by the N+1 detector in conftest.py.
+"""
+
+import pytest
+
+from {{ cookiecutter.plugin_slug }}.conf import get_settings
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model_fixture",
+    [{% for name in model_fixtures %}"{{ name }}"{% if not loop.last %}, {% endif %}{% endfor %}],
+)
+def test_render_within_query_budget(request, model_fixture, render_plugin, django_assert_max_num_queries):
+    """Test that rendering the plugin stays within the configured query budget."""
+    base_object = request.getfixturevalue(model_fixture)
+
+    with django_assert_max_num_queries(get_settings().QUERY_BUDGET):
+        render_plugin(base_object)
+{%- if cookiecutter.use_deferred_content == "yes" %}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model_fixture",
+    [{% for name in model_fixtures %}"{{ name }}"{% if not loop.last %}, {% endif %}{% endfor %}],
+)
+def test_deferred_content_within_query_budget(request, model_fixture, render_plugin, django_assert_max_num_queries):
+    """Test that rendering the deferred content stays within the configured query budget."""
+    base_object = request.getfixturevalue(model_fixture)
+
+    with django_assert_max_num_queries(get_settings().QUERY_BUDGET):
+        render_plugin(base_object, partial="1")
+{%- endif %}
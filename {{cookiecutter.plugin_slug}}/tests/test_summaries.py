@@ -0,0 +1,93 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} summary store.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from fairdm.factories import DatasetFactory, MeasurementFactory, {% if cookiecutter.register_to_models__project == "yes" %}ProjectFactory, {% endif %}SampleFactory
+
+from {{ cookiecutter.plugin_slug }} import summaries
+from {{ cookiecutter.plugin_slug }}.models import Summary
+
+
+def counts(base_object):
+    """Return the stored (samples, measurements) of ``base_object``."""
+    summary = summaries.get_summary(base_object)
+    return summary.sample_count, summary.measurement_count
+
+
+@pytest.mark.django_db
+class TestSummaryStore:
+    """Tests for the incrementally maintained summaries."""
+
+    def test_summary_matches_live_counts(self, base_object, measurement):
+        """Test that a missing summary is computed on first read."""
+        assert counts(base_object) == (1, 1)
+
+    def test_summary_is_stored(self, base_object, measurement):
+        """Test that the summary is read from a single stored row."""
+        summaries.get_summary(base_object)
+        assert Summary.objects.count() == 1
+
+    def test_new_sample_and_measurement_are_counted(self, base_object, dataset):
+        """Test that creating samples and measurements updates the stored counts."""
+        assert counts(base_object) == (0, 0)
+        sample = SampleFactory(dataset=dataset)
+        MeasurementFactory(sample=sample)
+        MeasurementFactory(sample=sample)
+        assert counts(base_object) == (1, 2)
+
+    def test_deletes_are_uncounted(self, base_object, sample, measurement):
+        """Test that deleting a measurement, then its sample, updates the stored counts."""
+        assert counts(base_object) == (1, 1)
+        measurement.delete()
+        assert counts(base_object) == (1, 0)
+        sample.delete()
+        assert counts(base_object) == (0, 0)
+
+    def test_moved_sample_is_recounted(self, base_object, sample, measurement):
+        """Test that moving a sample elsewhere takes its measurements along."""
+        assert counts(base_object) == (1, 1)
+        sample.dataset = DatasetFactory()
+        sample.save()
+        assert counts(base_object) == (0, 0)
+        assert counts(sample.dataset{% if cookiecutter.register_to_models__project == "yes" %}.project{% endif %}) == (1, 1)
+
+{%- if cookiecutter.register_to_models__project == "yes" %}
+
+    def test_moved_dataset_is_recounted(self, project, dataset, measurement):
+        """Test that moving a dataset to another project takes its samples and measurements along."""
+        assert counts(project) == (1, 1)
+        dataset.project = ProjectFactory()
+        dataset.save()
+        assert counts(project) == (0, 0)
+        assert counts(dataset.project) == (1, 1)
+
+    def test_deleted_dataset_is_uncounted(self, project, dataset, measurement):
+        """Test that deleting a dataset, and with it its samples, updates the counts of its project."""
+        assert counts(project) == (1, 1)
+        dataset.delete()
+        assert counts(project) == (0, 0)
+{%- endif %}
+
+    def test_deleting_object_removes_summary(self, base_object, measurement):
+        """Test that the summary of a deleted object is removed with it."""
+        summaries.get_summary(base_object)
+        base_object.delete()
+        assert not Summary.objects.exists()
+
+    def test_rebuild_recomputes_counts(self, base_object, measurement):
+        """Test that rebuild() restores counts changed behind the signals' back."""
+        summaries.get_summary(base_object)
+        Summary.objects.update(sample_count=0, measurement_count=0)
+        summaries.rebuild()
+        assert counts(base_object) == (1, 1)
+
+    def test_rebuild_command(self, base_object, measurement):
+        """Test that the management command rebuilds every summary."""
+        stdout = StringIO()
+        call_command("rebuild_{{ cookiecutter.plugin_slug }}_summaries", "--batch-size", "10", stdout=stdout)
+        assert stdout.getvalue().startswith("Rebuilt ")
+        assert counts(base_object) == (1, 1)
@@ -0,0 +1,173 @@
+"""
+Tests for {{ cookiecutter.plugin_name }} background tasks.
+"""
+
+import json
+import threading
+
+import pytest
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from fairdm.factories import UserFactory
+
+from {{ cookiecutter.plugin_slug }} import tasks
+
+
+def add(report_progress, a, b):
+    """Task used by the tests."""
+    report_progress(0.5)
+    return a + b
+
+
+def fail(report_progress):
+    """Task that always fails."""
+    raise ValueError("Something went wrong")
+
+
+def wait(report_progress, event):
+    """Task that runs until ``event`` is set."""
+    event.wait(timeout=5)
+
+
+@pytest.fixture
+def immediate_backend(settings):
+    """Run background tasks synchronously for the duration of a test."""
+    settings.{{ cookiecutter.plugin_slug.upper() }}_TASK_BACKEND = "{{ cookiecutter.plugin_slug }}.tasks.ImmediateBackend"
+    tasks.reset_backend()
+    yield tasks.get_backend()
+    tasks.reset_backend()
+
+
+class TestBackends:
+    """Tests for the bundled task backends."""
+
+    def test_immediate_backend_records_result(self):
+        """Test that a finished job reports its result and full progress."""
+        backend = tasks.ImmediateBackend()
+        job = backend.get_job(backend.enqueue(add, 1, 2))
+
+        assert job.status == tasks.DONE
+        assert job.result == 3
+        assert job.progress == 1.0
+
+    def test_failed_task_records_error(self):
+        """Test that an exception marks the job as failed instead of propagating."""
+        backend = tasks.ImmediateBackend()
+        job = backend.get_job(backend.enqueue(fail))
+
+        assert job.status == tasks.FAILED
+        assert job.error == "Something went wrong"
+
+    def test_thread_pool_backend_runs_in_background(self):
+        """Test that the thread pool runs the task and records its result."""
+        backend = tasks.ThreadPoolBackend(max_workers=1)
+        job_id = backend.enqueue(add, 2, 3)
+        backend.executor.shutdown(wait=True)
+
+        job = backend.get_job(job_id)
+        assert job.status == tasks.DONE
+        assert job.result == 5
+
+    def test_unknown_job_is_none(self):
+        """Test that looking up an unknown job returns None."""
+        assert tasks.ImmediateBackend().get_job("missing") is None
+
+    def test_job_store_forgets_oldest_finished_jobs(self):
+        """Test that the job store does not grow without bound."""
+        store = tasks.InMemoryJobStore(max_jobs=2)
+        first = store.create()
+        first.status = tasks.DONE
+        store.create()
+        store.create()
+
+        assert store.get(first.id) is None
+
+    def test_job_store_refuses_jobs_when_full_of_unfinished_ones(self):
+        """Test that unfinished jobs are never forgotten, so the store refuses new ones instead."""
+        store = tasks.InMemoryJobStore(max_jobs=1)
+        store.create()
+
+        with pytest.raises(tasks.QueueFull):
+            store.create()
+
+    def test_thread_pool_queue_is_bounded(self):
+        """Test that the thread pool refuses jobs beyond its queue size until one finishes."""
+        event = threading.Event()
+        backend = tasks.ThreadPoolBackend(max_workers=1, queue_size=2)
+        backend.enqueue(wait, event)
+        backend.enqueue(wait, event)
+        try:
+            with pytest.raises(tasks.QueueFull):
+                backend.enqueue(add, 1, 2)
+        finally:
+            event.set()
+        backend.executor.shutdown(wait=True)
+
+        # Finished jobs give their slot back
+        assert all(backend.slots.acquire(blocking=False) for _ in range(2))
+
+    def test_job_records_owner(self):
+        """Test that the owner passed to enqueue() is kept on the job but not exposed."""
+        backend = tasks.ImmediateBackend()
+        job = backend.get_job(backend.enqueue(add, 1, 2, owner=("app.model", 1, 2)))
+
+        assert job.owner == ("app.model", 1, 2)
+        assert "owner" not in job.as_dict()
+
+
+@pytest.fixture
+def superuser():
+    """Create a user with every permission."""
+    return UserFactory(is_superuser=True)
+
+
+@pytest.mark.django_db
+class TestPluginTasks:
+    """Tests for starting and polling tasks through the plugin."""
+
+    def test_post_enqueues_task_and_returns_job(self, make_view, base_object, superuser, immediate_backend):
+        """Test that a POST starts the task and returns its job id."""
+        view = make_view(base_object, "post", request_user=superuser)
+
+        response = view.post(view.request)
+        assert response.status_code == 202
+
+        data = json.loads(response.content)
+        assert data["status_url"] == f"/?job={data['job']}"
+        assert immediate_backend.get_job(data["job"]).status == tasks.DONE
+
+    def test_post_requires_task_permission(self, make_view, base_object, immediate_backend):
+        """Test that users without task_permission_required cannot start the task."""
+        view = make_view(base_object, "post")
+
+        with pytest.raises(PermissionDenied):
+            view.post(view.request)
+
+    def test_post_when_backend_full(self, make_view, base_object, superuser, immediate_backend, monkeypatch):
+        """Test that a full backend answers 503 instead of queueing more work."""
+        monkeypatch.setattr(immediate_backend.store, "max_jobs", 0)
+        view = make_view(base_object, "post", request_user=superuser)
+
+        assert view.post(view.request).status_code == 503
+
+    def test_job_status_reports_progress(self, make_view, base_object, immediate_backend):
+        """Test that ?job=<id> returns the state of the job."""
+        view = make_view(base_object)
+        job_id = immediate_backend.enqueue(add, 1, 1, owner=view.get_job_owner())
+
+        data = json.loads(view.job_status(job_id).content)
+        assert data["status"] == tasks.DONE
+        assert data["result"] == 2
+
+    def test_job_of_another_user_raises_404(self, make_view, base_object, superuser, immediate_backend):
+        """Test that users cannot poll jobs started by someone else."""
+        owner = make_view(base_object, request_user=superuser).get_job_owner()
+        job_id = immediate_backend.enqueue(add, 1, 1, owner=owner)
+
+        with pytest.raises(Http404):
+            make_view(base_object).job_status(job_id)
+
+    def test_unknown_job_raises_404(self, make_view, base_object, immediate_backend):
+        """Test that polling an unknown job is rejected."""
+        with pytest.raises(Http404):
+            make_view(base_object, params={"job": "missing"}).job_status("missing")
@@ -0,0 +1,57 @@
+"""
+Tests for the {{ cookiecutter.plugin_name }} deploy-time warmup.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from {{ cookiecutter.plugin_slug }} import warmup
+
+
+@pytest.mark.django_db
+class TestWarmup:
+    """Tests for the warmup steps and the warmup_{{ cookiecutter.plugin_slug }} command."""
+
+    def test_modules_compiled_to_hash_based_pyc(self):
+        """Test that every module of the plugin is byte-compiled into a hash-based .pyc."""
+        compiled = warmup.compile_modules()
+        assert warmup.PACKAGE_DIR / "plugins.py" in compiled
+        for module in compiled:
+            pyc = next((module.parent / "__pycache__").glob(f"{module.stem}.*.pyc"))
+            # PEP 552: bit 0 marks a hash-based pyc, bit 1 asks the import system to check it
+            assert int.from_bytes(pyc.read_bytes()[4:8], "little") == 0b11
+
+    def test_templates_compiled_with_their_parents(self):
+        """Test that the plugin templates and the FairDM template they extend are compiled."""
+        compiled = warmup.compile_templates()
+        assert "{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}.html" in compiled
+        assert "fairdm/plugin.html" in compiled
+
+    def test_views_resolved_for_registered_models(self):
+        """Test that the plugin view of every registered model is resolved."""
+        assert set(warmup.resolve_views()) == set(warmup.REGISTERED_MODELS)
+
+    def test_prime_renders_recent_objects(self, base_object):
+        """Test that priming renders the plugin for the most recent objects."""
+        assert base_object in warmup.prime(5)
+
+    def test_prime_count_is_per_model(self, base_object):
+        """Test that no more than ``count`` objects of each registered model are primed."""
+        assert len(warmup.prime(1)) <= len(warmup.REGISTERED_MODELS)
+
+    def test_command_reports_timings(self, base_object):
+        """Test that the command reports every step with its duration."""
+        out = StringIO()
+        call_command("warmup_{{ cookiecutter.plugin_slug }}", "--prime", "1", stdout=out)
+        output = out.getvalue()
+        steps = ["Compiled modules", "Compiled templates", "Resolved plugin views", "Primed objects", "Warmed up in"]
+        for step in steps:
+            assert step in output
+        assert " ms" in output
+
+    def test_command_rejects_negative_prime(self):
+        """Test that a negative --prime is rejected."""
+        with pytest.raises(CommandError):
+            call_command("warmup_{{ cookiecutter.plugin_slug }}", "--prime", "-1")
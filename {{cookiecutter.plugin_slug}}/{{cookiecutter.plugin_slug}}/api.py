@@ -0,0 +1,95 @@
+{%- set project = cookiecutter.register_to_models__project == "yes" %}
+{%- set dataset = cookiecutter.register_to_models__dataset == "yes" %}
+{%- set sample = cookiecutter.register_to_models__sample == "yes" -%}
+"""
+Read-only JSON API for {{ cookiecutter.plugin_name }}.
+
+``?format=json`` on the plugin URL returns the child objects of base_object
+(see ``CHILDREN`` in pagination.py) without rendering the plugin page. Rows
+are read with ``values()``, so no model instances are built, paged with the
+keyset paginator and encoded in one pass.
+
+Query parameters:
+    fields  Comma-separated subset of ``FIELDS`` for the child model
+    limit   Rows per page, at most ``{{ cookiecutter.plugin_slug.upper() }}_API_MAX_PAGE_SIZE``
+    cursor  The ``next_cursor`` of the previous response
+
+Response::
+
+    {"results": [{"id": 1, "name": "..."}, ...], "next_cursor": "...", "next": "/...?format=json&cursor=..."}
+"""
+
+from django.core.exceptions import BadRequest
+from django.http import Http404, JsonResponse
+{% if project %}from fairdm.core.dataset.models import Dataset
+{% endif %}{% if sample %}from fairdm.core.measurement.models import Measurement
+{% endif %}{% if dataset %}from fairdm.core.sample.models import Sample
+{% endif %}
+from .conf import get_settings
+from .pagination import InvalidCursor, KeysetPaginator, get_children
+
+# Fields a client may request for each child model, returned when ?fields= is absent.
+# Only list plain columns: every field here is readable by anyone who can see the plugin.
+FIELDS = {
+{%- if project %}
+    Dataset: ("id", "name", "project_id"),
+{%- endif %}{% if dataset %}
+    Sample: ("id", "name", "dataset_id"),
+{%- endif %}{% if sample %}
+    Measurement: ("id", "name", "sample_id"),
+{%- endif %}
+}
+
+
+def get_fields(model, requested):
+    """Return the fields selected by the ``fields`` parameter, or raise BadRequest."""
+    allowed = FIELDS[model]
+    if not requested:
+        return allowed
+    fields = tuple(dict.fromkeys(name.strip() for name in requested.split(",") if name.strip()))
+    unknown = [name for name in fields if name not in allowed]
+    if unknown or not fields:
+        raise BadRequest(f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(allowed)}.")
+    return fields
+
+
+def get_limit(requested):
+    """Return the page size selected by the ``limit`` parameter, or raise BadRequest."""
+    plugin_settings = get_settings()
+    if not requested:
+        return plugin_settings.PAGE_SIZE
+    try:
+        limit = int(requested)
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= plugin_settings.API_MAX_PAGE_SIZE:
+        raise BadRequest(f"limit must be between 1 and {plugin_settings.API_MAX_PAGE_SIZE}.")
+    return limit
+
+
+def api_response(base_object, request, cursor_parameter="cursor"):
+    """Return one page of the child objects of ``base_object`` as JSON."""
+    children = get_children(base_object)
+    if children is None:
+        raise Http404(f"{base_object._meta.verbose_name} has no child objects.")
+    fields = get_fields(children.model, request.GET.get("fields"))
+    # The keyset needs the primary key of every row, even when it is not requested
+    pk_name = children.model._meta.pk.attname
+    paginator = KeysetPaginator(
+        children.values(*dict.fromkeys((*fields, pk_name))),
+        page_size=get_limit(request.GET.get("limit")),
+    )
+    try:
+        page = paginator.get_page(request.GET.get(cursor_parameter))
+    except InvalidCursor as e:
+        raise BadRequest(str(e)) from e
+
+    rows = page.object_list
+    if pk_name not in fields:
+        rows = [{name: row[name] for name in fields} for row in rows]
+    next_url = None
+    if page.has_next:
+        query = request.GET.copy()
+        query[cursor_parameter] = page.next_cursor
+        next_url = f"{request.path}?{query.urlencode()}"
+    return JsonResponse({"results": rows, "next_cursor": page.next_cursor, "next": next_url})
@@ -1,3 +1,5 @@
+{%- set summary_store = cookiecutter.use_summary_store == "yes" and (cookiecutter.register_to_models__project == "yes" or cookiecutter.register_to_models__dataset == "yes") -%}
+{%- set registered = ["Project" if cookiecutter.register_to_models__project == "yes" else "", "Dataset" if cookiecutter.register_to_models__dataset == "yes" else "", "Sample" if cookiecutter.register_to_models__sample == "yes" else "", "Measurement" if cookiecutter.register_to_models__measurement == "yes" else ""] | select | list -%}
 from django.apps import AppConfig
 
 
@@ -12,7 +14,101 @@ class {{ cookiecutter.plugin_class_name }}Config(AppConfig):
         """
         Perform initialization when Django starts.
         
-        Import plugins to ensure they are registered with FairDM.
+        Load and validate the plugin settings, then import plugins to
+        ensure they are registered with FairDM.{% if cookiecutter.use_render_cache == "yes" %}
+        Connect the signals that invalidate cached plugin panels.{% endif %}{% if summary_store %}
+        Connect the signals that keep the summary store current.{% endif %}{% if cookiecutter.use_waffle == "yes" %}
+        Connect the signals that drop stale feature flags.{% endif %}
         """
+        from . import conf
+
+        # Fail at startup rather than on the first request if a setting is invalid
+        conf.load()
+
         # Import plugins to register them
         from . import plugins  # noqa: F401
+{%- if cookiecutter.use_render_cache == "yes" or summary_store or cookiecutter.use_waffle == "yes" %}
+{% endif %}
+{%- if cookiecutter.use_render_cache == "yes" %}
+        self.connect_cache_signals()
+{%- endif %}
+{%- if summary_store %}
+        self.connect_summary_signals()
+{%- endif %}
+{%- if cookiecutter.use_waffle == "yes" %}
+        self.connect_flag_signals()
+{%- endif %}
+{%- if cookiecutter.use_render_cache == "yes" %}
+
+    def connect_cache_signals(self):
+        """Invalidate cached panels whenever a registered object is saved or deleted."""
+        from django.apps import apps
+        from django.db.models.signals import post_delete, post_save
+{% if cookiecutter.register_to_models__project == "yes" %}        from fairdm.core.project.models import Project
+{% endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}        from fairdm.core.dataset.models import Dataset
+{% endif %}{% if cookiecutter.register_to_models__sample == "yes" %}        from fairdm.core.sample.models import Sample
+{% endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}        from fairdm.core.measurement.models import Measurement
+{% endif %}
+        from . import cache
+
+        registered = ({{ registered | join(", ") }}{% if registered | length == 1 %},{% endif %})
+
+        # Saving a subclass (e.g. a polymorphic Sample type) sends the signals
+        # with the subclass as sender, so every concrete subclass is connected.
+        for model in apps.get_models():
+            if issubclass(model, registered):
+                uid = f"{{ cookiecutter.plugin_slug }}.cache.{model._meta.label_lower}"
+                post_save.connect(cache.invalidate, sender=model, dispatch_uid=f"{uid}.post_save")
+                post_delete.connect(cache.invalidate, sender=model, dispatch_uid=f"{uid}.post_delete")
+{%- endif %}
+{%- if summary_store %}
+
+    def connect_summary_signals(self):
+        """Update the summary store whenever a sample, measurement{% if cookiecutter.register_to_models__project == "yes" %}, dataset{% endif %} or summarised object changes."""
+        from django.apps import apps
+        from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+{%- if cookiecutter.register_to_models__project == "yes" %}
+        from fairdm.core.dataset.models import Dataset
+{%- endif %}
+        from fairdm.core.measurement.models import Measurement
+        from fairdm.core.sample.models import Sample
+
+        from . import summaries
+
+        # Saving a {% if cookiecutter.register_to_models__project == "yes" %}Dataset, {% endif %}Sample or Measurement subclass sends the save signals with
+        # the subclass as sender, so every concrete subclass is connected.
+        for model in apps.get_models():
+            uid = f"{{ cookiecutter.plugin_slug }}.summaries.{model._meta.label_lower}"
+            if issubclass(model, Sample):
+                pre_save.connect(summaries.sample_pre_save, sender=model, dispatch_uid=f"{uid}.pre_save")
+                post_save.connect(summaries.sample_post_save, sender=model, dispatch_uid=f"{uid}.post_save")
+            elif issubclass(model, Measurement):
+                pre_save.connect(summaries.measurement_pre_save, sender=model, dispatch_uid=f"{uid}.pre_save")
+                post_save.connect(summaries.measurement_post_save, sender=model, dispatch_uid=f"{uid}.post_save")
+{%- if cookiecutter.register_to_models__project == "yes" %}
+            elif issubclass(model, Dataset):
+                pre_save.connect(summaries.dataset_pre_save, sender=model, dispatch_uid=f"{uid}.pre_save")
+                post_save.connect(summaries.dataset_post_save, sender=model, dispatch_uid=f"{uid}.post_save")
+{%- endif %}
+
+        # Deleting a subclass also deletes its base row, which sends the delete
+        # signals for the base model, so only the base models are connected
+        # (once each: connecting the same dispatch_uid again does nothing).
+        for model in [Sample, Measurement{% if cookiecutter.register_to_models__project == "yes" %}, Dataset{% endif %}, *summaries.SAMPLE_LOOKUPS]:
+            uid = f"{{ cookiecutter.plugin_slug }}.summaries.{model._meta.label_lower}"
+            pre_delete.connect(summaries.pre_delete, sender=model, dispatch_uid=f"{uid}.pre_delete")
+            post_delete.connect(summaries.post_delete, sender=model, dispatch_uid=f"{uid}.post_delete")
+{%- endif %}
+{%- if cookiecutter.use_waffle == "yes" %}
+
+    def connect_flag_signals(self):
+        """Drop the feature flags held by this process whenever a flag is saved or deleted."""
+        from django.db.models.signals import post_delete, post_save
+        from waffle import get_waffle_flag_model
+
+        from . import flags
+
+        uid = "{{ cookiecutter.plugin_slug }}.flags"
+        post_save.connect(flags.invalidate, sender=get_waffle_flag_model(), dispatch_uid=f"{uid}.post_save")
+        post_delete.connect(flags.invalidate, sender=get_waffle_flag_model(), dispatch_uid=f"{uid}.post_delete")
+{%- endif %}
@@ -0,0 +1,118 @@
+"""
+Fingerprinted, precompressed static assets for {{ cookiecutter.plugin_name }}.
+
+The sources live in ``static/{{ cookiecutter.plugin_slug }}/``. Building the bundle writes a copy of
+every source file to ``static/{{ cookiecutter.plugin_slug }}/dist/`` under a content-hashed name
+(``js/{{ cookiecutter.plugin_slug }}.3f2a1b9c0d12.js``), a ``.gz`` sibling and, if the optional
+``brotli`` package is installed, a ``.br`` sibling. ``dist/staticfiles.json``
+maps the source names to the hashed names in the format read by Django's
+``ManifestStaticFilesStorage``; the ``plugin_asset`` template tag resolves URLs
+through it.
+
+Because a file's name changes whenever its content does, the bundle can be
+served with far-future cache headers, and the web server (or WhiteNoise) sends
+the precompressed siblings without compressing anything per request.
+
+Run the build after editing the sources and before ``poetry build``::
+
+    python -m {{ cookiecutter.plugin_slug }}.assets
+
+This module only uses the standard library, so the build runs without Django
+settings.
+"""
+
+import gzip
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+SOURCE_DIR = Path(__file__).resolve().parent / "static" / "{{ cookiecutter.plugin_slug }}"
+OUTPUT_DIR = SOURCE_DIR / "dist"
+# Same manifest name and version as Django's ManifestStaticFilesStorage
+MANIFEST_NAME = "staticfiles.json"
+MANIFEST_VERSION = "1.1"
+
+# Text formats worth compressing; images and fonts are compressed already
+COMPRESSIBLE = {".css", ".js", ".json", ".map", ".svg", ".txt", ".xml", ".html"}
+
+
+def file_hash(content):
+    """Return the 12-character content hash that ManifestStaticFilesStorage also uses."""
+    return hashlib.md5(content, usedforsecurity=False).hexdigest()[:12]
+
+
+def hashed_name(name, content):
+    """Return ``name`` with the hash of ``content`` inserted before its suffix."""
+    path = Path(name)
+    return path.with_name(f"{path.stem}.{file_hash(content)}{path.suffix}").as_posix()
+
+
+def compress(path, content):
+    """Write the ``.gz`` and ``.br`` siblings of ``path``; return the suffixes written."""
+    written = []
+    # mtime=0 keeps the output byte-identical across builds
+    compressed = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressed[".br"] = brotli.compress(content, quality=11)
+    for suffix, data in compressed.items():
+        # Servers fall back to the original when a sibling is missing
+        if len(data) < len(content):
+            path.with_name(path.name + suffix).write_bytes(data)
+            written.append(suffix)
+    return written
+
+
+def find_sources(source_dir, output_dir):
+    """Yield the source files below ``source_dir``, skipping the build output."""
+    for path in sorted(source_dir.rglob("*")):
+        if path.is_file() and output_dir not in path.parents and not path.name.startswith("."):
+            yield path
+
+
+def build(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR):
+    """
+    Rebuild the bundle from scratch and write its manifest.
+
+    Returns the ``{source name: hashed name}`` mapping stored in the manifest.
+    """
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+
+    paths = {}
+    for source in find_sources(source_dir, output_dir):
+        name = source.relative_to(source_dir).as_posix()
+        content = source.read_bytes()
+        paths[name] = hashed_name(name, content)
+        target = output_dir / paths[name]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        if source.suffix in COMPRESSIBLE:
+            compress(target, content)
+
+    manifest = {
+        "paths": paths,
+        "version": MANIFEST_VERSION,
+        "hash": file_hash(json.dumps(sorted(paths.items())).encode()),
+    }
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return paths
+
+
+def main():
+    """Build the bundle and list the hashed names."""
+    paths = build()
+    for name, hashed in paths.items():
+        print(f"{name} -> {hashed}")
+    formats = "gzip and brotli" if brotli is not None else "gzip (install brotli for .br files)"
+    print(f"Built {len(paths)} assets into {OUTPUT_DIR} with {formats}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Rendered-panel cache for {{ cookiecutter.plugin_name }}.
+
+The plugin block in ``{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}.html`` is wrapped in a
+``{% raw %}{% cache %}{% endraw %}`` fragment that varies on the model, the primary key of
+``base_object`` and a version token. Saving or deleting a registered object
+replaces its version token (see ``apps.py``), so stale panels are never served
+and simply expire from the cache backend.
+"""
+
+import time
+
+from django.core.cache import caches
+
+from .conf import get_settings
+
+FRAGMENT_NAME = "{{ cookiecutter.plugin_slug }}_panel"
+
+
+def get_cache():
+    """Return the cache backend that stores rendered panels."""
+    return caches[get_cache_alias()]
+
+
+def get_cache_alias():
+    """Return the alias of the cache backend that stores rendered panels."""
+    return get_settings().CACHE_ALIAS
+
+
+def get_cache_timeout():
+    """Return how long, in seconds, a rendered panel is kept; 0 while the cache is disabled."""
+    plugin_settings = get_settings()
+    return plugin_settings.CACHE_TIMEOUT if plugin_settings.RENDER_CACHE_ENABLED else 0
+
+
+def get_root_model(instance):
+    """
+    Return the topmost concrete model of ``instance``.
+
+    Subclasses (e.g. the polymorphic Sample types) share the primary key of
+    their root model, so keying versions on it lets a save through any
+    subclass retire the panels of the same object.
+    """
+    model = instance._meta.concrete_model
+    parents = model._meta.get_parent_list()
+    # Direct parents come first, so the last one is the root of the chain
+    return parents[-1] if parents else model
+
+
+def _version_key(instance):
+    return f"{{ cookiecutter.plugin_slug }}:panel-version:{get_root_model(instance)._meta.label_lower}:{instance.pk}"
+
+
+def get_version(instance):
+    """Return the current version token for ``instance``, creating one if needed."""
+    return get_cache().get_or_set(_version_key(instance), time.time_ns, timeout=None)
+
+
+def get_panel_key(instance):
+    """Return the key the rendered panel of ``instance`` is cached under."""
+    return f"{instance._meta.label_lower}:{instance.pk}:{get_version(instance)}"
+
+
+def invalidate(sender, instance, **kwargs):
+    """Signal receiver that retires every cached panel for ``instance``."""
+    get_cache().set(_version_key(instance), time.time_ns(), timeout=None)
@@ -0,0 +1,130 @@
+"""
+Typed settings for {{ cookiecutter.plugin_name }}.
+
+Every ``{{ cookiecutter.plugin_slug.upper() }}_*`` setting is read from Django settings once, validated
+and stored on a frozen :class:`PluginSettings` instance, so hot paths read a
+plain attribute instead of calling ``getattr(settings, ...)`` on every request.
+The settings are loaded in ``AppConfig.ready()``, which makes invalid values
+fail at startup, and reloaded whenever Django's ``setting_changed`` signal
+reports a change (e.g. ``override_settings`` or pytest-django's ``settings``
+fixture).
+
+Example usage:
+    from .conf import get_settings
+    budget = get_settings().QUERY_BUDGET
+"""
+
+import threading
+from dataclasses import dataclass, fields
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+PREFIX = "{{ cookiecutter.plugin_slug.upper() }}_"
+
+
+@dataclass(frozen=True)
+class PluginSettings:
+    """
+    Settings of {{ cookiecutter.plugin_name }} and their defaults.
+
+    Each field is configured in Django settings with the ``{{ cookiecutter.plugin_slug.upper() }}_`` prefix,
+    e.g. ``{{ cookiecutter.plugin_slug.upper() }}_QUERY_BUDGET``. Add a field here for every new setting.
+    """
+
+    # Maximum number of queries a single plugin render may run
+    QUERY_BUDGET: int = 10
+    # Milliseconds the plugin may add to Django startup by being imported
+    IMPORT_TIME_BUDGET: int = 100
+{%- if cookiecutter.use_render_cache == "yes" %}
+    # Rendered-panel cache
+    RENDER_CACHE_ENABLED: bool = True
+    CACHE_ALIAS: str = "default"
+    CACHE_TIMEOUT: int = 60 * 15
+{%- endif %}
+{%- if cookiecutter.use_conditional_get == "yes" %}
+    # Conditional GET (ETag / Last-Modified)
+    CONDITIONAL_GET_ENABLED: bool = True
+{%- endif %}
+{%- if cookiecutter.use_background_tasks == "yes" %}
+    # Background tasks
+    TASK_BACKEND: str = "{{ cookiecutter.plugin_slug }}.tasks.ThreadPoolBackend"
+    TASK_WORKERS: int = 4
+    TASK_QUEUE_SIZE: int = 100
+    TASK_MAX_JOBS: int = 1000
+{%- endif %}
+{%- if "yes" in (cookiecutter.use_child_listing, cookiecutter.use_json_api) and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+    # Rows per page of child objects
+    PAGE_SIZE: int = 25
+{%- endif %}
+{%- if cookiecutter.use_json_api == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+    # Largest page a JSON API client may request with ?limit=
+    API_MAX_PAGE_SIZE: int = 500
+{%- endif %}
+{%- if cookiecutter.use_waffle == "yes" %}
+    # Seconds each process keeps the waffle flags before reloading them
+    FEATURE_FLAG_TTL: int = 30
+{%- endif %}
+
+    def __post_init__(self):
+        for field in fields(self):
+            value = getattr(self, field.name)
+            # bool is a subclass of int, but True is never a valid query budget
+            if not isinstance(value, field.type) or (field.type is int and isinstance(value, bool)):
+                raise ImproperlyConfigured(f"{PREFIX}{field.name} must be {field.type.__name__}, not {value!r}.")
+        self.check_minimum("QUERY_BUDGET", 1)
+        self.check_minimum("IMPORT_TIME_BUDGET", 1)
+{%- if cookiecutter.use_render_cache == "yes" %}
+        self.check_minimum("CACHE_TIMEOUT", 0)
+{%- endif %}
+{%- if cookiecutter.use_background_tasks == "yes" %}
+        self.check_minimum("TASK_WORKERS", 1)
+        self.check_minimum("TASK_QUEUE_SIZE", 1)
+        self.check_minimum("TASK_MAX_JOBS", 1)
+{%- endif %}
+{%- if "yes" in (cookiecutter.use_child_listing, cookiecutter.use_json_api) and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+        self.check_minimum("PAGE_SIZE", 1)
+{%- endif %}
+{%- if cookiecutter.use_json_api == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+        self.check_minimum("API_MAX_PAGE_SIZE", 1)
+{%- endif %}
+{%- if cookiecutter.use_waffle == "yes" %}
+        self.check_minimum("FEATURE_FLAG_TTL", 0)
+{%- endif %}
+
+    def check_minimum(self, name, minimum):
+        """Raise ImproperlyConfigured if the setting ``name`` is below ``minimum``."""
+        value = getattr(self, name)
+        if value < minimum:
+            raise ImproperlyConfigured(f"{PREFIX}{name} must be at least {minimum}, not {value!r}.")
+
+
+_settings = None
+_lock = threading.Lock()
+
+
+def load():
+    """Read, validate and store the plugin settings, returning the new instance."""
+    global _settings
+    values = {}
+    for field in fields(PluginSettings):
+        name = PREFIX + field.name
+        if hasattr(settings, name):
+            values[field.name] = getattr(settings, name)
+    with _lock:
+        _settings = PluginSettings(**values)
+        return _settings
+
+
+def get_settings():
+    """Return the current plugin settings, loading them on first use."""
+    return _settings or load()
+
+
+@receiver(setting_changed)
+def reload_settings(sender, setting, **kwargs):
+    """Reload the plugin settings when one of them is changed."""
+    if setting.startswith(PREFIX):
+        load()
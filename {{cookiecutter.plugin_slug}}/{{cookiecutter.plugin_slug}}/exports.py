@@ -0,0 +1,93 @@
+"""
+Streaming exports for {{ cookiecutter.plugin_name }}.
+
+Samples and measurements are read in chunks with ``values_list().iterator()``
+and written to the response one row at a time, so memory use stays flat no
+matter how many rows a Dataset holds.
+"""
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, StreamingHttpResponse
+from fairdm.core.dataset.models import Dataset
+from fairdm.core.measurement.models import Measurement
+from fairdm.core.project.models import Project
+from fairdm.core.sample.models import Sample
+
+# Rows fetched from the database per round trip
+CHUNK_SIZE = 2000
+
+# Columns of the export; each row is (record type, *fields)
+COLUMNS = ("type", "id", "name", "parent_id")
+SAMPLE_FIELDS = ("id", "name", "dataset_id")
+MEASUREMENT_FIELDS = ("id", "name", "sample_id")
+
+# How samples are looked up from each supported model
+SAMPLE_LOOKUPS = {
+    Project: "dataset__project",
+    Dataset: "dataset",
+}
+
+
+class Echo:
+    """File-like object that hands back each written value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def get_sample_lookup(base_object):
+    """Return the Sample filter lookup for ``base_object``, or raise Http404."""
+    for model in type(base_object).__mro__:
+        if model in SAMPLE_LOOKUPS:
+            return SAMPLE_LOOKUPS[model]
+    raise Http404(f"{base_object._meta.verbose_name} cannot be exported.")
+
+
+def iter_records(base_object):
+    """Yield one tuple per sample, then per measurement, belonging to ``base_object``."""
+    lookup = get_sample_lookup(base_object)
+
+    samples = Sample.objects.filter(**{lookup: base_object}).order_by("pk").values_list(*SAMPLE_FIELDS)
+    for row in samples.iterator(chunk_size=CHUNK_SIZE):
+        yield ("sample", *row)
+
+    measurements = (
+        Measurement.objects.filter(**{f"sample__{lookup}": base_object}).order_by("pk").values_list(*MEASUREMENT_FIELDS)
+    )
+    for row in measurements.iterator(chunk_size=CHUNK_SIZE):
+        yield ("measurement", *row)
+
+
+def stream_csv(records):
+    """Yield the records as CSV lines, starting with a header."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(COLUMNS)
+    for record in records:
+        yield writer.writerow(record)
+
+
+def stream_ndjson(records):
+    """Yield the records as newline-delimited JSON objects."""
+    for record in records:
+        yield json.dumps(dict(zip(COLUMNS, record, strict=True)), cls=DjangoJSONEncoder) + "\n"
+
+
+FORMATS = {
+    "csv": (stream_csv, "text/csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
+
+
+def export_response(base_object, export_format, filename):
+    """Return a streaming download of ``base_object`` in ``export_format``."""
+    if export_format not in FORMATS:
+        raise Http404(f"Unknown export format: {export_format}")
+    get_sample_lookup(base_object)
+
+    stream, content_type = FORMATS[export_format]
+    response = StreamingHttpResponse(stream(iter_records(base_object)), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
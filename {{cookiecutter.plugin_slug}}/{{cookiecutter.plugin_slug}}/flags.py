@@ -0,0 +1,66 @@
+"""
+Feature flags for {{ cookiecutter.plugin_name }}, backed by django-waffle.
+
+The plugin answers 404 unless the waffle flag named by its ``feature_flag``
+is active for the request. The plugin menu is built by FairDM, which does not
+consult the flag, so the menu entry stays listed while the flag is inactive.
+Asking waffle directly on every request would read the flag from the database
+each time, so here flags are:
+
+1. held in this process for ``{{ cookiecutter.plugin_slug.upper() }}_FEATURE_FLAG_TTL`` seconds. When the
+   copy expires, every flag is reloaded with a single query;
+2. dropped from this process as soon as a flag is saved or deleted through
+   the ORM (e.g. in the admin). Other processes see the change once their
+   copy expires;
+3. evaluated once per request (see memo.py), so every check of a flag in a
+   request shares a single result.
+
+Flags that target users or groups still look up the user's membership through
+waffle, once per request. A flag that does not exist is treated as
+``WAFFLE_FLAG_DEFAULT``. Create the flag with:
+
+    python manage.py waffle_flag {{ cookiecutter.plugin_slug }} --create --everyone
+"""
+
+import threading
+import time
+
+from waffle import get_waffle_flag_model
+from waffle.utils import get_setting
+
+from .conf import get_settings
+from .memo import get_memo
+
+_flags = None
+_expires = 0.0
+_lock = threading.Lock()
+
+
+def get_flags():
+    """Return ``{name: flag}`` for every waffle flag, reloading them once the TTL has passed."""
+    global _flags, _expires
+    with _lock:
+        if _flags is None or time.monotonic() >= _expires:
+            _flags = {flag.name: flag for flag in get_waffle_flag_model().objects.all()}
+            _expires = time.monotonic() + get_settings().FEATURE_FLAG_TTL
+        return _flags
+
+
+def invalidate(sender=None, **kwargs):
+    """Drop the flags held by this process, so the next check reloads them."""
+    global _flags
+    with _lock:
+        _flags = None
+
+
+def is_active(request, name):
+    """Return True if the waffle flag ``name`` is active for ``request``."""
+    key = ("feature_flag", name)
+    memo = get_memo(request)
+    if key not in memo:
+        flag = get_flags().get(name)
+        if flag is None:
+            memo[key] = bool(get_setting("FLAG_DEFAULT"))
+        else:
+            memo[key] = bool(flag.is_active(request))
+    return memo[key]
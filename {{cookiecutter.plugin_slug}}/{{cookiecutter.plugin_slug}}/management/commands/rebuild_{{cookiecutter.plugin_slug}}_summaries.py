@@ -0,0 +1,24 @@
+"""Recompute every {{ cookiecutter.plugin_name }} summary from the database."""
+
+from django.core.management.base import BaseCommand
+
+from ... import summaries
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the {{ cookiecutter.plugin_name }} summary store. Run after bulk imports, "
+        "queryset updates or loaddata, which do not send the signals that keep it current."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of summary rows written per INSERT (default: 1000).",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        count = summaries.rebuild(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} summaries."))
@@ -0,0 +1,31 @@
+"""Warm up {{ cookiecutter.plugin_name }} after a deploy, reporting how long each step took."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the {{ cookiecutter.plugin_name }} modules and templates, resolve its plugin views "
+        "and optionally prime the per-object caches, so the first requests after a deploy are not "
+        "slower than later ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prime",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Render the plugin for the N most recently modified objects of each registered model (default: 0).",
+        )
+
+    def handle(self, *args, prime, **options):
+        if prime < 0:
+            raise CommandError("--prime must be at least 0.")
+        steps = warmup.warm_up(count=prime)
+        for step in steps:
+            self.stdout.write(str(step))
+        total = sum(step.seconds for step in steps)
+        self.stdout.write(self.style.SUCCESS(f"Warmed up in {total * 1000:.1f} ms."))
@@ -0,0 +1,102 @@
+"""
+Request-scoped memoization for {{ cookiecutter.plugin_name }}.
+
+While one request is served, the same expensive helper is often called from
+get_context_data(), from the template and from a permission check. The
+helpers here run it once per request and hand the result to every caller:
+
+    from .memo import object_property, request_memoize
+
+    class MyPlugin(...):
+        @request_memoize
+        def get_my_data(self, limit=10):
+            ...
+
+        @object_property
+        def sample_total(self):
+            return self.base_object.samples.count()
+
+Results are stored on the request object, so they are discarded together with
+the request: nothing is reused by a later request, where it could be stale,
+and nothing accumulates in the process. Both helpers key results by the model
+and primary key of ``self.base_object``, so reloading base_object (see
+get_base_object()) keeps the results and switching to another object does
+not reuse them.
+"""
+
+import functools
+
+# Attribute of the request that holds the memoized results
+MEMO_ATTRIBUTE = "_{{ cookiecutter.plugin_slug }}_memo"
+
+
+def get_memo(request, attribute=MEMO_ATTRIBUTE):
+    """Return the dictionary of results memoized for ``request``, creating it on first use."""
+    memo = getattr(request, attribute, None)
+    if memo is None:
+        memo = {}
+        setattr(request, attribute, memo)
+    return memo
+
+
+def object_key(view):
+    """Return ``(model label, pk)`` of the view's base_object, or None if it has none."""
+    base_object = getattr(view, "base_object", None)
+    if base_object is None:
+        return None
+    return base_object._meta.label_lower, base_object.pk
+
+
+def memoize(view, key, compute):
+    """
+    Return the result memoized under ``key`` for the view's request, computing it if needed.
+
+    Without a request (e.g. a view built by hand in a test) nothing is stored.
+    """
+    request = getattr(view, "request", None)
+    if request is None:
+        return compute()
+    memo = get_memo(request)
+    key = (*key, object_key(view))
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+
+def request_memoize(method):
+    """
+    Run a view method at most once per request for each set of arguments.
+
+    The arguments must be hashable. Exceptions are not memoized, so a failed
+    call is retried by the next caller.
+    """
+    name = f"{method.__module__}.{method.__qualname__}"
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        return memoize(self, key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+class object_property:
+    """
+    A read-only property computed once per request for each base_object.
+
+    Unlike ``functools.cached_property``, the value is kept on the request,
+    so it is shared by every view instance serving that request.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        functools.update_wrapper(self, func)
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return memoize(view, (self.name,), lambda: self.func(view))
+
+    def __set__(self, view, value):
+        raise AttributeError(f"{self.__name__} is read-only")
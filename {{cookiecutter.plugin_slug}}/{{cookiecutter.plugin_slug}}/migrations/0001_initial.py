@@ -0,0 +1,33 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Summary",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("object_id", models.CharField(max_length=64)),
+                ("sample_count", models.IntegerField(default=0)),
+                ("measurement_count", models.IntegerField(default=0)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "summaries",
+                "constraints": [
+                    models.UniqueConstraint(fields=("content_type", "object_id"), name="{{ cookiecutter.plugin_slug }}_summary_object"),
+                ],
+            },
+        ),
+    ]
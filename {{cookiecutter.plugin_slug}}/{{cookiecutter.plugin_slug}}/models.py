@@ -0,0 +1,31 @@
+"""
+Models for {{ cookiecutter.plugin_name }}.
+
+``Summary`` holds precomputed counts for the objects the plugin is shown on,
+so a render reads a single indexed row instead of aggregating every sample
+and measurement (see summaries.py).
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class Summary(models.Model):
+    """Sample and measurement counts of one Project or Dataset."""
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    # CharField so the summary works whatever the primary key type of the object
+    object_id = models.CharField(max_length=64)
+    sample_count = models.IntegerField(default=0)
+    measurement_count = models.IntegerField(default=0)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "summaries"
+        constraints = [
+            models.UniqueConstraint(fields=["content_type", "object_id"], name="{{ cookiecutter.plugin_slug }}_summary_object"),
+        ]
+
+    def __str__(self):
+        counts = f"{self.sample_count} samples, {self.measurement_count} measurements"
+        return f"{self.content_type.model} {self.object_id}: {counts}"
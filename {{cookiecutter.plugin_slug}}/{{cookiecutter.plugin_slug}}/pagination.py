@@ -0,0 +1,167 @@
+{%- set project = cookiecutter.register_to_models__project == "yes" %}
+{%- set dataset = cookiecutter.register_to_models__dataset == "yes" %}
+{%- set sample = cookiecutter.register_to_models__sample == "yes" -%}
+"""
+Keyset (cursor) pagination for {{ cookiecutter.plugin_name }}.
+
+OFFSET pagination makes the database read and throw away every row before the
+requested page, so the last page of a large Dataset is the slowest. A keyset
+paginator instead remembers the ordering key of the last row shown and asks for
+the rows after it (``WHERE pk > <cursor> ORDER BY pk LIMIT <n>``), a range scan
+on an index that costs the same for every page.
+
+The cursor is the ordering key of the last row, JSON-encoded in URL-safe
+base64. It is opaque to clients and only ever compared, never trusted: an
+invalid cursor raises :class:`InvalidCursor`.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max, Q
+{% if project or dataset %}from fairdm.core.dataset.models import Dataset
+{% endif %}{% if sample %}from fairdm.core.measurement.models import Measurement
+{% endif %}{% if project %}from fairdm.core.project.models import Project
+{% endif %}{% if dataset or sample %}from fairdm.core.sample.models import Sample
+{% endif %}
+from .conf import get_settings
+
+# Child objects listed for each registered model, and their foreign key to it
+CHILDREN = {
+{%- if project %}
+    Project: (Dataset, "project"),
+{%- endif %}{% if dataset %}
+    Dataset: (Sample, "dataset"),
+{%- endif %}{% if sample %}
+    Sample: (Measurement, "sample"),
+{%- endif %}
+}
+
+# Ordering key of the child listings. Keep it on indexed fields; the primary
+# key is appended when missing so that every row has a unique position.
+ORDERING = ("pk",)
+
+
+class InvalidCursor(InvalidPage):
+    """The cursor was not produced by this paginator."""
+
+
+@dataclass(frozen=True)
+class Page:
+    """One page of a keyset-paginated listing."""
+
+    object_list: list
+    # Cursor of the page that was requested, None for the first page
+    cursor: str | None
+    # Cursor of the following page, None on the last page
+    next_cursor: str | None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Page through ``queryset`` by the values of its ordering key.
+
+    Works with model instances as well as ``values()`` rows, as long as the
+    rows include every field of the ordering.
+    """
+
+    def __init__(self, queryset, ordering=ORDERING, page_size=None):
+        pk_name = queryset.model._meta.pk.attname
+        # Resolve "pk" to the attribute name, so values() rows can be read too
+        ordering = [
+            f"{'-' if field.startswith('-') else ''}{pk_name if field.lstrip('-') == 'pk' else field.lstrip('-')}"
+            for field in ordering
+        ]
+        if not any(field.lstrip("-") == pk_name for field in ordering):
+            ordering.append(pk_name)
+        self.ordering = tuple(ordering)
+        self.queryset = queryset.order_by(*self.ordering)
+        self.page_size = page_size or get_settings().PAGE_SIZE
+
+    def encode_cursor(self, row):
+        """Return the cursor pointing just after ``row``."""
+        names = [field.lstrip("-") for field in self.ordering]
+        values = [row[name] for name in names] if isinstance(row, dict) else [getattr(row, name) for name in names]
+        data = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    def decode_cursor(self, cursor):
+        """Return the ordering key values stored in ``cursor``."""
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursor("Invalid cursor.") from e
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor("Invalid cursor.")
+        return values
+
+    def after(self, values):
+        """
+        Return the filter selecting the rows that sort after ``values``.
+
+        For an ordering (a, b, pk) this is ``a > x OR (a = x AND b > y) OR
+        (a = x AND b = y AND pk > z)``, with < for descending fields.
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, values, strict=True):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
+
+    def get_page(self, cursor=None):
+        """Return the page after ``cursor``, or the first page."""
+        queryset = self.queryset
+        if cursor:
+            try:
+                queryset = queryset.filter(self.after(self.decode_cursor(cursor)))
+            except (TypeError, ValueError, ValidationError) as e:
+                # Values of the wrong type for the ordering fields
+                raise InvalidCursor("Invalid cursor.") from e
+        # One extra row tells whether there is a next page without a COUNT query
+        rows = list(queryset[: self.page_size + 1])
+        next_cursor = self.encode_cursor(rows[self.page_size - 1]) if len(rows) > self.page_size else None
+        return Page(rows[: self.page_size], cursor or None, next_cursor)
+
+
+def get_children(base_object):
+    """Return the queryset of the child objects of ``base_object``, or None if it has none."""
+    for model in type(base_object).__mro__:
+        if model in CHILDREN:
+            child_model, field = CHILDREN[model]
+            return child_model.objects.filter(**{field: base_object})
+    return None
+
+
+def get_child_page(base_object, cursor=None):
+    """Return the page of the children of ``base_object`` after ``cursor``, or None if it has none."""
+    children = get_children(base_object)
+    if children is None:
+        return None
+    return KeysetPaginator(children).get_page(cursor)
+
+
+def get_child_state(base_object, modified_field):
+    """
+    Return ``(count, latest modification time)`` of the children of ``base_object``.
+
+    Both come from one aggregate query, and together they change whenever a
+    child is added, edited or removed. Returns None if ``base_object`` has no
+    children to list.
+    """
+    children = get_children(base_object)
+    if children is None:
+        return None
+    state = children.aggregate(count=Count("pk"), latest=Max(modified_field))
+    return state["count"], state["latest"]
@@ -0,0 +1,80 @@
+"""
+Permission checks for {{ cookiecutter.plugin_name }}, batched per request.
+
+``user.has_perm(perm, obj)`` asks every authentication backend again on each
+call, so when several plugins are registered to the same model, each of them
+repeats the same lookups for the same object. Here the user's permissions for
+an object are fetched once per request and every later check is answered from
+that set. The set is shared with every other plugin generated from the FairDM
+plugin template, so the plugins of a detail page look the permissions up once:
+
+    from .permissions import has_perm
+
+    if not has_perm(request, "view_{model_name}", self.base_object):
+        raise PermissionDenied
+
+Permissions may be written as ``app_label.codename`` or as a bare codename,
+which is looked up in the app of the object. ``{model_name}`` is replaced by
+the model name of the object, so one plugin can be registered to several
+models. The set is stored on the request (see memo.py), so a permission
+granted or revoked is seen by the next request.
+"""
+
+from .memo import get_memo
+
+# Attribute of the request that holds the permission sets. Unlike the memo of
+# memo.py it is not specific to this plugin: every plugin generated from the
+# FairDM plugin template stores the same sets under the same keys there.
+PERMISSIONS_ATTRIBUTE = "_fairdm_plugin_permissions"
+
+
+def normalize(perm, obj):
+    """Return ``perm`` for ``obj`` as ``app_label.codename``."""
+    perm = perm.format(model_name=obj._meta.model_name)
+    if "." not in perm:
+        perm = f"{obj._meta.app_label}.{perm}"
+    return perm
+
+
+def get_permissions(request, obj):
+    """
+    Return the set of permissions the user of ``request`` has on ``obj``.
+
+    This combines the user's model-level permissions with the object-level
+    permissions of backends such as django-guardian. The backends are only
+    asked on the first call for each user and object in a request, by this
+    plugin or any other that shares PERMISSIONS_ATTRIBUTE.
+    """
+    user = request.user
+    key = (user.pk, obj._meta.label_lower, obj.pk)
+    memo = get_memo(request, PERMISSIONS_ATTRIBUTE)
+    if key not in memo:
+        # Object permission backends may return bare codenames
+        object_permissions = {normalize(perm, obj) for perm in user.get_all_permissions(obj)}
+        memo[key] = frozenset(user.get_all_permissions() | object_permissions)
+    return memo[key]
+
+
+def has_perm(request, perm, obj):
+    """Return True if the user of ``request`` has ``perm`` on ``obj``."""
+    return has_perms(request, [perm], obj)
+
+
+def has_perms(request, perms, obj):
+    """Return True if the user of ``request`` has every permission in ``perms`` on ``obj``."""
+    if not perms:
+        return True
+    user = request.user
+    # Matches Django's ModelBackend, which grants active superusers everything
+    if user.is_active and user.is_superuser:
+        return True
+    granted = get_permissions(request, obj)
+    return all(normalize(perm, obj) in granted for perm in perms)
+
+
+def get_required_permissions(plugin, attribute="permission_required"):
+    """Return the ``permission_required`` (or another ``attribute``) of a plugin class or instance as a tuple."""
+    perms = getattr(plugin, attribute, ())
+    if isinstance(perms, str):
+        return (perms,)
+    return tuple(perms)
@@ -1,11 +1,34 @@
-from django.utils.translation import gettext_lazy as _
-from django.views.generic.base import TemplateView
+{%- set streaming_export = cookiecutter.use_streaming_export == "yes" and cookiecutter.plugin_category == "ACTIONS" %}
+{%- set background_tasks = cookiecutter.use_background_tasks == "yes" %}
+{%- set conditional_get = cookiecutter.use_conditional_get == "yes" %}
+{%- set summary_store = cookiecutter.use_summary_store == "yes" and (cookiecutter.register_to_models__project == "yes" or cookiecutter.register_to_models__dataset == "yes") %}
+{%- set child_listing = cookiecutter.use_child_listing == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+{%- set waffle = cookiecutter.use_waffle == "yes" %}
+{%- set json_api = cookiecutter.use_json_api == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+{%- set local_modules = ["__version__" if conditional_get else "", "cache" if cookiecutter.use_render_cache == "yes" else "", "flags" if waffle else "", "permissions", "summaries" if summary_store else ""] | select | list -%}
+{% if conditional_get %}import hashlib
+
+{% endif %}from django.core.exceptions import PermissionDenied
+{% if background_tasks %}from django.http import Http404, JsonResponse
+{% elif child_listing or waffle %}from django.http import Http404
+{% endif %}{% if conditional_get %}from django.utils.cache import patch_cache_control, patch_vary_headers
+{% endif %}from django.utils.translation import gettext_lazy as _
+{% if conditional_get %}from django.views.decorators.http import condition
+{% endif %}from django.views.generic.base import TemplateView
 from fairdm import plugins
 {% if cookiecutter.register_to_models__project == "yes" %}from fairdm.core.project.models import Project
 {% endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}from fairdm.core.dataset.models import Dataset
 {% endif %}{% if cookiecutter.register_to_models__sample == "yes" %}from fairdm.core.sample.models import Sample
 {% endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}from fairdm.core.measurement.models import Measurement
 {% endif %}
+from . import {{ local_modules | join(", ") }}
+{%- if conditional_get %}
+from .conf import get_settings
+{%- endif %}
+{%- if (conditional_get and child_listing) or summary_store %}
+from .memo import request_memoize
+{%- endif %}
+
 
 @plugins.register({% if cookiecutter.register_to_models__project == "yes" %}Project{% endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}{% if cookiecutter.register_to_models__project == "yes" %}, {% endif %}Dataset{% endif %}{% if cookiecutter.register_to_models__sample == "yes" %}{% if cookiecutter.register_to_models__project == "yes" or cookiecutter.register_to_models__dataset == "yes" %}, {% endif %}Sample{% endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}{% if cookiecutter.register_to_models__project == "yes" or cookiecutter.register_to_models__dataset == "yes" or cookiecutter.register_to_models__sample == "yes" %}, {% endif %}Measurement{% endif %})
 class {{ cookiecutter.plugin_class_name }}(plugins.FairDMPlugin, TemplateView):
@@ -27,18 +50,445 @@ class {{ cookiecutter.plugin_class_name }}(plugins.FairDMPlugin, TemplateView):
         icon="{{ cookiecutter.icon_name }}",
     )
     template_name = "{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}.html"
+{%- if cookiecutter.use_deferred_content == "yes" %}
+    partial_template_name = "{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}_content.html"
+    partial_parameter = "partial"
+{%- endif %}
+{%- if streaming_export %}
+    export_parameter = "export"
+{%- endif %}
+{%- if background_tasks %}
+    job_parameter = "job"
+{%- endif %}
+{%- if child_listing %}
+    listing_template_name = "{{ cookiecutter.plugin_slug }}/{{ cookiecutter.plugin_slug }}_children.html"
+    listing_parameter = "listing"
+{%- endif %}
+{%- if child_listing or json_api %}
+    cursor_parameter = "cursor"
+{%- endif %}
+{%- if json_api %}
+    format_parameter = "format"
+{%- endif %}
+
+    # Permissions the user needs on base_object to see the plugin, e.g.
+    # ["view_{model_name}"]. "{model_name}" is replaced by the model name of
+    # base_object and bare codenames are looked up in its app (see
+    # permissions.py). Empty means everyone who can see the object.
+    permission_required = ()
+{%- if background_tasks %}
+
+    # Permissions the user also needs on base_object to start the background
+    # task with a POST. Jobs can only be polled by the user who started them.
+    task_permission_required = ("change_{model_name}",)
+{%- endif %}
+{%- if waffle %}
+
+    # django-waffle flag that must be active for the request to serve the
+    # plugin (see flags.py). Set to None to always serve it.
+    feature_flag = "{{ cookiecutter.plugin_slug }}"
+{%- endif %}
+{%- if conditional_get %}
+
+    # Model field holding the modification time of base_object, used to build
+    # the ETag and Last-Modified headers. Set to None to disable conditional GET.
+    last_modified_field = "modified"
+    # Cache-Control directives for every response. The page depends on the
+    # user, so by default only the browser may keep it and it must revalidate
+    # (cheaply, via the ETag) before reusing it.
+    cache_control = {"private": True, "no_cache": True}
+{%- endif %}
+
+    # Related objects loaded together with base_object, per registered model.
+    # None by default, so base_object is used as FairDM loaded it. Add the
+    # relations your template renders so they cost no extra queries, e.g.
+    # ["project"] for a Dataset in select_related; base_object is then
+    # fetched again together with them.
+    select_related = {
+{%- if cookiecutter.register_to_models__project == "yes" %}
+        Project: [],
+{%- endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}
+        Dataset: [],
+{%- endif %}{% if cookiecutter.register_to_models__sample == "yes" %}
+        Sample: [],
+{%- endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}
+        Measurement: [],
+{%- endif %}
+    }
+    prefetch_related = {
+{%- if cookiecutter.register_to_models__project == "yes" %}
+        Project: [],
+{%- endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}
+        Dataset: [],
+{%- endif %}{% if cookiecutter.register_to_models__sample == "yes" %}
+        Sample: [],
+{%- endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}
+        Measurement: [],
+{%- endif %}
+    }
 
     def dispatch(self, request, *args, **kwargs):
         """
-        Override dispatch to add permission checks or feature flags.
+        Override dispatch to add further checks{% if not waffle %} or feature flags{% endif %}.
+        {% if waffle %}
+        The plugin answers 404 while its feature_flag is inactive.{% endif %}
+        Users without the permissions in permission_required are denied
+        before base_object is reloaded. For other checks, use the helpers in
+        permissions.py, which share one permission lookup per request:
         
-        Example: Check if user has permission to view this object:
-        
-        from django.core.exceptions import PermissionDenied
-        if not request.user.has_perm('view_project', self.base_object):
+        from .permissions import has_perm
+        if not has_perm(request, "change_{model_name}", self.base_object):
             raise PermissionDenied
         """
+{%- if waffle %}
+        if not self.is_enabled():
+            raise Http404
+{%- endif %}
+        if not self.has_permission():
+            raise PermissionDenied
+        self.base_object = self.get_base_object()
+{%- if conditional_get %}
+
+        # Answer 304 Not Modified without rendering when the client's copy is current
+        conditional_dispatch = condition(
+            etag_func=lambda request, *args, **kwargs: self.get_etag(),
+            last_modified_func=lambda request, *args, **kwargs: self.get_last_modified(),
+        )(super().dispatch)
+        response = conditional_dispatch(request, *args, **kwargs)
+        return self.patch_cache_headers(response)
+{%- else %}
         return super().dispatch(request, *args, **kwargs)
+{%- endif %}
+{%- if waffle %}
+
+    def is_enabled(self):
+        """Return True if the feature flag of the plugin is active for the request."""
+        return self.feature_flag is None or flags.is_active(self.request, self.feature_flag)
+{%- endif %}
+
+    def get_permission_required(self):
+        """Return the permissions the user needs on base_object to see the plugin."""
+        return permissions.get_required_permissions(self)
+
+    def has_permission(self):
+        """Return True if the user may see the plugin for base_object."""
+        return permissions.has_perms(self.request, self.get_permission_required(), self.base_object)
+
+    def get_related_lookups(self, lookups):
+        """Return the lookups in ``lookups`` that apply to the type of base_object."""
+        for model in type(self.base_object).__mro__:
+            if model in lookups:
+                return lookups[model]
+        return []
+
+    def get_base_queryset(self):
+        """
+        Return the queryset base_object is loaded from.
+        
+        By default this applies the select_related and prefetch_related
+        lookups configured for the model of base_object. Override it to add
+        annotations or only() / defer() calls for what your template renders.
+        """
+        queryset = type(self.base_object)._default_manager.all()
+        select_related = self.get_related_lookups(self.select_related)
+        prefetch_related = self.get_related_lookups(self.prefetch_related)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def get_base_object(self):
+        """
+        Reload base_object together with its related objects.
+        
+        The object is only fetched again when there is something to load
+        alongside it, so the plugin renders in a fixed number of queries.
+        """
+        if not (self.get_related_lookups(self.select_related) or self.get_related_lookups(self.prefetch_related)):
+            return self.base_object
+        return self.get_base_queryset().get(pk=self.base_object.pk)
+{%- if summary_store %}
+
+    @request_memoize
+    def get_summary(self):
+        """Return the precomputed counts of base_object, or None if its model is not summarised."""
+        return summaries.get_summary(self.base_object)
+{%- endif %}
+{%- if conditional_get %}
+
+    def is_conditional_request(self):
+        """
+        Return True when the response may be answered with 304 Not Modified.
+        
+        Only page renders qualify: their content depends on base_object{% if child_listing %}, its children{% endif %}
+        and the user alone.{% if background_tasks %} Job polling changes without base_object changing.{% endif %}{% if streaming_export %}
+        Exports depend on the child objects of base_object.{% endif %}{% if json_api %}
+        JSON responses depend on the child objects of base_object.{% endif %}
+        """
+        return (
+            get_settings().CONDITIONAL_GET_ENABLED
+            and self.request.method in ("GET", "HEAD")
+            and self.last_modified_field is not None{% if background_tasks %}
+            and self.job_parameter not in self.request.GET{% endif %}{% if streaming_export %}
+            and self.export_parameter not in self.request.GET{% endif %}{% if json_api %}
+            and self.request.GET.get(self.format_parameter) != "json"{% endif %}
+        )
+
+    def get_last_modified(self):
+        """
+        Return when base_object{% if child_listing %}, one of its listed children{% endif %}{% if summary_store %} or its summary{% endif %} was last modified, or None if unknown.
+        
+        Override this if the page also displays related objects, e.g. return
+        the latest of the object's and its parent's modification times.
+        """
+        if not self.is_conditional_request():
+            return None
+        last_modified = getattr(self.base_object, self.last_modified_field, None)
+{%- if child_listing or summary_store %}
+        if last_modified is None:
+            return None
+{%- endif %}
+{%- if child_listing %}
+        child_state = self.get_child_state()
+        if child_state is not None and child_state[1] is not None:
+            last_modified = max(last_modified, child_state[1])
+{%- endif %}
+{%- if summary_store %}
+        summary = self.get_summary()
+        if summary is not None:
+            last_modified = max(last_modified, summary.updated)
+{%- endif %}
+        return last_modified
+{%- if child_listing %}
+
+    @request_memoize
+    def get_child_state(self):
+        """
+        Return ``(count, latest modification time)`` of the listed children, or None.
+        
+        The child listing is rendered from these rows, so they are part of the
+        ETag: editing, adding or removing a child leaves base_object unchanged.
+        """
+        # Imported on first use so that registering the plugin stays cheap
+        from . import pagination
+
+        return pagination.get_child_state(self.base_object, self.last_modified_field)
+{%- endif %}
+
+    def get_permission_scope(self):
+        """
+        Return a string identifying what the current user is allowed to see.
+        
+        Users with the same scope are shown the same page, so the scope is part
+        of the ETag and changes in permissions invalidate cached copies.
+        """
+        user = self.request.user
+        if not user.is_authenticated:
+            return "anonymous"
+        # Shared with has_permission(), so this costs no further queries
+        granted = permissions.get_permissions(self.request, self.base_object)
+        return f"{user.pk}:{','.join(sorted(granted))}"
+
+    def get_etag(self):
+        """
+        Return the ETag of the page, or None if it cannot be determined.
+        
+        The ETag changes whenever base_object{% if child_listing %} or its children are{% else %} is{% endif %} modified,{% if summary_store %}
+        its summary is updated,{% endif %} the plugin is upgraded or the user's
+        permissions change. It also differs between the representations of the
+        page (the page itself{% if cookiecutter.use_deferred_content == "yes" %}, the deferred content{% endif %}{% if child_listing %}, each page of the child
+        listing{% endif %}).
+        """
+        last_modified = self.get_last_modified()
+        if last_modified is None:
+            return None
+        parts = [
+            self.base_object._meta.label,
+            str(self.base_object.pk),
+            last_modified.isoformat(),
+            __version__,
+            self.get_permission_scope(),
+            ",".join(self.get_template_names()),
+        ]
+{%- if child_listing %}
+        parts += [self.request.GET.get(self.cursor_parameter, ""), str(self.get_child_state())]
+{%- endif %}
+{%- if summary_store %}
+        # The stored counts are rendered too, and change without base_object changing
+        summary = self.get_summary()
+        parts.append(summary.updated.isoformat() if summary is not None else "")
+{%- endif %}
+        return hashlib.md5("|".join(parts).encode(), usedforsecurity=False).hexdigest()
+
+    def patch_cache_headers(self, response):
+        """Add the Cache-Control and Vary headers to ``response``."""
+        patch_cache_control(response, **self.cache_control)
+        patch_vary_headers(response, ["Cookie"])
+        return response
+{%- endif %}
+{%- if streaming_export or background_tasks or json_api %}
+
+    def get(self, request, *args, **kwargs):
+        """
+        Render the plugin page.
+        {% if background_tasks %}
+        Requests with ?job=<id> return the progress of a background job.{% endif %}{% if streaming_export %}
+        Requests with ?export=csv or ?export=ndjson stream an export.{% endif %}{% if json_api %}
+        Requests with ?format=json return the child objects as JSON.{% endif %}
+        """
+{%- if background_tasks %}
+        job_id = request.GET.get(self.job_parameter)
+        if job_id:
+            return self.job_status(job_id)
+{%- endif %}
+{%- if streaming_export %}
+        export_format = request.GET.get(self.export_parameter)
+        if export_format:
+            return self.export(export_format)
+{%- endif %}
+{%- if json_api %}
+        if request.GET.get(self.format_parameter) == "json":
+            return self.json_response()
+{%- endif %}
+        return super().get(request, *args, **kwargs)
+{%- endif %}
+{%- if json_api %}
+
+    def json_response(self):
+        """
+        Return a page of the child objects of base_object as JSON.
+        
+        Rows are serialized straight from values() and paged by keyset, so
+        clients can poll the plugin's data without the page being rendered
+        (see api.py).
+        """
+        # Imported on first use so that registering the plugin stays cheap
+        from . import api
+
+        return api.api_response(self.base_object, self.request, self.cursor_parameter)
+{%- endif %}
+{%- if streaming_export %}
+
+    def export(self, export_format):
+        """
+        Return a streaming export of the samples and measurements of base_object.
+        
+        Rows are read in chunks and written as they are produced (see
+        exports.py), so large datasets never have to fit in memory.
+        """
+        # Imported on first use so that registering the plugin stays cheap
+        from . import exports
+
+        filename = f"{{ cookiecutter.plugin_slug }}-{self.base_object._meta.model_name}-{self.base_object.pk}"
+        return exports.export_response(self.base_object, export_format, filename)
+
+    def can_export(self):
+        """Return True if base_object is of a model the export supports (see exports.SAMPLE_LOOKUPS)."""
+        # Imported on first use so that registering the plugin stays cheap
+        from . import exports
+
+        return bool(self.get_related_lookups(exports.SAMPLE_LOOKUPS))
+{%- endif %}
+{%- if background_tasks %}
+
+    def post(self, request, *args, **kwargs):
+        """
+        Start the background task for base_object and return its job id.
+        
+        Users without task_permission_required are denied. While the task
+        backend is full, the request is answered with 503 Service Unavailable.
+        """
+        # Imported on first use so that registering the plugin stays cheap
+        from . import tasks
+
+        if not permissions.has_perms(request, self.get_task_permission_required(), self.base_object):
+            raise PermissionDenied
+        try:
+            job_id = self.enqueue_task()
+        except tasks.QueueFull:
+            return JsonResponse({"error": "Too many jobs are running, try again later."}, status=503)
+        status_url = f"{request.path}?{self.job_parameter}={job_id}"
+        return JsonResponse({"job": job_id, "status_url": status_url}, status=202)
+
+    def get_task_permission_required(self):
+        """Return the permissions the user needs on base_object to start the background task."""
+        return permissions.get_required_permissions(self, "task_permission_required")
+
+    def get_job_owner(self):
+        """Return who a job belongs to: the object it runs for and the user who started it."""
+        return self.base_object._meta.label_lower, self.base_object.pk, self.request.user.pk
+
+    def enqueue_task(self):
+        """
+        Hand the plugin's long-running work to the task backend.
+        
+        Pass plain values such as the model label and primary key, never
+        model instances: the task runs outside this request (see tasks.py).
+        """
+        # Imported on first use so that registering the plugin stays cheap
+        from . import tasks
+
+        return tasks.get_backend().enqueue(
+            tasks.recompute, self.base_object._meta.label, self.base_object.pk, owner=self.get_job_owner()
+        )
+
+    def job_status(self, job_id):
+        """Return the state and progress of a background job as JSON, if the user started it for base_object."""
+        # Imported on first use so that registering the plugin stays cheap
+        from . import tasks
+
+        job = tasks.get_backend().get_job(job_id)
+        # Other users' jobs are answered like unknown ones, so job ids cannot be probed
+        if job is None or job.owner != self.get_job_owner():
+            raise Http404("Unknown job.")
+        return JsonResponse(job.as_dict())
+{%- endif %}
+{%- if cookiecutter.use_deferred_content == "yes" %}
+
+    def is_partial_request(self):
+        """Return True when the shell is requesting the deferred plugin content."""
+        return self.partial_parameter in self.request.GET
+
+    def get_template_names(self):
+        """Render only the deferred content for partial requests{% if child_listing %} and the listing rows for "Load more" requests{% endif %}."""
+        {% if child_listing %}if self.is_listing_request():
+            return [self.listing_template_name]
+        {% endif %}if self.is_partial_request():
+            return [self.partial_template_name]
+        return super().get_template_names()
+{%- endif %}
+{%- if child_listing %}
+
+    def is_listing_request(self):
+        """Return True when the "Load more" button is requesting the next rows of the child listing."""
+        return self.listing_parameter in self.request.GET
+
+    def get_child_page(self):
+        """
+        Return the page of the child objects of base_object selected by ?cursor=.
+        
+        Pages start after the ordering key of the previous page's last row
+        instead of at an offset, so every page costs the same (see
+        pagination.py).
+        """
+        # Imported on first use so that registering the plugin stays cheap
+        from . import pagination
+
+        try:
+            return pagination.get_child_page(self.base_object, self.request.GET.get(self.cursor_parameter))
+        except pagination.InvalidCursor as e:
+            raise Http404(str(e)) from e
+{%- if cookiecutter.use_deferred_content != "yes" %}
+
+    def get_template_names(self):
+        """Render only the listing rows for "Load more" requests."""
+        if self.is_listing_request():
+            return [self.listing_template_name]
+        return super().get_template_names()
+{%- endif %}
+{%- endif %}
+{%- if cookiecutter.use_deferred_content == "yes" %}
 
     def get_context_data(self, **kwargs):
         """
@@ -46,10 +496,79 @@ class {{ cookiecutter.plugin_class_name }}(plugins.FairDMPlugin, TemplateView):
         
         The base_object is automatically available in the context.
         You can access it here via self.base_object.
+
+        The page shell is rendered first and must stay cheap. Expensive data
+        belongs in get_partial_context_data(), which only runs for the
+        deferred partial request.
         """
         context = super().get_context_data(**kwargs)
+        if self.is_partial_request():
+            context.update(self.get_partial_context_data())
+{%- if child_listing %}
+        elif self.is_listing_request():
+            context["child_page"] = self.get_child_page()
+{%- endif %}
+        return context
+
+    def get_partial_context_data(self):
+        """
+        Return the context for the deferred plugin content.
         
-        # Add any additional context data here
-        # context['my_data'] = self.get_my_data()
+        This runs when the shell requests {{ cookiecutter.plugin_slug }}_content.html, so
+        slow queries and computations here do not delay the page itself.{% if cookiecutter.use_render_cache == "yes" %}
+
+        The content is cached per object (see cache.py). Pass expensive
+        values as callables (e.g. self.get_my_data, not self.get_my_data())
+        so they are only evaluated when the cached panel is missing.{% endif %}
+        """
+        context = {}
+        {% if cookiecutter.use_render_cache == "yes" %}
+        context["panel_cache_key"] = cache.get_panel_key(self.base_object)
+        context["panel_cache_alias"] = cache.get_cache_alias()
+        context["panel_cache_timeout"] = cache.get_cache_timeout()
+        {% endif %}{% if summary_store %}
+        # Precomputed counts: one indexed lookup instead of aggregating (see summaries.py)
+        context["summary"] = self.get_summary()
+        {% endif %}{% if child_listing %}
+        # Child objects, paged by keyset (see pagination.py)
+        context["child_page"] = self.get_child_page()
+        {% endif %}
+        # Add any additional context data here. Decorate expensive helpers with
+        # @request_memoize (see memo.py) so the view, the template and
+        # permission checks share a single result per request.
+        # context['my_data'] = self.get_my_data{% if cookiecutter.use_render_cache != "yes" %}(){% endif %}
         
         return context
+{%- else %}
+
+    def get_context_data(self, **kwargs):
+        """
+        Add extra context data to the template.
+        
+        The base_object is automatically available in the context.
+        You can access it here via self.base_object.{% if cookiecutter.use_render_cache == "yes" %}
+
+        The plugin block is cached per object (see cache.py). Pass expensive
+        values as callables (e.g. self.get_my_data, not self.get_my_data())
+        so they are only evaluated when the cached panel is missing.{% endif %}
+        """
+        context = super().get_context_data(**kwargs)
+        {% if cookiecutter.use_render_cache == "yes" %}
+        context["panel_cache_key"] = cache.get_panel_key(self.base_object)
+        context["panel_cache_alias"] = cache.get_cache_alias()
+        context["panel_cache_timeout"] = cache.get_cache_timeout()
+        {% endif %}{% if summary_store %}
+        # Precomputed counts: one indexed lookup instead of aggregating (see summaries.py)
+        context["summary"] = self.get_summary()
+        {% endif %}{% if child_listing %}
+        # Child objects, paged by keyset (see pagination.py)
+        context["child_page"] = self.get_child_page()
+        {% endif %}
+        # Add any additional context data here. Decorate expensive helpers with
+        # @request_memoize (see memo.py) so the view, the template and
+        # permission checks share a single result per request.
+        # context['my_data'] = self.get_my_data{% if cookiecutter.use_render_cache != "yes" %}(){% endif %}
+        
+        return context
+
+{%- endif %}
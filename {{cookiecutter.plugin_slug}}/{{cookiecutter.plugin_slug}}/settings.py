@@ -6,10 +6,14 @@ fairdm.setup(addons=["{{ cookiecutter.plugin_slug }}"]).
 
 You can override these settings in your project's config/settings.py file.
 
+Every setting defined here must also be declared as a typed field of
+PluginSettings in conf.py. Plugin code reads the validated values from there
+instead of looking them up on django.conf.settings for each request.
+
 Example usage:
     # In your plugin code
-    from django.conf import settings
-    value = getattr(settings, '{{ cookiecutter.plugin_slug.upper() }}_SETTING_NAME', 'default')
+    from .conf import get_settings
+    value = get_settings().SETTING_NAME
 
 Common settings patterns:
     - Feature flags: {{ cookiecutter.plugin_slug.upper() }}_ENABLED = True
@@ -19,3 +23,46 @@ Common settings patterns:
 
 # Add your plugin-specific settings here
 # {{ cookiecutter.plugin_slug.upper() }}_SETTING_NAME = "default_value"
+
+# Maximum number of queries a single plugin render may run (see tests/test_queries.py)
+{{ cookiecutter.plugin_slug.upper() }}_QUERY_BUDGET = 10
+
+# Milliseconds importing the plugin may add to startup (see tests/test_import_time.py)
+{{ cookiecutter.plugin_slug.upper() }}_IMPORT_TIME_BUDGET = 100
+{%- if cookiecutter.use_render_cache == "yes" %}
+
+# Rendered-panel cache (see {{ cookiecutter.plugin_slug }}/cache.py)
+{{ cookiecutter.plugin_slug.upper() }}_RENDER_CACHE_ENABLED = True
+{{ cookiecutter.plugin_slug.upper() }}_CACHE_ALIAS = "default"
+{{ cookiecutter.plugin_slug.upper() }}_CACHE_TIMEOUT = 60 * 15
+{%- endif %}
+{%- if cookiecutter.use_conditional_get == "yes" %}
+
+# Conditional GET (see dispatch() in {{ cookiecutter.plugin_slug }}/plugins.py)
+{{ cookiecutter.plugin_slug.upper() }}_CONDITIONAL_GET_ENABLED = True
+{%- endif %}
+{%- if cookiecutter.use_background_tasks == "yes" %}
+
+# Background tasks (see {{ cookiecutter.plugin_slug }}/tasks.py)
+{{ cookiecutter.plugin_slug.upper() }}_TASK_BACKEND = "{{ cookiecutter.plugin_slug }}.tasks.ThreadPoolBackend"
+{{ cookiecutter.plugin_slug.upper() }}_TASK_WORKERS = 4
+# Jobs that may wait for or occupy a worker thread; more are refused with 503
+{{ cookiecutter.plugin_slug.upper() }}_TASK_QUEUE_SIZE = 100
+# Jobs kept in memory for polling; the oldest finished ones are forgotten first
+{{ cookiecutter.plugin_slug.upper() }}_TASK_MAX_JOBS = 1000
+{%- endif %}
+{%- if "yes" in (cookiecutter.use_child_listing, cookiecutter.use_json_api) and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+
+# Keyset pagination of child objects (see {{ cookiecutter.plugin_slug }}/pagination.py)
+{{ cookiecutter.plugin_slug.upper() }}_PAGE_SIZE = 25
+{%- endif %}
+{%- if cookiecutter.use_json_api == "yes" and "yes" in (cookiecutter.register_to_models__project, cookiecutter.register_to_models__dataset, cookiecutter.register_to_models__sample) %}
+
+# JSON API (see {{ cookiecutter.plugin_slug }}/api.py)
+{{ cookiecutter.plugin_slug.upper() }}_API_MAX_PAGE_SIZE = 500
+{%- endif %}
+{%- if cookiecutter.use_waffle == "yes" %}
+
+# Feature flag cache (see {{ cookiecutter.plugin_slug }}/flags.py); 0 reloads the flags on every request
+{{ cookiecutter.plugin_slug.upper() }}_FEATURE_FLAG_TTL = 30
+{%- endif %}
@@ -0,0 +1,222 @@
+"""
+Precomputed summary store for {{ cookiecutter.plugin_name }}.
+
+Counting the samples and measurements of a Project or Dataset on every render
+scans both tables. Instead, each summarised object has one ``Summary`` row
+(see models.py) that the signal receivers below adjust whenever a Sample or
+Measurement is created, moved or deleted{% if cookiecutter.register_to_models__project == "yes" %}, and recount whenever a Dataset
+moves to another Project or is deleted{% endif %}, so a render is a single lookup on
+the unique (content_type, object_id) index.
+
+Bulk operations (``bulk_create``, ``QuerySet.update``/``delete``, raw fixture
+loading) send no per-object signals. Run
+``manage.py rebuild_{{ cookiecutter.plugin_slug }}_summaries`` after them; a
+missing row is also recomputed on first read.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+{% if cookiecutter.register_to_models__project == "yes" or cookiecutter.register_to_models__dataset == "yes" %}from fairdm.core.dataset.models import Dataset
+{% endif %}from fairdm.core.measurement.models import Measurement
+{% if cookiecutter.register_to_models__project == "yes" %}from fairdm.core.project.models import Project
+{% endif %}from fairdm.core.sample.models import Sample
+
+from .models import Summary
+
+# Summarised models and how their samples are looked up
+SAMPLE_LOOKUPS = {
+{%- if cookiecutter.register_to_models__project == "yes" %}
+    Project: "dataset__project",
+{%- endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}
+    Dataset: "dataset",
+{%- endif %}
+}
+
+# Instance attribute holding the parents of an object between pre_* and post_* signals
+PARENTS_ATTR = "_{{ cookiecutter.plugin_slug }}_summary_parents"
+
+
+def get_summarised_model(instance):
+    """Return the summarised model ``instance`` belongs to, or None."""
+    for model in type(instance).__mro__:
+        if model in SAMPLE_LOOKUPS:
+            return model
+    return None
+
+
+def _rows(model, pk):
+    return Summary.objects.filter(content_type=ContentType.objects.get_for_model(model), object_id=str(pk))
+
+
+def live_counts(model, pk):
+    """Count the samples and measurements of one object from the live tables."""
+    lookup = SAMPLE_LOOKUPS[model]
+    return {
+        "sample_count": Sample.objects.filter(**{lookup: pk}).count(),
+        "measurement_count": Measurement.objects.filter(**{f"sample__{lookup}": pk}).count(),
+    }
+
+
+def refresh(model, pk):
+    """Recompute and store the summary of one object."""
+    summary, _ = Summary.objects.update_or_create(
+        content_type=ContentType.objects.get_for_model(model),
+        object_id=str(pk),
+        defaults=live_counts(model, pk),
+    )
+    return summary
+
+
+def get_summary(instance):
+    """Return the Summary of ``instance``, or None if its model is not summarised."""
+    model = get_summarised_model(instance)
+    if model is None:
+        return None
+    try:
+        return _rows(model, instance.pk).get()
+    except Summary.DoesNotExist:
+        return refresh(model, instance.pk)
+
+
+def get_parents(sample_id):
+    """Return ``{model: pk}`` of the summarised objects a sample belongs to."""
+    row = Sample.objects.filter(pk=sample_id).values_list(*SAMPLE_LOOKUPS.values()).first()
+    return dict(zip(SAMPLE_LOOKUPS, row, strict=True)) if row else {}
+
+
+def adjust(parents, samples=0, measurements=0):
+    """
+    Add to the counts of the summaries of ``parents`` without reading them.
+
+    Missing rows are left alone: they are computed in full on first read.
+    """
+    for model, pk in parents.items():
+        if pk is not None:
+            _rows(model, pk).update(
+                sample_count=F("sample_count") + samples,
+                measurement_count=F("measurement_count") + measurements,
+                updated=timezone.now(),
+            )
+
+
+def rebuild(batch_size=1000):
+    """Recompute every summary with one grouped query per table and model; return the row count."""
+    total = 0
+    with transaction.atomic():
+        for model, lookup in SAMPLE_LOOKUPS.items():
+            samples = dict(Sample.objects.order_by().values_list(lookup).annotate(total=Count("pk")))
+            measurements = dict(
+                Measurement.objects.order_by().values_list(f"sample__{lookup}").annotate(total=Count("pk"))
+            )
+            content_type = ContentType.objects.get_for_model(model)
+            Summary.objects.filter(content_type=content_type).delete()
+            rows = Summary.objects.bulk_create(
+                (
+                    Summary(
+                        content_type=content_type,
+                        object_id=str(pk),
+                        sample_count=samples.get(pk, 0),
+                        measurement_count=measurements.get(pk, 0),
+                    )
+                    for pk in model.objects.values_list("pk", flat=True).iterator(chunk_size=batch_size)
+                ),
+                batch_size=batch_size,
+            )
+            total += len(rows)
+    return total
+
+
+# Signal receivers, connected in apps.py
+
+
+def sample_pre_save(sender, instance, raw=False, **kwargs):
+    """Remember which objects an existing sample belonged to before it is saved."""
+    if not raw and instance.pk is not None:
+        setattr(instance, PARENTS_ATTR, get_parents(instance.pk))
+
+
+def sample_post_save(sender, instance, raw=False, **kwargs):
+    """Count a new sample, or recompute both sides when a sample moves."""
+    if raw:
+        return
+    old = instance.__dict__.pop(PARENTS_ATTR, {})
+    if not old:
+        adjust(get_parents(instance.pk), samples=1)
+        return
+    new = get_parents(instance.pk)
+    if old != new:
+        # The sample's measurements moved with it, so recount rather than adjust
+        for model, pk in {*old.items(), *new.items()}:
+            if pk is not None:
+                refresh(model, pk)
+
+
+def measurement_pre_save(sender, instance, raw=False, **kwargs):
+    """Remember the sample an existing measurement belonged to before it is saved."""
+    if not raw and instance.pk is not None:
+        old = Measurement.objects.filter(pk=instance.pk).values_list("sample_id", flat=True).first()
+        setattr(instance, PARENTS_ATTR, old)
+
+
+def measurement_post_save(sender, instance, raw=False, **kwargs):
+    """Count a new measurement, or move it between summaries when its sample changes."""
+    if raw:
+        return
+    old = instance.__dict__.pop(PARENTS_ATTR, None)
+    if old is None:
+        adjust(get_parents(instance.sample_id), measurements=1)
+    elif old != instance.sample_id:
+        adjust(get_parents(old), measurements=-1)
+        adjust(get_parents(instance.sample_id), measurements=1)
+
+
+{% if cookiecutter.register_to_models__project == "yes" %}def dataset_pre_save(sender, instance, raw=False, **kwargs):
+    """Remember the project an existing dataset belonged to before it is saved."""
+    if not raw and instance.pk is not None:
+        old = Dataset.objects.filter(pk=instance.pk).values_list("project_id", flat=True)
+        if old:
+            setattr(instance, PARENTS_ATTR, {Project: old[0]})
+
+
+def dataset_post_save(sender, instance, raw=False, **kwargs):
+    """Recompute both projects when a dataset moves, since its samples and measurements move with it."""
+    if raw:
+        return
+    old = instance.__dict__.pop(PARENTS_ATTR, {})
+    new = {Project: instance.project_id}
+    if old and old != new:
+        for model, pk in {*old.items(), *new.items()}:
+            if pk is not None:
+                refresh(model, pk)
+
+
+{% endif %}def pre_delete(sender, instance, **kwargs):
+    """Remember the parents of a sample{% if cookiecutter.register_to_models__project == "yes" %}, measurement or dataset{% else %} or measurement{% endif %} while it still exists."""
+    if isinstance(instance, Sample):
+        setattr(instance, PARENTS_ATTR, get_parents(instance.pk))
+    elif isinstance(instance, Measurement):
+        setattr(instance, PARENTS_ATTR, get_parents(instance.sample_id))
+{%- if cookiecutter.register_to_models__project == "yes" %}
+    elif isinstance(instance, Dataset):
+        setattr(instance, PARENTS_ATTR, {Project: instance.project_id})
+{%- endif %}
+
+
+def post_delete(sender, instance, **kwargs):
+    """Uncount a deleted sample or measurement, and drop the summary of a deleted object."""
+    if isinstance(instance, Sample):
+        adjust(instance.__dict__.pop(PARENTS_ATTR, {}), samples=-1)
+    elif isinstance(instance, Measurement):
+        adjust(instance.__dict__.pop(PARENTS_ATTR, {}), measurements=-1)
+    else:
+        model = get_summarised_model(instance)
+        if model is not None:
+            _rows(model, instance.pk).delete()
+{%- if cookiecutter.register_to_models__project == "yes" %}
+        # The samples of a deleted dataset are deleted with it, so recount its project
+        for model, pk in instance.__dict__.pop(PARENTS_ATTR, {}).items():
+            if pk is not None and model.objects.filter(pk=pk).exists():
+                refresh(model, pk)
+{%- endif %}
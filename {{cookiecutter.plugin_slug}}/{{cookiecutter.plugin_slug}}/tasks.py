@@ -0,0 +1,232 @@
+"""
+Background task execution for {{ cookiecutter.plugin_name }}.
+
+Long-running work triggered from the plugin is handed to a task backend
+instead of running inside the request. The view enqueues a task, returns the
+job id straight away and the page polls the job for progress.
+
+The backend is configured with ``{{ cookiecutter.plugin_slug.upper() }}_TASK_BACKEND``. The default,
+:class:`ThreadPoolBackend`, runs tasks in a thread pool inside the web process
+and keeps job state in memory, so progress is only visible to the process that
+started the job. Deployments with several worker processes should point the
+setting at a backend built on a shared queue (Celery, RQ, ...) that implements
+:class:`TaskBackend`.
+
+Both the work waiting for a thread (``{{ cookiecutter.plugin_slug.upper() }}_TASK_QUEUE_SIZE``) and the jobs
+kept for polling (``{{ cookiecutter.plugin_slug.upper() }}_TASK_MAX_JOBS``) are bounded, so a flood of requests
+cannot exhaust the memory of the web process: once either is full,
+:meth:`TaskBackend.enqueue` raises :class:`QueueFull`.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from django.apps import apps
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from .conf import get_settings
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """The backend cannot accept another job until some have finished."""
+
+
+@dataclass
+class Job:
+    """State of a single background task."""
+
+    id: str
+    status: str = PENDING
+    progress: float = 0.0
+    result: Any = None
+    error: str = ""
+    # Who may poll the job, e.g. (model label, pk, user pk); never exposed
+    owner: Any = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def report_progress(self, fraction):
+        """Record how much of the task is complete, from 0.0 to 1.0."""
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+
+    def as_dict(self):
+        """Return the job state in a JSON-serialisable form."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class TaskBackend:
+    """
+    Interface for task backends.
+
+    Tasks are called as ``func(report_progress, *args, **kwargs)``, where
+    ``report_progress`` accepts a fraction between 0.0 and 1.0. Arguments
+    should be plain values (primary keys, labels), not model instances.
+    """
+
+    def enqueue(self, func, *args, owner=None, **kwargs):
+        """
+        Schedule ``func`` and return the id of the new job.
+
+        ``owner`` is stored on the job so that callers can check who polls it.
+        Raise :class:`QueueFull` when no more jobs can be accepted.
+        """
+        raise NotImplementedError
+
+    def get_job(self, job_id):
+        """Return the :class:`Job` with ``job_id``, or None if it is unknown."""
+        raise NotImplementedError
+
+
+class InMemoryJobStore:
+    """
+    Thread-safe store of at most ``max_jobs`` recent jobs.
+
+    The oldest finished jobs are forgotten to make room for new ones. When
+    every stored job is still unfinished, creating another raises
+    :class:`QueueFull`.
+    """
+
+    def __init__(self, max_jobs=None):
+        if max_jobs is None:
+            max_jobs = get_settings().TASK_MAX_JOBS
+        self.max_jobs = max_jobs
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def create(self, owner=None):
+        job = Job(id=uuid.uuid4().hex, owner=owner)
+        with self.lock:
+            for job_id in [job_id for job_id, old in self.jobs.items() if old.finished]:
+                if len(self.jobs) < self.max_jobs:
+                    break
+                del self.jobs[job_id]
+            if len(self.jobs) >= self.max_jobs:
+                raise QueueFull("Too many unfinished jobs.")
+            self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+
+def run_job(job, func, args, kwargs):
+    """Run ``func`` and record its outcome on ``job``."""
+    job.status = RUNNING
+    try:
+        job.result = func(job.report_progress, *args, **kwargs)
+    except Exception as e:
+        job.status = FAILED
+        job.error = str(e)
+    else:
+        job.progress = 1.0
+        job.status = DONE
+
+
+class ImmediateBackend(TaskBackend):
+    """Run tasks synchronously when they are enqueued. Useful in tests and local development."""
+
+    def __init__(self, max_jobs=None):
+        self.store = InMemoryJobStore(max_jobs)
+
+    def enqueue(self, func, *args, owner=None, **kwargs):
+        job = self.store.create(owner)
+        run_job(job, func, args, kwargs)
+        return job.id
+
+    def get_job(self, job_id):
+        return self.store.get(job_id)
+
+
+class ThreadPoolBackend(TaskBackend):
+    """
+    Run tasks in a thread pool inside the current process.
+
+    ThreadPoolExecutor queues submitted work without limit, so at most
+    ``queue_size`` jobs may be waiting or running at once.
+    """
+
+    def __init__(self, max_workers=None, queue_size=None, max_jobs=None):
+        plugin_settings = get_settings()
+        if max_workers is None:
+            max_workers = plugin_settings.TASK_WORKERS
+        if queue_size is None:
+            queue_size = plugin_settings.TASK_QUEUE_SIZE
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="{{ cookiecutter.plugin_slug }}")
+        self.slots = threading.BoundedSemaphore(queue_size)
+        self.store = InMemoryJobStore(max_jobs)
+
+    def enqueue(self, func, *args, owner=None, **kwargs):
+        if not self.slots.acquire(blocking=False):
+            raise QueueFull("Too many jobs waiting to run.")
+        try:
+            job = self.store.create(owner)
+            self.executor.submit(self._run, job, func, args, kwargs)
+        except BaseException:
+            self.slots.release()
+            raise
+        return job.id
+
+    def get_job(self, job_id):
+        return self.store.get(job_id)
+
+    def _run(self, job, func, args, kwargs):
+        try:
+            run_job(job, func, args, kwargs)
+        finally:
+            # Worker threads open their own database connections
+            connections.close_all()
+            self.slots.release()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the configured task backend, creating it on first use."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = import_string(get_settings().TASK_BACKEND)()
+        return _backend
+
+
+def reset_backend():
+    """Forget the current backend so the next call to get_backend() builds a new one."""
+    global _backend
+    with _backend_lock:
+        _backend = None
+
+
+def recompute(report_progress, model_label, pk):
+    """
+    Example long-running task for a plugin object.
+
+    Replace the body with the plugin's own work, calling ``report_progress``
+    as it goes. The return value must be JSON-serialisable.
+    """
+    obj = apps.get_model(model_label)._default_manager.get(pk=pk)
+    steps = 10
+    for step in range(steps):
+        # Do one unit of work on obj here
+        report_progress((step + 1) / steps)
+    return {"object": str(obj)}
@@ -0,0 +1,38 @@
+"""Template tags that resolve {{ cookiecutter.plugin_name }} assets to their fingerprinted URLs."""
+
+import functools
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.templatetags.static import static
+
+from ..assets import MANIFEST_NAME, OUTPUT_DIR
+
+register = template.Library()
+
+
+@functools.cache
+def get_manifest_storage():
+    """Return a storage reading the bundle's manifest, or None if it has not been built."""
+    if not (OUTPUT_DIR / MANIFEST_NAME).exists():
+        return None
+    return ManifestStaticFilesStorage(location=OUTPUT_DIR)
+
+
+@register.simple_tag
+def plugin_asset(name):
+    """
+    Return the URL of the asset ``name``, e.g. ``{% raw %}{% plugin_asset "js/{% endraw %}{{ cookiecutter.plugin_slug }}{% raw %}.js" %}{% endraw %}``.
+
+    Outside DEBUG the hashed copy from the bundle is used, so it can be cached
+    forever. In DEBUG, before the first build and for files added since the
+    last build, the source file is used instead.
+    """
+    storage = get_manifest_storage()
+    if storage is not None and not settings.DEBUG:
+        try:
+            return static(f"{{ cookiecutter.plugin_slug }}/dist/{storage.stored_name(name)}")
+        except ValueError:
+            pass  # Not in the manifest yet; serve the source
+    return static(f"{{ cookiecutter.plugin_slug }}/{name}")
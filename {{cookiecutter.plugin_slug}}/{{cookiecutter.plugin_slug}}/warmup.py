@@ -0,0 +1,179 @@
+{%- set models = ["Project" if cookiecutter.register_to_models__project == "yes" else "", "Dataset" if cookiecutter.register_to_models__dataset == "yes" else "", "Sample" if cookiecutter.register_to_models__sample == "yes" else "", "Measurement" if cookiecutter.register_to_models__measurement == "yes" else ""] | select | list -%}
+"""
+Deploy-time warmup for {{ cookiecutter.plugin_name }}.
+
+The first request a process serves for the plugin compiles its modules and
+templates, including every template they extend, and may find the per-object
+caches empty. :func:`warm_up` does that work ahead of time, so the first
+requests after a deploy are served as fast as later ones:
+
+1. byte-compile the plugin's modules with the interpreter that serves them,
+   into hash-based ``.pyc`` files that stay valid when the install is copied;
+2. compile the plugin's templates and the templates they extend through the
+   template loaders, which keep them when the cached loader is in use;
+3. resolve the plugin view of every registered model through the FairDM
+   registry, failing if the plugin is missing from one of them;
+4. optionally render the plugin for the most recently modified objects of
+   each registered model, which fills their per-object caches.
+
+Compiled templates are kept per process, so steps 2 and 3 only help the
+process that runs them. Call :func:`warm_up` from each web worker as it
+starts, e.g. in gunicorn's ``post_worker_init`` hook. Step 4 fills the shared
+cache backend and database, so it is best run once per deploy with
+``manage.py warmup_{{ cookiecutter.plugin_slug }} --prime N``.
+"""
+
+import py_compile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.template import loader
+from django.template.loader_tags import ExtendsNode
+from django.test import RequestFactory
+from fairdm import plugins
+{% if cookiecutter.register_to_models__project == "yes" %}from fairdm.core.project.models import Project
+{% endif %}{% if cookiecutter.register_to_models__dataset == "yes" %}from fairdm.core.dataset.models import Dataset
+{% endif %}{% if cookiecutter.register_to_models__sample == "yes" %}from fairdm.core.sample.models import Sample
+{% endif %}{% if cookiecutter.register_to_models__measurement == "yes" %}from fairdm.core.measurement.models import Measurement
+{% endif %}
+from .plugins import {{ cookiecutter.plugin_class_name }}
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+TEMPLATE_DIR = PACKAGE_DIR / "templates"
+REGISTERED_MODELS = [{{ models | join(", ") }}]
+# Objects are primed newest first by this field, or by primary key if the model has no such field
+RECENT_FIELD = "modified"
+
+
+@dataclass(frozen=True)
+class Step:
+    """Outcome and duration of one warmup step."""
+
+    name: str
+    count: int
+    seconds: float
+
+    def __str__(self):
+        return f"{self.name}: {self.count} in {self.seconds * 1000:.1f} ms"
+
+
+def compile_modules():
+    """
+    Byte-compile the plugin's modules and return the ones written.
+
+    Modules that cannot be written, e.g. in a read-only install, are skipped;
+    Python then compiles them in memory when they are first imported.
+    """
+    compiled = []
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        try:
+            py_compile.compile(path, doraise=True, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+        except OSError:
+            continue
+        compiled.append(path)
+    return compiled
+
+
+def get_template_names():
+    """Return the names of the plugin's own templates."""
+    return sorted(path.relative_to(TEMPLATE_DIR).as_posix() for path in TEMPLATE_DIR.rglob("*.html"))
+
+
+def get_parent_name(template):
+    """Return the name ``template`` extends, or None if it extends nothing or a variable."""
+    # Only templates of the Django engine expose their nodes
+    nodelist = getattr(getattr(template, "template", None), "nodelist", [])
+    for node in nodelist:
+        if isinstance(node, ExtendsNode) and not node.parent_name.filters and isinstance(node.parent_name.var, str):
+            return str(node.parent_name.var)
+    return None
+
+
+def compile_templates():
+    """
+    Compile the plugin's templates and every template they extend.
+
+    ``{% raw %}{% extends %}{% endraw %}`` only loads the parent template while rendering, so the
+    chain of parents (e.g. ``fairdm/plugin.html``) is followed here. Returns
+    the names of the compiled templates.
+    """
+    compiled = []
+    pending = get_template_names()
+    while pending:
+        name = pending.pop(0)
+        if name in compiled:
+            continue
+        compiled.append(name)
+        parent = get_parent_name(loader.get_template(name))
+        if parent is not None:
+            pending.append(parent)
+    return compiled
+
+
+def resolve_views():
+    """Return ``{model: plugin view}`` for every registered model."""
+    views = {}
+    for model in REGISTERED_MODELS:
+        view_class = plugins.registry.get_view_for_model(model)
+        if {{ cookiecutter.plugin_class_name }} not in view_class.plugins:
+            raise ImproperlyConfigured(f"{{ cookiecutter.plugin_class_name }} is not registered to {model.__name__}.")
+        views[model] = view_class
+    return views
+
+
+def get_recent_objects(model, count):
+    """Return the ``count`` most recently modified objects of ``model``."""
+    try:
+        model._meta.get_field(RECENT_FIELD)
+        ordering = f"-{RECENT_FIELD}"
+    except FieldDoesNotExist:
+        ordering = "-pk"
+    return list(model._default_manager.order_by(ordering)[:count])
+
+
+def render(base_object):
+    """Render the plugin for ``base_object`` as an anonymous user, filling its per-object caches."""
+    view = {{ cookiecutter.plugin_class_name }}()
+{%- if cookiecutter.use_deferred_content == "yes" %}
+    # The cached content is rendered by the partial, not by the page shell
+    request = RequestFactory().get("/", {view.partial_parameter: "1"})
+{%- else %}
+    request = RequestFactory().get("/")
+{%- endif %}
+    request.user = AnonymousUser()
+    view.setup(request)
+    view.base_object = base_object
+    view.base_object = view.get_base_object()
+    view.render_to_response(view.get_context_data()).render()
+
+
+def prime(count):
+    """Render the plugin for the ``count`` most recent objects of each registered model; return them."""
+    primed = []
+    for model in REGISTERED_MODELS:
+        for base_object in get_recent_objects(model, count):
+            render(base_object)
+            primed.append(base_object)
+    return primed
+
+
+def timed(name, func, *args):
+    """Run ``func`` and return a :class:`Step` counting the items it returned."""
+    start = time.perf_counter()
+    result = func(*args)
+    return Step(name, len(result), time.perf_counter() - start)
+
+
+def warm_up(count=0):
+    """Run every warmup step, priming ``count`` objects per model, and return their :class:`Step` timings."""
+    steps = [
+        timed("Compiled modules", compile_modules),
+        timed("Compiled templates", compile_templates),
+        timed("Resolved plugin views", resolve_views),
+    ]
+    if count:
+        steps.append(timed("Primed objects", prime, count))
+    return steps